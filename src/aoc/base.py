@@ -1,13 +1,29 @@
 import abc
+import hashlib
+import importlib
 import inspect
+import sys
+import typing
+from collections.abc import Iterator
 from pathlib import Path
+from types import ModuleType
 from typing import Any, ClassVar
 
 from typing_extensions import Protocol
 
+from aoc import memo
+from aoc.cache import (
+    DiskCache,
+    ResultCache,
+    get_cache_directory,
+    get_module_fingerprint,
+)
 from aoc.input_providers import InputProvider
+from aoc.logger import logger
+from aoc.timing import Timings
 
 REPO_ROOT = Path(__file__).parent.parent.parent
+SOLUTIONS_PACKAGE = "aoc_solutions"
 
 
 def get_day_from_module(module_name: str) -> int:
@@ -15,6 +31,17 @@ def get_day_from_module(module_name: str) -> int:
     return int(module_name.split(".")[-1].split("_")[1])
 
 
+def get_challenge_module_name(year: int, day: int) -> str:
+    return f"{SOLUTIONS_PACKAGE}.{year}.day_{day:02}"
+
+
+def import_challenge(year: int, day: int) -> ModuleType:
+    """Import the module with a challenge. Solutions from the working directory win."""
+    if "." not in sys.path:
+        sys.path.insert(0, ".")
+    return importlib.import_module(get_challenge_module_name(year, day))
+
+
 class ChallengeProtocol(Protocol):
     def part_1(self, input_lines: list[str]) -> Any: ...
 
@@ -26,13 +53,26 @@ class BaseChallenge(ChallengeProtocol, abc.ABC):
 
     year: ClassVar[int]
     day: ClassVar[int]
+    # When True, parts receive an iterator of lines read lazily from the input
+    streaming: ClassVar[bool] = False
+    # When True, results of parse() are persisted between runs in an on-disk cache
+    cache_parsed_input: ClassVar[bool] = False
+    # When True, parse() or parts receive the whole input text instead of lines
+    text_input: ClassVar[bool] = False
 
     def __init__(
         self,
         input_provider: InputProvider,
+        result_cache: ResultCache | None = None,
     ):
         self._input_provider = input_provider
+        # solutions of parts are reused from it, None disables caching
+        self.result_cache = result_cache
         self._input_lines: dict[int | None, list[str]] = {}
+        self._input_texts: dict[int | None, str] = {}
+        self._input_hashes: dict[int | None, str] = {}
+        self._parsed_inputs: dict[str, Any] = {}
+        self.timings = Timings()
 
     def __init_subclass__(cls, **kwargs):
         cls.year = cls._get_year()
@@ -61,13 +101,119 @@ class BaseChallenge(ChallengeProtocol, abc.ABC):
     def get_input_lines(self, part: int | None = None) -> list[str]:
         """Return the input lines for this challenge. Relative to this file"""
         if not self._input_lines.get(part):
-            self._input_lines[part] = (
-                self._input_provider.provide_input(part).strip().split("\n")
-            )
+            with self.timings.span("input"):
+                # with use_mmap the provider returns a read-only sequence of lines
+                self._input_lines[part] = typing.cast(
+                    list[str], self._input_provider.provide_lines(part)
+                )
         return self._input_lines[part]
 
     def set_input_lines(self, lines: list[str], part: int | None = None):
         self._input_lines[part] = lines
+        self._input_hashes.pop(part, None)
+
+    def get_input_text(self, part: int | None = None) -> str:
+        """Return the whole input text without trailing newlines."""
+        if part not in self._input_texts:
+            with self.timings.span("input"):
+                self._input_texts[part] = self._input_provider.provide_input(
+                    part
+                ).rstrip("\n")
+        return self._input_texts[part]
+
+    def set_input_text(self, text: str, part: int | None = None):
+        self._input_texts[part] = text
+        self._input_hashes.pop(part, None)
+
+    def get_input_hash(self, part: int | None = None) -> str:
+        """Return a hash of content of the input for the given part."""
+        if part not in self._input_hashes:
+            content_hash = hashlib.blake2b(digest_size=16)
+            if self.text_input:
+                content_hash.update(self.get_input_text(part).encode())
+            else:
+                for line in self.get_input_lines(part):
+                    content_hash.update(line.encode())
+                    content_hash.update(b"\n")
+            self._input_hashes[part] = content_hash.hexdigest()
+        return self._input_hashes[part]
+
+    def _get_unparsed_input(self, part: int | None) -> Any:
+        if self.text_input:
+            return self.get_input_text(part)
+        return self.get_input_lines(part)
+
+    def parse(self, input_lines: list[str]) -> Any:
+        """
+        Return the input converted to a structure shared by both parts.
+
+        It's called once per distinct input and its result is passed to the parts
+        instead of input lines, so parts must not modify it.
+        """
+        return input_lines
+
+    @classmethod
+    def defines_parse(cls) -> bool:
+        """Return True if the challenge overrides parse()."""
+        return cls.parse is not BaseChallenge.parse
+
+    def get_parsed_input(self, part: int | None = None) -> Any:
+        """Return the parsed input for the given part, parsing it at most once."""
+        if not self.defines_parse():
+            return self._get_unparsed_input(part)
+        input_hash = self.get_input_hash(part)
+        if input_hash not in self._parsed_inputs:
+            with self.timings.span("parse"):
+                self._parsed_inputs[input_hash] = self._parse_with_disk_cache(part)
+        return self._parsed_inputs[input_hash]
+
+    def _get_parse_cache_key(self, part: int | None) -> str | None:
+        # parse() may call any code of its module or of local modules it imports
+        if not (module_fingerprint := get_module_fingerprint(type(self).__module__)):
+            return None
+        key = hashlib.blake2b(digest_size=16)
+        key.update(type(self).__qualname__.encode())
+        key.update(module_fingerprint.encode())
+        key.update(self.get_input_hash(part).encode())
+        return key.hexdigest()
+
+    def _parse_with_disk_cache(self, part: int | None) -> Any:
+        if not self.cache_parsed_input or not (key := self._get_parse_cache_key(part)):
+            return self.parse(self._get_unparsed_input(part))
+        cache = DiskCache(get_cache_directory() / "parse")
+        missing = object()
+        if (parsed := cache.get(key, missing)) is missing:
+            parsed = self.parse(self._get_unparsed_input(part))
+            cache.set(key, parsed)
+        else:
+            logger.info("Using parsed input from cache for part %s", part)
+        return parsed
+
+    def get_input_stream(self, part: int | None = None) -> Iterator[str]:
+        """Return a fresh iterator of the input lines. Lines aren't cached."""
+        if self._input_lines.get(part):
+            return iter(self._input_lines[part])
+        return iter(self._input_provider.stream_lines(part))
+
+    def get_part_input(self, part: int) -> Any:
+        """Return the input that is passed to the given part of this challenge."""
+        if self.streaming:
+            with self.timings.span("input"):
+                input_stream = self.get_input_stream(part)
+            if not self.defines_parse():
+                return input_stream
+            with self.timings.span("parse"):
+                return self.parse(typing.cast(list[str], input_stream))
+        return self.get_parsed_input(part)
+
+    @classmethod
+    def defines_generate_input(cls) -> bool:
+        """
+        Return True if the challenge defines the optional generate_input(size, rng)
+        class method returning a synthetic input of the given size, e.g. number of
+        lines, used by `aoc scale` instead of the repeated real input.
+        """
+        return callable(getattr(cls, "generate_input", None))
 
     @abc.abstractmethod
     def part_1(self, input_lines: list[str]) -> Any:
@@ -79,15 +225,41 @@ class BaseChallenge(ChallengeProtocol, abc.ABC):
         """Return the solution for part 2 of this challenge."""
         ...
 
+    def _solve_part(self, part: int) -> Any:
+        func = self.part_1 if part == 1 else self.part_2
+        part_input = self.get_part_input(part)
+        try:
+            with self.timings.span(f"part_{part}"):
+                return func(part_input)
+        finally:
+            memo.clear_part_caches()
+
+    def solve_part(self, part: int) -> Any:
+        """Return the solution of the given part, taking it from the result cache."""
+        if self.result_cache is None:
+            return self._solve_part(part)
+        with self.timings.span("input"):
+            # the input read to compute its fingerprint is cached by the provider
+            input_fingerprint = self._input_provider.get_input_fingerprint(part)
+        key = self.result_cache.get_key(
+            type(self).__module__, type(self).__qualname__, input_fingerprint, part
+        )
+        if key is None:
+            return self._solve_part(part)
+        missing = object()
+        if (solution := self.result_cache.get(key, missing)) is missing:
+            solution = self._solve_part(part)
+            self.result_cache.set(key, solution)
+        return solution
+
     def solve(self) -> tuple[Any, Any]:
         """Return solutions for this challenge as a 2 element tuple."""
-        return self.part_1(self.get_input_lines(part=1)), self.part_2(
-            self.get_input_lines(part=2)
-        )
+        return self.solve_part(1), self.solve_part(2)
 
     def run(self):
-        solution1 = self.part_1(self.get_input_lines(part=1))
+        solution1 = self.solve_part(1)
         print(f"Day {self.day} - Part 1: {solution1}")
-        solution2 = self.part_2(self.get_input_lines(part=2))
+        solution2 = self.solve_part(2)
         print(f"Day {self.day} - Part 2: {solution2}\n")
+        self.timings.log(year=self.year, day=self.day)
         return solution1, solution2
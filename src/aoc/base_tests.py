@@ -1,10 +1,30 @@
-from typing import Any
+import os
+import time
+import tracemalloc
+from typing import Any, ClassVar
 
 import pytest
 
+from aoc import sandbox
 from aoc.base import BaseChallenge
+from aoc.bench import get_input_factory
+from aoc.cache import get_result_cache
+from aoc.formatting import format_duration, format_size, parse_size
 from aoc.input_providers import SmartFileInputProvider
 
+# budgets of parts, each is (part 1, part 2) and None means no budget
+_BUDGETS = (
+    "max_runtime_on_test_data",
+    "max_runtime_on_real_data",
+    "max_peak_memory_on_test_data",
+    "max_peak_memory_on_real_data",
+)
+
+
+def get_perf_tolerance() -> float:
+    """Return the factor multiplying all budgets, set with AOC_PERF_TOLERANCE."""
+    return float(os.environ.get("AOC_PERF_TOLERANCE", 1))
+
 
 class Empty:
     """A class to represent a value that is not set."""
@@ -14,9 +34,27 @@ class BaseTestChallenge:
     challenge_class: type[BaseChallenge]
     expected_results_from_test_data: tuple[Any, Any] = (Empty, Empty)
     expected_results_from_real_data: tuple[Any, Any] = (Empty, Empty)
+    # Seconds each part may run, excluding loading and parsing of the input
+    max_runtime_on_test_data: tuple[float | None, float | None] = (None, None)
+    max_runtime_on_real_data: tuple[float | None, float | None] = (None, None)
+    # Memory each part may allocate at peak, in bytes or e.g. "512M"
+    max_peak_memory_on_test_data: tuple[int | str | None, int | str | None] = (
+        None,
+        None,
+    )
+    max_peak_memory_on_real_data: tuple[int | str | None, int | str | None] = (
+        None,
+        None,
+    )
+    # Opt-in: when True, tests of a data set share one challenge, reading and
+    # parsing the input once. Don't enable it for challenges keeping state
+    # between parts. Shared challenges are released after the tests of the class.
+    share_challenges: ClassVar[bool] = False
+    _challenges: ClassVar[dict[bool, BaseChallenge]]
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
+        cls._challenges = {}
         if not hasattr(cls, "challenge_class"):
             raise ValueError(
                 f"You must define a challenge_class attribute on class {cls.__name__}."
@@ -36,40 +74,139 @@ class BaseTestChallenge:
             raise ValueError(
                 "expected_results_from_real_data must be a tuple of 2 elements."
             )
+        for name in _BUDGETS:
+            if not isinstance(budget := getattr(cls, name), tuple) or len(budget) != 2:
+                raise ValueError(f"{name} must be a tuple of 2 elements.")
 
-    def test_on_sample_data_part_1(self):
-        if (expected_result := self.expected_results_from_test_data[0]) == Empty:
-            pytest.skip("No expected result for part one of test data set.")
+    @classmethod
+    def teardown_class(cls):
+        cls._challenges.clear()
 
+    def get_challenge(self, use_test_data: bool) -> BaseChallenge:
+        """Return the challenge for the data set, shared if share_challenges is set."""
+        if self.share_challenges and use_test_data in self._challenges:
+            return self._challenges[use_test_data]
         challenge = self.challenge_class(
             SmartFileInputProvider(
-                self.challenge_class.year, self.challenge_class.day, use_test_data=True
+                self.challenge_class.year,
+                self.challenge_class.day,
+                use_test_data=use_test_data,
+            ),
+            result_cache=get_result_cache(),
+        )
+        if self.share_challenges:
+            self._challenges[use_test_data] = challenge
+        return challenge
+
+    def get_budgets(
+        self, part: int, use_test_data: bool
+    ) -> tuple[float | None, int | None]:
+        """Return the runtime and peak memory budgets of the part, with tolerance."""
+        data_set = "test" if use_test_data else "real"
+        max_runtime = getattr(self, f"max_runtime_on_{data_set}_data")[part - 1]
+        max_peak_memory = getattr(self, f"max_peak_memory_on_{data_set}_data")[part - 1]
+        tolerance = get_perf_tolerance()
+        if max_runtime is not None:
+            max_runtime *= tolerance
+        if isinstance(max_peak_memory, str):
+            max_peak_memory = parse_size(max_peak_memory)
+        if max_peak_memory is not None:
+            max_peak_memory = int(max_peak_memory * tolerance)
+        return max_runtime, max_peak_memory
+
+    def check_budgets(
+        self, part: int, use_test_data: bool, seconds: float, peak_memory: int | None
+    ):
+        max_runtime, max_peak_memory = self.get_budgets(part, use_test_data)
+        data_set = "test" if use_test_data else "real"
+        tolerance = get_perf_tolerance()
+        suffix = f" (with tolerance {tolerance:g})" if tolerance != 1 else ""
+        if max_runtime is not None and seconds > max_runtime:
+            pytest.fail(
+                f"Part {part} on {data_set} data took {format_duration(seconds)}, "
+                f"budget {format_duration(max_runtime)}{suffix}",
+                pytrace=False,
             )
+        if (
+            max_peak_memory is not None
+            and peak_memory is not None
+            and peak_memory > max_peak_memory
+        ):
+            pytest.fail(
+                f"Part {part} on {data_set} data used {format_size(peak_memory)} "
+                f"at peak, budget {format_size(max_peak_memory)}{suffix}",
+                pytrace=False,
+            )
+
+    def measure_part(
+        self, challenge: BaseChallenge, part: int, measure_memory: bool
+    ) -> tuple[Any, float, int | None]:
+        """
+        Return the solution of the part, its runtime and, if requested, memory
+        allocated at peak. Memory is traced in a second run, as tracing slows
+        the part down.
+        """
+        func = challenge.part_1 if part == 1 else challenge.part_2
+        make_input = get_input_factory(challenge, part)
+        part_input = make_input()
+        start = time.perf_counter()
+        solution = func(part_input)
+        seconds = time.perf_counter() - start
+        if not measure_memory:
+            return solution, seconds, None
+        part_input = make_input()
+        tracemalloc.start()
+        try:
+            func(part_input)
+            return solution, seconds, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def solve_part(self, part: int, use_test_data: bool) -> Any:
+        challenge = self.get_challenge(use_test_data)
+        max_runtime, max_peak_memory = self.get_budgets(part, use_test_data)
+        if not sandbox.is_enabled():
+            if max_runtime is None and max_peak_memory is None:
+                return challenge.solve_part(part)
+            # budgets are checked on every run, so the result cache isn't used
+            solution, seconds, peak_memory = self.measure_part(
+                challenge, part, max_peak_memory is not None
+            )
+            self.check_budgets(part, use_test_data, seconds, peak_memory)
+            return solution
+        outcome = sandbox.run_part_isolated(
+            challenge,
+            part,
+            sandbox.get_memory_limit(),
+            sandbox.get_timeout(),
+            sandbox.get_cpu_limit(),
+            trace_memory=max_peak_memory is not None or sandbox.is_memory_traced(),
         )
-        assert challenge.part_1(challenge.get_input_lines(part=1)) == expected_result
+        print(f"Part {part}: {outcome.format_usage()}")
+        if not outcome.ok:
+            message = outcome.error or outcome.status
+            if outcome.stack:
+                message += f"\nStack when stopped:\n{outcome.stack}"
+            pytest.fail(message, pytrace=False)
+        self.check_budgets(part, use_test_data, outcome.part_time, outcome.peak_traced)
+        return outcome.solution
+
+    def test_on_sample_data_part_1(self):
+        if (expected_result := self.expected_results_from_test_data[0]) == Empty:
+            pytest.skip("No expected result for part one of test data set.")
+        assert self.solve_part(1, use_test_data=True) == expected_result
 
     def test_on_sample_data_part_2(self):
         if (expected_result := self.expected_results_from_test_data[1]) == Empty:
             pytest.skip("No expected results for part two of test data set.")
-        challenge = self.challenge_class(
-            SmartFileInputProvider(
-                self.challenge_class.year, self.challenge_class.day, use_test_data=True
-            )
-        )
-        assert challenge.part_2(challenge.get_input_lines(part=2)) == expected_result
+        assert self.solve_part(2, use_test_data=True) == expected_result
 
     def test_on_real_data_part_1(self):
         if (expected_result := self.expected_results_from_real_data[0]) == Empty:
             pytest.skip("No expected result for part one of real data set.")
-        challenge = self.challenge_class(
-            SmartFileInputProvider(self.challenge_class.year, self.challenge_class.day)
-        )
-        assert challenge.part_1(challenge.get_input_lines(part=1)) == expected_result
+        assert self.solve_part(1, use_test_data=False) == expected_result
 
     def test_on_real_data_part_2(self):
         if (expected_result := self.expected_results_from_real_data[1]) == Empty:
             pytest.skip("No expected results for part two of real data set.")
-        challenge = self.challenge_class(
-            SmartFileInputProvider(self.challenge_class.year, self.challenge_class.day)
-        )
-        assert challenge.part_2(challenge.get_input_lines(part=2)) == expected_result
+        assert self.solve_part(2, use_test_data=False) == expected_result
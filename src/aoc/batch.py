@@ -0,0 +1,270 @@
+import contextlib
+import importlib
+import io
+import json
+import sys
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aoc import sandbox
+from aoc.base import (
+    SOLUTIONS_PACKAGE,
+    BaseChallenge,
+    get_day_from_module,
+    import_challenge,
+)
+from aoc.cache import get_result_cache
+from aoc.input_providers import SmartFileInputProvider
+
+
+@dataclass(frozen=True, order=True)
+class ChallengeLocation:
+    year: int
+    day: int
+    path: Path
+
+
+@dataclass
+class TestOutcome:
+    nodeid: str
+    outcome: str
+    duration: float = 0.0
+    message: str = ""
+
+
+@dataclass
+class ChallengeVerification:
+    """Outcome of running tests of a single challenge in a separate process."""
+
+    year: int
+    day: int
+    exit_code: int
+    outcomes: list[TestOutcome] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    def count(self, outcome: str) -> int:
+        return sum(1 for test in self.outcomes if test.outcome == outcome)
+
+
+class _OutcomeCollector:
+    """Pytest plugin gathering picklable outcomes of tests and collection errors."""
+
+    def __init__(self):
+        self.outcomes: list[TestOutcome] = []
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.outcomes.append(
+                TestOutcome(report.nodeid, "error", message=report.longreprtext)
+            )
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call":
+            outcome = report.outcome
+        elif report.failed:
+            outcome = "error"
+        elif report.skipped:
+            outcome = "skipped"
+        else:
+            return
+        self.outcomes.append(
+            TestOutcome(
+                report.nodeid,
+                outcome,
+                report.duration,
+                "" if report.passed else report.longreprtext,
+            )
+        )
+
+
+@dataclass
+class ChallengeRun:
+    """Outcome of running both parts of a single challenge in a worker process."""
+
+    year: int
+    day: int
+    answers: tuple[Any, Any] | None = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    cached_parts: int = 0
+    status: str = sandbox.OK
+    error: str | None = None
+    stack: str | None = None
+
+
+def discover_challenges(year: int | None = None) -> list[ChallengeLocation]:
+    """
+    Return locations of all solved days. If year is None, days from all years
+    are returned.
+    """
+    if "." not in sys.path:
+        sys.path.insert(0, ".")
+    try:
+        package = importlib.import_module(SOLUTIONS_PACKAGE)
+    except ModuleNotFoundError:
+        return []
+    locations: dict[tuple[int, int], ChallengeLocation] = {}
+    for root in package.__path__:
+        for year_directory in Path(root).iterdir():
+            if not year_directory.name.isdigit() or not year_directory.is_dir():
+                continue
+            if year is not None and int(year_directory.name) != year:
+                continue
+            for day_directory in year_directory.glob("day_*"):
+                if not day_directory.joinpath("__init__.py").exists():
+                    continue
+                location = ChallengeLocation(
+                    int(year_directory.name),
+                    get_day_from_module(day_directory.name),
+                    day_directory,
+                )
+                locations.setdefault((location.year, location.day), location)
+    return sorted(locations.values())
+
+
+def _solve_isolated(
+    challenge: BaseChallenge,
+    result: ChallengeRun,
+    timeout: float | None,
+    cpu_limit: float | None,
+):
+    """Solve parts in child processes, stopping at the first one which fails."""
+    answers = []
+    for part in (1, 2):
+        outcome = sandbox.run_part_isolated(
+            challenge,
+            part,
+            timeout=timeout,
+            cpu_limit=cpu_limit,
+            use_cache=challenge.result_cache is not None,
+        )
+        if not outcome.ok:
+            result.status, result.error = outcome.status, outcome.error
+            result.stack = outcome.stack
+            return
+        result.cached_parts += outcome.cached
+        answers.append(outcome.solution)
+    result.answers = (answers[0], answers[1])
+
+
+def run_day(
+    year: int,
+    day: int,
+    data_dir: Path | None,
+    test_data: bool,
+    use_cache: bool = True,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+) -> ChallengeRun:
+    """
+    Run both parts of a challenge. Output printed by the solution is discarded.
+    With timeout or cpu_limit each part runs in a child process, which is
+    stopped when it exceeds the limit.
+    """
+    result = ChallengeRun(year, day)
+    isolated = timeout is not None or cpu_limit is not None
+    result_cache = get_result_cache() if use_cache else None
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module = import_challenge(year, day)
+            challenge = module.Challenge(
+                SmartFileInputProvider(
+                    year=year, day=day, data_dir=data_dir, use_test_data=test_data
+                ),
+                result_cache=result_cache,
+            )
+            if isolated:
+                _solve_isolated(challenge, result, timeout, cpu_limit)
+            else:
+                result.answers = challenge.solve()
+    except Exception as e:
+        result.status = sandbox.ERROR
+        result.error = f"{type(e).__name__}: {e}"
+    result.wall_time = time.perf_counter() - wall_start
+    result.cpu_time = time.process_time() - cpu_start
+    if result_cache is not None and not isolated:
+        result.cached_parts = result_cache.hits
+    return result
+
+
+def run_challenges(
+    locations: Iterable[ChallengeLocation],
+    data_dir: Path | None,
+    test_data: bool,
+    jobs: int | None = None,
+    use_cache: bool = True,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+) -> list[ChallengeRun]:
+    """Run challenges in a pool of processes. Results are sorted by year and day."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                run_day,
+                location.year,
+                location.day,
+                data_dir,
+                test_data,
+                use_cache,
+                timeout,
+                cpu_limit,
+            )
+            for location in locations
+        ]
+        results = [future.result() for future in futures]
+    return sorted(results, key=lambda result: (result.year, result.day))
+
+
+def verify_day(
+    location: ChallengeLocation, pytest_args: list[str]
+) -> ChallengeVerification:
+    """Run tests of a single challenge. Pytest output is discarded."""
+    import pytest
+
+    collector = _OutcomeCollector()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        exit_code = pytest.main(
+            [str(location.path), "-p", "no:cacheprovider", *pytest_args],
+            plugins=[collector],
+        )
+    return ChallengeVerification(
+        location.year,
+        location.day,
+        int(exit_code),
+        collector.outcomes,
+        time.perf_counter() - start,
+    )
+
+
+def verify_challenges(
+    locations: Iterable[ChallengeLocation],
+    pytest_args: list[str],
+    jobs: int | None = None,
+) -> list[ChallengeVerification]:
+    """
+    Run tests of each challenge in a fresh process from a pool of jobs processes,
+    so that days don't share imported modules nor any global state.
+    """
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as executor:
+        futures = [
+            executor.submit(verify_day, location, pytest_args) for location in locations
+        ]
+        results = [future.result() for future in futures]
+    return sorted(results, key=lambda result: (result.year, result.day))
+
+
+def write_report(
+    path: Path, results: Iterable[ChallengeRun], wall_time: float, jobs: int
+):
+    report = {
+        "jobs": jobs,
+        "wall_time": wall_time,
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(report, indent=2, default=str))
@@ -0,0 +1,181 @@
+import functools
+import json
+import statistics
+import subprocess
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from aoc import memo
+from aoc.base import BaseChallenge
+
+DEFAULT_HISTORY_FILE = Path(".aoc/bench_history.jsonl")
+UNKNOWN_COMMIT = "unknown"
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary of repeated runs of a single part of a challenge."""
+
+    year: int
+    day: int
+    part: int
+    commit: str
+    runs: int
+    minimum: float
+    median: float
+    p95: float
+    stddev: float
+    timestamp: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    @classmethod
+    def from_timings(
+        cls, year: int, day: int, part: int, commit: str, timings: Sequence[float]
+    ) -> "BenchmarkResult":
+        return cls(
+            year=year,
+            day=day,
+            part=part,
+            commit=commit,
+            runs=len(timings),
+            minimum=min(timings),
+            median=statistics.median(timings),
+            p95=percentile(timings, 95),
+            stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        )
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the q-th percentile of values using linear interpolation."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(
+    func: Callable[[Any], Any], make_input: Callable[[], Any], runs: int, warmup: int
+) -> list[float]:
+    """
+    Call func with an input returned by make_input warmup + runs times and
+    return timings of the last runs calls in seconds.
+    """
+    timings = []
+    for i in range(warmup + runs):
+        part_input = make_input()
+        start = time.perf_counter()
+        func(part_input)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def get_input_factory(challenge: BaseChallenge, part: int) -> Callable[[], Any]:
+    """
+    Return a function returning a fresh input of the part. Input is loaded and
+    parsed right away, unless the challenge is streaming its input. Memoized
+    results are cleared on each call, so that repeated runs start from scratch.
+    """
+    factory: Callable[[], Any]
+    if challenge.streaming:
+        factory = functools.partial(challenge.get_part_input, part)
+    elif challenge.defines_parse():
+        # parsing happens once, before the first run
+        challenge.get_parsed_input(part)
+        factory = functools.partial(challenge.get_parsed_input, part)
+    elif challenge.text_input:
+        factory = functools.partial(challenge.get_input_text, part)
+    else:
+        # solutions are allowed to mutate their input
+        factory = functools.partial(list, challenge.get_input_lines(part=part))
+
+    def make_input() -> Any:
+        memo.clear_caches()
+        return factory()
+
+    return make_input
+
+
+def benchmark_challenge(
+    challenge: BaseChallenge,
+    commit: str,
+    runs: int,
+    warmup: int,
+    parts: Iterable[int] = (1, 2),
+) -> list[BenchmarkResult]:
+    """
+    Benchmark the given parts of a challenge. Input is loaded and parsed before
+    timing, unless the challenge is streaming its input.
+    """
+    results = []
+    for part in parts:
+        func = challenge.part_1 if part == 1 else challenge.part_2
+        timings = measure(func, get_input_factory(challenge, part), runs, warmup)
+        results.append(
+            BenchmarkResult.from_timings(
+                challenge.year, challenge.day, part, commit, timings
+            )
+        )
+    return results
+
+
+def get_git_commit(ref: str = "HEAD") -> str | None:
+    """Return the full hash of the commit pointed by ref or None if unavailable."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:  # git is not installed
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip()
+
+
+def append_history(path: Path, results: Iterable[BenchmarkResult]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as history_file:
+        for result in results:
+            history_file.write(json.dumps(asdict(result)) + "\n")
+
+
+def load_history(path: Path) -> list[BenchmarkResult]:
+    if not path.exists():
+        return []
+    with path.open() as history_file:
+        return [
+            BenchmarkResult(**json.loads(line)) for line in history_file if line.strip()
+        ]
+
+
+def find_baseline(
+    history: Iterable[BenchmarkResult], year: int, day: int, part: int, commit: str
+) -> BenchmarkResult | None:
+    """Return the most recent result for the given part recorded at commit."""
+    baseline = None
+    for result in history:
+        if (result.year, result.day, result.part, result.commit) == (
+            year,
+            day,
+            part,
+            commit,
+        ):
+            baseline = result
+    return baseline
+
+
+def is_regression(
+    current: BenchmarkResult, baseline: BenchmarkResult, threshold: float
+) -> bool:
+    """Return True if current median is slower than baseline by more than threshold."""
+    return current.median > baseline.median * (1 + threshold)
@@ -0,0 +1,221 @@
+import ast
+import hashlib
+import importlib.util
+import os
+import pickle
+import sysconfig
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aoc.logger import logger
+
+DEFAULT_CACHE_DIRECTORY = Path(".aoc/cache")
+DEFAULT_MAX_SIZE = 256 * 1024**2
+_SUFFIX = ".pickle"
+_EXTERNAL_PATHS = tuple(
+    {
+        str(Path(sysconfig.get_path(name)).resolve())
+        for name in ("stdlib", "platstdlib", "purelib", "platlib")
+    }
+)
+
+
+def get_cache_directory() -> Path:
+    """Return the root directory of caches. Can be changed with AOC_CACHE_DIR."""
+    return Path(os.environ.get("AOC_CACHE_DIR", DEFAULT_CACHE_DIRECTORY))
+
+
+def get_cache_max_size() -> int:
+    """Return the size limit of each cache. Can be changed with AOC_CACHE_MAX_SIZE."""
+    return int(os.environ.get("AOC_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE))
+
+
+def _get_imported_names(source: bytes, package: str) -> set[str]:
+    """Return absolute names of modules (or their members) imported in source."""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = importlib.util.resolve_name(
+                    "." * node.level + (node.module or ""), package
+                )
+            except ImportError:
+                continue
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    return names
+
+
+def get_local_modules(module_name: str) -> dict[str, Path]:
+    """
+    Return paths of the module and all local modules it imports transitively, by
+    module names. Modules from the standard library and site-packages are skipped.
+    """
+    modules: dict[str, Path] = {}
+    origins: set[str] = set()
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):  # a member of a module, not a module
+            continue
+        if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+            continue
+        origin = str(Path(spec.origin).resolve())
+        if origin in origins or origin.startswith(_EXTERNAL_PATHS):
+            continue
+        origins.add(origin)
+        modules[name] = Path(origin)
+        source = modules[name].read_bytes()
+        package = name if spec.submodule_search_locations else name.rpartition(".")[0]
+        pending.extend(_get_imported_names(source, package))
+    return modules
+
+
+def get_source_hash(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def get_module_fingerprint(module_name: str) -> str | None:
+    """
+    Return a hash of source of the module and all local modules it imports
+    transitively. Modules from the standard library and site-packages are skipped.
+    """
+    modules = get_local_modules(module_name)
+    if not modules:
+        return None
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for origin in sorted(str(path) for path in modules.values()):
+        fingerprint.update(f"{origin}:{get_source_hash(Path(origin))}\n".encode())
+    return fingerprint.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    entries: int
+    size: int
+    max_size: int
+    hits: int = 0
+    misses: int = 0
+
+
+class DiskCache:
+    """
+    Pickle based key-value store with a bounded size. Entries that were least
+    recently used are evicted first, the usage is tracked with mtime of files.
+    """
+
+    def __init__(self, directory: Path, max_size: int | None = None):
+        self.directory = directory
+        self.max_size = get_cache_max_size() if max_size is None else max_size
+        self.hits = 0
+        self.misses = 0
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory.joinpath(f"{key}{_SUFFIX}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._get_path(key)
+        try:
+            with path.open("rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except Exception:
+            logger.warning("Removing corrupted cache entry %s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return default
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        """Store the value. Return False if it can't be pickled or is too big."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.info("Value for %s can't be cached", key, exc_info=True)
+            return False
+        if len(data) > self.max_size:
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            file.write(data)
+        os.replace(file.name, self._get_path(key))
+        self.evict()
+        return True
+
+    def _get_entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_size."""
+        entries = sorted(self._get_entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+    def clear(self):
+        for _, _, path in self._get_entries():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        entries = self._get_entries()
+        return CacheStats(
+            entries=len(entries),
+            size=sum(entry_size for _, entry_size, _ in entries),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+class ResultCache(DiskCache):
+    """
+    Cache of solutions keyed by the source of a challenge module (including local
+    modules it imports), the content of the input and the part.
+    """
+
+    def __init__(self, directory: Path | None = None, max_size: int | None = None):
+        super().__init__(directory or get_cache_directory() / "results", max_size)
+        self._module_fingerprints: dict[str, str | None] = {}
+
+    def get_key(
+        self, module_name: str, qualname: str, input_fingerprint: str, part: int
+    ) -> str | None:
+        """Return a key for the result or None if the module can't be fingerprinted."""
+        if module_name not in self._module_fingerprints:
+            self._module_fingerprints[module_name] = get_module_fingerprint(module_name)
+        if (module_fingerprint := self._module_fingerprints[module_name]) is None:
+            return None
+        key = hashlib.blake2b(digest_size=16)
+        for component in (module_fingerprint, qualname, input_fingerprint, str(part)):
+            key.update(component.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+
+def get_result_cache() -> ResultCache | None:
+    """Return the default result cache or None if it's disabled with AOC_NO_CACHE."""
+    if os.environ.get("AOC_NO_CACHE"):
+        return None
+    return ResultCache()
@@ -0,0 +1,103 @@
+import hashlib
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_STATES = 1_000_000
+# bytes fingerprints longer than that are replaced by their digests
+_MAX_KEY_SIZE = 16
+
+
+@dataclass
+class CycleResult(Generic[T]):
+    """
+    State after the requested number of iterations. If a cycle was found, states
+    from iteration start repeat every length iterations.
+    """
+
+    state: T
+    start: int | None
+    length: int | None
+    steps: int
+
+
+def _compact(key: Hashable) -> Hashable:
+    if isinstance(key, bytes | bytearray) and len(key) > _MAX_KEY_SIZE:
+        return hashlib.blake2b(key, digest_size=_MAX_KEY_SIZE).digest()
+    return key
+
+
+def _brent(
+    initial: T, step: Callable[[T], T], n: int, key: Callable[[T], Hashable]
+) -> CycleResult[T]:
+    """Find the cycle using Brent's algorithm, which keeps only two states."""
+    power = length = 1
+    tortoise, tortoise_key = initial, key(initial)
+    hare, steps = step(initial), 1
+    while key(hare) != tortoise_key:
+        if steps == n:
+            return CycleResult(hare, None, None, steps)
+        if power == length:
+            tortoise, tortoise_key = hare, key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        steps += 1
+        length += 1
+
+    tortoise = hare = initial
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    steps += length + 2 * start
+    if n < start:
+        state = initial
+        for _ in range(n):
+            state = step(state)
+        return CycleResult(state, start, length, steps + n)
+    state = tortoise
+    for _ in range((n - start) % length):
+        state = step(state)
+    return CycleResult(state, start, length, steps + (n - start) % length)
+
+
+def fast_forward(
+    initial: T,
+    step: Callable[[T], T],
+    n: int,
+    fingerprint: Callable[[T], Any] | None = None,
+    max_states: int | None = DEFAULT_MAX_STATES,
+) -> CycleResult[T]:
+    """
+    Return the state after n iterations of step, skipping whole cycles of states.
+    It takes O(start + length) steps instead of n.
+
+    step must return a new state instead of modifying its argument. States are
+    compared by fingerprint (by default the state itself), e.g. Grid.fingerprint.
+    Fingerprints of the first max_states states are remembered in a dict; if no
+    cycle is found by then, Brent's algorithm using constant memory takes over.
+    """
+    key: Callable[[T], Hashable] = (
+        (lambda state: _compact(fingerprint(state))) if fingerprint else _compact
+    )
+    seen = {key(initial): 0}
+    state = initial
+    for i in range(1, n + 1):
+        state = step(state)
+        if (first := seen.get(state_key := key(state))) is not None:
+            length = i - first
+            remaining = (n - i) % length
+            for _ in range(remaining):
+                state = step(state)
+            return CycleResult(state, first, length, i + remaining)
+        if max_states is not None and len(seen) >= max_states:
+            result = _brent(initial, step, n, key)
+            result.steps += i
+            return result
+        seen[state_key] = i
+    return CycleResult(state, None, None, n)
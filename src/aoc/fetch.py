@@ -0,0 +1,258 @@
+import abc
+import html
+import http.client
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar, cast
+
+from aoc.logger import logger
+
+T = TypeVar("T")
+
+DEFAULT_BASE_URL = "https://adventofcode.com"
+DEFAULT_JOBS = 4
+# requests per second, Advent of Code asks users not to hammer its servers
+DEFAULT_RATE = 5.0
+DEFAULT_RETRIES = 3
+USER_AGENT = "aoc-python-cli (https://github.com/nekeal/advent-of-code-python-cli)"
+
+INPUT = "input"
+EXAMPLE = "example"
+
+DOWNLOADED = "downloaded"
+SKIPPED = "skipped"
+UNAVAILABLE = "unavailable"
+FAILED = "failed"
+
+_EXAMPLE_PATTERN = re.compile(r"<pre><code>(.*?)</code></pre>", re.DOTALL)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+class FetchError(Exception):
+    """Raised when puzzle data can't be downloaded."""
+
+
+class TransientFetchError(FetchError):
+    """Raised for errors which may go away when the request is repeated."""
+
+
+class PuzzleUnavailableError(FetchError):
+    """Raised when the puzzle isn't released yet or doesn't exist."""
+
+
+def get_session_token() -> str | None:
+    """
+    Return the Advent of Code session token, read in the same way as aocd does:
+    from AOC_SESSION or from the token file in AOCD_CONFIG_DIR (~/.config/aocd).
+    """
+    if token := os.environ.get("AOC_SESSION"):
+        return token.strip()
+    config_directory = Path(
+        os.environ.get("AOCD_CONFIG_DIR", Path.home() / ".config" / "aocd")
+    )
+    try:
+        return config_directory.joinpath("token").read_text().strip() or None
+    except OSError:
+        return None
+
+
+def parse_days(text: str) -> list[int]:
+    """Return days given as comma separated days and ranges, e.g. 1-5,7."""
+    days: set[int] = set()
+    for item in text.split(","):
+        first, _, last = item.strip().partition("-")
+        try:
+            days.update(range(int(first), int(last or first) + 1))
+        except ValueError:
+            raise ValueError(f"Invalid days {text!r}, expected e.g. 1-25.") from None
+    if not days or min(days) < 1 or max(days) > 25:
+        raise ValueError("Days must be between 1 and 25.")
+    return sorted(days)
+
+
+class RateLimiter:
+    """Space out calls of acquire() from all threads by at least 1 / rate seconds."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def with_backoff(
+    func: Callable[[], T], retries: int = DEFAULT_RETRIES, delay: float = 1.0
+) -> T:
+    """Call func, repeating it after transient errors with doubling delays."""
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except TransientFetchError as e:
+            if attempt == retries:
+                raise
+            logger.info("%s, retrying in %.1f s", e, delay * 2**attempt)
+            time.sleep(delay * 2**attempt)
+    raise AssertionError("unreachable")
+
+
+class PuzzleClient(abc.ABC):
+    """Source of puzzle data. Implementations must be safe to use from threads."""
+
+    @abc.abstractmethod
+    def get_input(self, year: int, day: int) -> str: ...
+
+    @abc.abstractmethod
+    def get_example(self, year: int, day: int) -> str: ...
+
+
+class HttpPuzzleClient(PuzzleClient):
+    """Download puzzle data from Advent of Code, or a compatible server, with urllib."""
+
+    def __init__(
+        self,
+        session_token: str | None,
+        base_url: str = DEFAULT_BASE_URL,
+        rate: float = DEFAULT_RATE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_delay: float = 1.0,
+        timeout: float = 30.0,
+    ):
+        self.session_token = session_token
+        self.base_url = base_url.rstrip("/")
+        self.rate_limiter = RateLimiter(rate)
+        self.retries = retries
+        self.backoff_delay = backoff_delay
+        self.timeout = timeout
+
+    def _request(self, path: str) -> str:
+        self.rate_limiter.acquire()
+        request = urllib.request.Request(
+            f"{self.base_url}{path}", headers={"User-Agent": USER_AGENT}
+        )
+        if self.session_token:
+            request.add_header("Cookie", f"session={self.session_token}")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return cast(bytes, response.read()).decode()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise PuzzleUnavailableError(f"{path} is not available yet") from e
+            if e.code == 429 or e.code >= 500:
+                raise TransientFetchError(f"{path} returned {e.code}") from e
+            raise FetchError(f"{path} returned {e.code}") from e
+        # URLError and timeouts are OSErrors, as are dropped connections, while
+        # responses cut short raise IncompleteRead from http.client
+        except (OSError, http.client.HTTPException) as e:
+            raise TransientFetchError(f"{path} failed: {e!r}") from e
+
+    def get(self, path: str) -> str:
+        return with_backoff(
+            lambda: self._request(path), self.retries, self.backoff_delay
+        )
+
+    def get_input(self, year: int, day: int) -> str:
+        if not self.session_token:
+            raise FetchError("Set AOC_SESSION to download inputs.")
+        return self.get(f"/{year}/day/{day}/input")
+
+    def get_example(self, year: int, day: int) -> str:
+        """Return the first code block of the puzzle description."""
+        if not (match := _EXAMPLE_PATTERN.search(self.get(f"/{year}/day/{day}"))):
+            raise PuzzleUnavailableError(f"Day {day} of {year} has no example")
+        return html.unescape(_TAG_PATTERN.sub("", match.group(1)))
+
+
+def write_atomically(path: Path, text: str):
+    """Write the file so that it's never left partially written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        try:
+            file.write(text)
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+    try:
+        os.replace(file.name, path)
+    except BaseException:
+        os.remove(file.name)
+        raise
+
+
+def get_data_path(data_directory: Path, year: int, day: int, kind: str) -> Path:
+    suffix = "test_input" if kind == EXAMPLE else "input"
+    return data_directory.joinpath(str(year), f"{day:02}_{suffix}.txt")
+
+
+@dataclass
+class FetchResult:
+    day: int
+    kind: str
+    path: Path
+    status: str
+    error: str | None = None
+
+
+def _fetch_one(
+    client: PuzzleClient, year: int, day: int, kind: str, path: Path
+) -> FetchResult:
+    try:
+        if kind == EXAMPLE:
+            text = client.get_example(year, day)
+        else:
+            text = client.get_input(year, day)
+    except PuzzleUnavailableError as e:
+        return FetchResult(day, kind, path, UNAVAILABLE, str(e))
+    except FetchError as e:
+        return FetchResult(day, kind, path, FAILED, str(e))
+    try:
+        write_atomically(path, text)
+    except OSError as e:  # e.g. a full disk, other days may still be written
+        return FetchResult(day, kind, path, FAILED, f"Writing {path} failed: {e}")
+    return FetchResult(day, kind, path, DOWNLOADED)
+
+
+def fetch_days(
+    client: PuzzleClient,
+    year: int,
+    days: Iterable[int],
+    data_directory: Path,
+    jobs: int = DEFAULT_JOBS,
+    kinds: Iterable[str] = (INPUT, EXAMPLE),
+) -> list[FetchResult]:
+    """
+    Download data of the days concurrently, skipping files which already exist
+    and aren't empty. Return results ordered by day.
+    """
+    results = []
+    pending = []
+    for day in days:
+        for kind in kinds:
+            path = get_data_path(data_directory, year, day, kind)
+            if path.exists() and path.stat().st_size:
+                results.append(FetchResult(day, kind, path, SKIPPED))
+            else:
+                pending.append((day, kind, path))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results.extend(
+            executor.map(lambda task: _fetch_one(client, year, *task), pending)
+        )
+    return sorted(results, key=lambda result: (result.day, result.kind))
@@ -0,0 +1,29 @@
+import re
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3}
+
+
+def format_duration(seconds: float) -> str:
+    """Return a human-readable representation of a duration given in seconds."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_size(size: float) -> str:
+    """Return a human-readable representation of a size given in bytes."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+
+
+def parse_size(text: str) -> int:
+    """Return the number of bytes given a size like 512M, 2GiB or 1000."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?\s*", text, re.I)
+    if not match:
+        raise ValueError(f"Invalid size {text!r}, use e.g. 512M or 2GiB.")
+    return int(float(match[1]) * _SIZE_UNITS[match[2].lower()])
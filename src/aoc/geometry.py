@@ -0,0 +1,176 @@
+import functools
+import math
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+Point = tuple[int, int]
+
+# steps of each direction, y grows downwards as in the input
+STEPS: dict[str, Point] = {
+    "U": (0, -1),
+    "D": (0, 1),
+    "L": (-1, 0),
+    "R": (1, 0),
+    "north": (0, -1),
+    "south": (0, 1),
+    "west": (-1, 0),
+    "east": (1, 0),
+}
+# NumPy computes with int64, results larger than that are computed in Python
+_INT64_SAFE = 2**62
+
+
+def _get_numpy() -> Any:
+    """Return NumPy or None if it isn't installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _to_array(values: Any, max_result: Callable[[int, int], int]) -> Any:
+    """
+    Return values as an int64 NumPy array, or None if NumPy isn't installed or
+    max_result(number of values, largest absolute value) wouldn't fit in int64.
+    """
+    if (np := _get_numpy()) is None:
+        return None
+    try:
+        array = np.asarray(values, dtype=np.int64)
+    except (OverflowError, ValueError):  # too big or ragged
+        return None
+    if not array.size:
+        return array
+    largest = int(np.abs(array).max())
+    return array if max_result(len(array), largest) < _INT64_SAFE else None
+
+
+def walk(moves: Iterable[tuple[str, int]], start: Point = (0, 0)) -> list[Point]:
+    """Return vertices of a path of moves like ("R", 6), see STEPS for directions."""
+    x, y = start
+    vertices = [start]
+    for direction, distance in moves:
+        dx, dy = STEPS[direction]
+        x, y = x + dx * distance, y + dy * distance
+        vertices.append((x, y))
+    return vertices
+
+
+def twice_area(vertices: Sequence[Point]) -> int:
+    """
+    Return twice the area of the polygon with the given vertices, which is an
+    integer for lattice polygons (shoelace formula). The polygon is closed
+    automatically, repeating the first vertex at the end is allowed.
+    """
+    array = _to_array(vertices, lambda n, largest: 2 * n * largest**2)
+    if array is not None and array.size:
+        x, y = array[:, 0], array[:, 1]
+        np = _get_numpy()
+        return abs(int((x * np.roll(y, -1) - np.roll(x, -1) * y).sum()))
+    return abs(
+        sum(
+            x1 * y2 - x2 * y1
+            for (x1, y1), (x2, y2) in zip(
+                vertices, [*vertices[1:], *vertices[:1]], strict=True
+            )
+        )
+    )
+
+
+def polygon_area(vertices: Sequence[Point]) -> float:
+    return twice_area(vertices) / 2
+
+
+def boundary_points(vertices: Sequence[Point]) -> int:
+    """Return the number of lattice points on edges of the polygon."""
+    array = _to_array(vertices, lambda n, largest: 2 * n * largest)
+    if array is not None and array.size:
+        np = _get_numpy()
+        deltas = np.abs(np.roll(array, -1, axis=0) - array)
+        return int(np.gcd(deltas[:, 0], deltas[:, 1]).sum())
+    return sum(
+        math.gcd(x2 - x1, y2 - y1)
+        for (x1, y1), (x2, y2) in zip(
+            vertices, [*vertices[1:], *vertices[:1]], strict=True
+        )
+    )
+
+
+def interior_points(vertices: Sequence[Point]) -> int:
+    """
+    Return the number of lattice points strictly inside the polygon, e.g. tiles
+    enclosed by a loop of pipes, using Pick's theorem: A = i + b / 2 - 1.
+    """
+    return (twice_area(vertices) - boundary_points(vertices) + 2) // 2
+
+
+def lattice_points(vertices: Sequence[Point]) -> int:
+    """
+    Return the number of lattice points inside or on the polygon, e.g. cubic
+    meters of a lagoon dug along a path.
+    """
+    return interior_points(vertices) + boundary_points(vertices)
+
+
+def _sum_of_differences(values: list[int]) -> int:
+    """Return the sum of |a - b| over all pairs of the values."""
+    n = len(values)
+    return sum(value * (2 * k - n + 1) for k, value in enumerate(sorted(values)))
+
+
+def manhattan_pair_sum(points: Sequence[Sequence[int]]) -> int:
+    """
+    Return the sum of Manhattan distances between all pairs of points of any
+    dimension in O(n log n). Along each axis, the k-th smallest coordinate is
+    added k times and subtracted n - 1 - k times.
+    """
+    array = _to_array(points, lambda n, largest: 2 * n * n * largest)
+    if array is not None and array.size:
+        np = _get_numpy()
+        n = len(array)
+        weights = 2 * np.arange(n, dtype=np.int64) - n + 1
+        return int((np.sort(array, axis=0) * weights[:, None]).sum())
+    return sum(_sum_of_differences(list(axis)) for axis in zip(*points, strict=True))
+
+
+def lcm_all(values: Iterable[int]) -> int:
+    """
+    Return the least common multiple of the values, e.g. of lengths of cycles.
+    It's computed with math.lcm, as products of cycle lengths overflow int64.
+    """
+    return math.lcm(*values)
+
+
+@functools.cache
+def _extrapolation_coefficients(length: int) -> list[int]:
+    # the next value of a sequence whose differences of order length are zero
+    return [(-1) ** (length - 1 - i) * math.comb(length, i) for i in range(length)]
+
+
+def extrapolate(
+    sequences: Iterable[Sequence[int]], backwards: bool = False
+) -> list[int]:
+    """
+    Return the next value of each sequence, or the previous one with backwards,
+    as found by repeatedly taking differences until they're all zero. Each value
+    is a weighted sum of the sequence, so sequences of the same length are
+    extrapolated by a single matrix product.
+    """
+    rows = [row[::-1] if backwards else row for row in map(list, sequences)]
+    length = len(rows[0]) if rows else 0
+    if length and all(len(row) == length for row in rows):
+        # coefficients are below 2**length, which must fit even for zeros only
+        array = _to_array(rows, lambda n, largest: 2**length * max(largest, 1))
+        if array is not None:
+            coefficients = _get_numpy().array(
+                _extrapolation_coefficients(length), dtype="int64"
+            )
+            return [int(value) for value in array @ coefficients]
+    return [
+        sum(
+            c * value
+            for c, value in zip(_extrapolation_coefficients(len(row)), row, strict=True)
+        )
+        for row in rows
+    ]
@@ -0,0 +1,271 @@
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+Direction = Literal["north", "south", "west", "east"]
+
+
+def _tilt_line(line: bytes, rolling: int, empty: int, blocker: bytes) -> bytes:
+    """Move rolling cells of the line towards its start until they hit a blocker."""
+    segments = line.split(blocker)
+    for i, segment in enumerate(segments):
+        if rolls := segment.count(rolling):
+            segments[i] = bytes([rolling]) * rolls + bytes([empty]) * (
+                len(segment) - rolls
+            )
+    return blocker.join(segments)
+
+
+class Grid:
+    """
+    Rectangular grid of single byte cells, e.g. ASCII characters of the input,
+    stored row by row in a flat bytearray.
+
+    Cells are addressed either by (x, y) or by a flat index y * width + x, which is
+    cheaper to store in sets, queues and dicts than tuples.
+    """
+
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, cells: bytes | bytearray | None = None):
+        if cells is None:
+            cells = b"." * (width * height)
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}.")
+        self.width = width
+        self.height = height
+        self.cells = bytearray(cells)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Grid":
+        """Create a grid from lines of ASCII characters, all of the same length."""
+        rows = [line.encode("ascii") for line in lines]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All lines of a grid must have the same length.")
+        return cls(width, len(rows), b"".join(rows))
+
+    @classmethod
+    def filled(cls, width: int, height: int, char: str = ".") -> "Grid":
+        return cls(width, height, char.encode("ascii") * (width * height))
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Return (x, y) of the cell with the given flat index."""
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, key: int | tuple[int, int]) -> str:
+        if isinstance(key, tuple):
+            x, y = key
+            if not self.in_bounds(x, y):
+                raise IndexError(f"Position {key} is outside of the grid.")
+            key = y * self.width + x
+        return chr(self.cells[key])
+
+    def __setitem__(self, key: int | tuple[int, int], char: str):
+        if isinstance(key, tuple):
+            x, y = key
+            if not self.in_bounds(x, y):
+                raise IndexError(f"Position {key} is outside of the grid.")
+            key = y * self.width + x
+        self.cells[key] = ord(char)
+
+    def get(self, x: int, y: int, default: str | None = None) -> str | None:
+        if not self.in_bounds(x, y):
+            return default
+        return chr(self.cells[y * self.width + x])
+
+    def neighbours(self, index: int, diagonal: bool = False) -> Iterator[int]:
+        """Yield flat indices of cells adjacent to the given one, without wrapping."""
+        width, size = self.width, len(self.cells)
+        x = index % width
+        left, right = x > 0, x < width - 1
+        if left:
+            yield index - 1
+        if right:
+            yield index + 1
+        for vertical in (index - width, index + width):
+            if not 0 <= vertical < size:
+                continue
+            yield vertical
+            if diagonal:
+                if left:
+                    yield vertical - 1
+                if right:
+                    yield vertical + 1
+
+    def row(self, y: int) -> memoryview:
+        """Return the row as a view of cells, changes to it are made in the grid."""
+        if not 0 <= y < self.height:
+            raise IndexError(f"Row {y} is outside of the grid.")
+        return memoryview(self.cells)[y * self.width : (y + 1) * self.width]
+
+    def column(self, x: int) -> memoryview:
+        """Return the column as a strided view of cells."""
+        if not 0 <= x < self.width:
+            raise IndexError(f"Column {x} is outside of the grid.")
+        return memoryview(self.cells)[x :: self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        return (self.row(y) for y in range(self.height))
+
+    def columns(self) -> Iterator[memoryview]:
+        return (self.column(x) for x in range(self.width))
+
+    def find(self, char: str, start: int = 0) -> int:
+        """Return the index of the first cell with char or -1 if there is none."""
+        return self.cells.find(ord(char), start)
+
+    def find_all(self, char: str) -> list[int]:
+        """Return indices of all cells with char."""
+        find, value = self.cells.find, ord(char)
+        indices = []
+        index = find(value)
+        while index != -1:
+            indices.append(index)
+            index = find(value, index + 1)
+        return indices
+
+    def count(self, char: str) -> int:
+        return self.cells.count(ord(char))
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells)
+
+    def transposed(self) -> "Grid":
+        width = self.width
+        return Grid(
+            self.height,
+            width,
+            b"".join(self.cells[x::width] for x in range(width)),
+        )
+
+    def flipped_horizontally(self) -> "Grid":
+        """Return the grid mirrored left to right."""
+        width = self.width
+        return Grid(
+            width,
+            self.height,
+            b"".join(
+                self.cells[y : y + width][::-1]
+                for y in range(0, len(self.cells), width)
+            ),
+        )
+
+    def flipped_vertically(self) -> "Grid":
+        """Return the grid mirrored top to bottom."""
+        width = self.width
+        return Grid(
+            width,
+            self.height,
+            b"".join(
+                self.cells[y : y + width]
+                for y in range(len(self.cells) - width, -1, -width)
+            ),
+        )
+
+    def rotated(self, clockwise: bool = True) -> "Grid":
+        """Return the grid rotated by 90 degrees."""
+        if clockwise:
+            return self.flipped_vertically().transposed()
+        return self.transposed().flipped_vertically()
+
+    def tilt(
+        self,
+        direction: Direction,
+        rolling: str = "O",
+        empty: str = ".",
+        blocker: str = "#",
+    ):
+        """Move all rolling cells as far as possible in the direction, in place."""
+        width, cells = self.width, self.cells
+        rolling_value, empty_value = ord(rolling), ord(empty)
+        blocker_bytes = blocker.encode("ascii")
+        lines: Iterable[slice]
+        if direction in ("north", "south"):
+            lines = (slice(x, None, width) for x in range(width))
+        else:
+            lines = (slice(y, y + width) for y in range(0, len(cells), width))
+        reverse = direction in ("south", "east")
+        for line in lines:
+            values = bytes(cells[line])
+            if reverse:
+                values = values[::-1]
+            if rolling_value not in values:
+                continue
+            tilted = _tilt_line(values, rolling_value, empty_value, blocker_bytes)
+            cells[line] = tilted[::-1] if reverse else tilted
+
+    def diff(self, other: "Grid") -> list[int]:
+        """
+        Return indices of cells that differ between grids of the same size. Cells
+        are compared in bulk with NumPy if it's installed, otherwise only rows
+        which differ are compared cell by cell.
+        """
+        if (self.width, self.height) != (other.width, other.height):
+            raise ValueError("Only grids of the same size can be compared.")
+        if self.cells == other.cells:
+            return []
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            return np.flatnonzero(
+                np.frombuffer(self.cells, dtype=np.uint8)
+                != np.frombuffer(other.cells, dtype=np.uint8)
+            ).tolist()
+        cells, other_cells = memoryview(self.cells), memoryview(other.cells)
+        indices: list[int] = []
+        for start in range(0, len(cells), self.width):
+            row = slice(start, start + self.width)
+            if cells[row] != other_cells[row]:
+                indices.extend(
+                    start + x
+                    for x, (a, b) in enumerate(
+                        zip(cells[row], other_cells[row], strict=True)
+                    )
+                    if a != b
+                )
+        return indices
+
+    def fingerprint(self) -> bytes:
+        """Return a hashable snapshot of cells, e.g. to detect repeated states."""
+        return bytes(self.cells)
+
+    def to_numpy(self) -> Any:
+        """Return a (height, width) uint8 NumPy array sharing memory with the grid."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "Grid.to_numpy() requires NumPy to be installed."
+            ) from None
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(
+            self.height, self.width
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height, self.cells) == (
+            other.width,
+            other.height,
+            other.cells,
+        )
+
+    __hash__ = None  # type: ignore[assignment]  # grids are mutable
+
+    def __str__(self) -> str:
+        return "\n".join(str(row, "ascii") for row in self.rows())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.width}x{self.height})"
@@ -1,18 +1,151 @@
 import abc
-from dataclasses import InitVar, dataclass
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
 
+from aoc.lines import MappedLines, stream_lines
 from aoc.logger import logger
+from aoc.timing import span
+
+DEFAULT_INPUT_CACHE_MAX_SIZE = 256 * 1024**2
+
+
+def get_input_cache_max_size() -> int:
+    """Return the input cache budget in bytes, set with AOC_INPUT_CACHE_MAX_SIZE."""
+    return int(os.environ.get("AOC_INPUT_CACHE_MAX_SIZE", DEFAULT_INPUT_CACHE_MAX_SIZE))
+
+
+def split_lines(text: str) -> list[str]:
+    with span("split"):
+        return text.strip().split("\n")
+
+
+@dataclass
+class _CachedInput:
+    text: str
+    size: int
+    lines: tuple[str, ...] | None = None
+
+
+class InputCache:
+    """
+    Process-wide cache of input files, so that challenges and tests using the
+    same file read and split it once. Files are identified by their resolved
+    paths, modification times and sizes, so changed files are read again. The
+    least recently used files are evicted when entries exceed max_size bytes.
+    Hashes of files are computed without reading them into the cache.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self.max_size = get_input_cache_max_size() if max_size is None else max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, int, int], _CachedInput] = OrderedDict()
+        # the hash of the last seen version of each file
+        self._hashes: dict[str, tuple[tuple[str, int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(path: Path) -> tuple[str, int, int]:
+        stat = path.stat()
+        return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+    def _get_entry(self, path: Path) -> _CachedInput:
+        key = self._get_key(path)
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        with span("read"):
+            text = path.read_text()
+        entry = _CachedInput(text, sys.getsizeof(text))
+        with self._lock:
+            if entry.size <= self.max_size and key not in self._entries:
+                self._entries[key] = entry
+                self._resize(entry.size)
+        return entry
+
+    def _resize(self, change: int):
+        self.size += change
+        while self.size > self.max_size and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    def get_text(self, path: Path) -> str:
+        return self._get_entry(path).text
+
+    def get_lines(self, path: Path) -> list[str]:
+        """Return lines of the file, a new list each time, as parts may modify it."""
+        entry = self._get_entry(path)
+        if entry.lines is None:
+            entry.lines = tuple(split_lines(entry.text))
+            with self._lock:
+                if any(cached is entry for cached in self._entries.values()):
+                    added = sys.getsizeof(entry.lines)
+                    added += sum(map(sys.getsizeof, entry.lines))
+                    entry.size += added
+                    self._resize(added)
+        return list(entry.lines)
+
+    def get_hash(self, path: Path) -> str:
+        """Return a hash of the file, read in chunks to use constant memory."""
+        key = self._get_key(path)
+        cached = self._hashes.get(key[0])
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with path.open("rb") as file:
+            digest = hashlib.file_digest(
+                file, lambda: hashlib.blake2b(digest_size=16)
+            ).hexdigest()
+        with self._lock:
+            self._hashes[key[0]] = (key, digest)
+        return digest
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hashes.clear()
+            self.size = 0
+
+
+input_cache = InputCache()
 
 
 @dataclass
 class InputProvider(abc.ABC):
     year: int
     day: int
+    use_mmap: bool = field(default=False, kw_only=True)
 
     @abc.abstractmethod
     def provide_input(self, part: int | None) -> str: ...
 
+    def provide_lines(self, part: int | None) -> Sequence[str]:
+        """Return the input split into lines."""
+        return split_lines(self.provide_input(part))
+
+    def stream_lines(self, part: int | None) -> Iterator[str]:
+        """Yield lines of the input without keeping the whole input in memory."""
+        yield from self.provide_lines(part)
+
+    def get_input_fingerprint(self, part: int | None) -> str:
+        """Return a hash identifying content of the input."""
+        return hashlib.blake2b(
+            self.provide_input(part).encode(), digest_size=16
+        ).hexdigest()
+
+    def get_input_path(self, part: int | None) -> Path | None:
+        """Return the file from which the input is read, if there is one."""
+        return None
+
     @property
     def _day(self) -> int:
         import __main__
@@ -34,8 +167,30 @@ class SmartFileInputProvider(InputProvider):
     def provide_input(self, part: int | None) -> str:
         filename = self.get_input_filename(part)
         print("Using data from", filename)
-        return self.get_input_file_path(self.get_input_filename(part)).read_text()
+        return input_cache.get_text(self.get_input_file_path(filename))
 
+    def provide_lines(self, part: int | None) -> Sequence[str]:
+        filename = self.get_input_filename(part)
+        print("Using data from", filename)
+        if not self.use_mmap:
+            return input_cache.get_lines(self.get_input_file_path(filename))
+        with span("read"):
+            return MappedLines.from_path(self.get_input_file_path(filename))
+
+    def stream_lines(self, part: int | None) -> Iterator[str]:
+        filename = self.get_input_filename(part)
+        print("Using data from", filename)
+        return stream_lines(self.get_input_file_path(filename))
+
+    def get_input_fingerprint(self, part: int | None) -> str:
+        return input_cache.get_hash(
+            self.get_input_file_path(self.get_input_filename(part))
+        )
+
+    def get_input_path(self, part: int | None) -> Path | None:
+        return self.get_input_file_path(self.get_input_filename(part))
+
+    @span("resolve")
     def get_input_filename(self, part: int | None = None) -> str:
         """Return the input filename for this challenge."""
         base_filename = (
@@ -66,7 +221,41 @@ class SingleFileInputProvider(InputProvider):
     input_path: Path
 
     def provide_input(self, part: int | None) -> str:
+        self._check_input_path()
+        print("Using data from", self.input_path.name)
+        return input_cache.get_text(self.input_path)
+
+    def provide_lines(self, part: int | None) -> Sequence[str]:
+        self._check_input_path()
+        print("Using data from", self.input_path.name)
+        if not self.use_mmap:
+            return input_cache.get_lines(self.input_path)
+        with span("read"):
+            return MappedLines.from_path(self.input_path)
+
+    def stream_lines(self, part: int | None) -> Iterator[str]:
+        self._check_input_path()
+        print("Using data from", self.input_path.name)
+        return stream_lines(self.input_path)
+
+    def get_input_fingerprint(self, part: int | None) -> str:
+        self._check_input_path()
+        return input_cache.get_hash(self.input_path)
+
+    def get_input_path(self, part: int | None) -> Path | None:
+        return self.input_path
+
+    @span("resolve")
+    def _check_input_path(self):
         if not self.input_path.exists():
             raise FileNotFoundError(f"File {self.input_path.resolve()} does not exist.")
-        print("Using data from", self.input_path.name)
-        return self.input_path.read_text()
+
+
+@dataclass
+class TextInputProvider(InputProvider):
+    """Provide the same text held in memory for all parts, e.g. a generated input."""
+
+    text: str
+
+    def provide_input(self, part: int | None) -> str:
+        return self.text
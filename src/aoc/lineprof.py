@@ -0,0 +1,240 @@
+import inspect
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from types import CodeType, FrameType, ModuleType
+from typing import Any
+
+from aoc.base import BaseChallenge
+from aoc.formatting import format_duration
+
+_TOOL_NAME = "aoc-line-profiler"
+
+
+@dataclass
+class LineTiming:
+    """Number of times a line ran and time spent on it, including calls it made."""
+
+    hits: int = 0
+    nanoseconds: int = 0
+
+
+def _walk_code(code: CodeType) -> Iterator[CodeType]:
+    yield code
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            yield from _walk_code(constant)
+
+
+def _get_function_codes(obj: Any) -> Iterator[CodeType]:
+    if isinstance(obj, staticmethod | classmethod):
+        obj = obj.__func__
+    elif isinstance(obj, property):
+        for accessor in (obj.fget, obj.fset, obj.fdel):
+            yield from _get_function_codes(accessor)
+        return
+    # functions wrapped by decorators, e.g. aoc.memo.memoize or aoc.timing.span
+    obj = inspect.unwrap(obj) if callable(obj) else obj
+    if code := getattr(obj, "__code__", None):
+        yield from _walk_code(code)
+
+
+def get_module_codes(module: ModuleType) -> set[CodeType]:
+    """
+    Return code objects of functions and methods defined in the module,
+    including nested functions, lambdas and comprehensions.
+    """
+    filename = getattr(module, "__file__", None)
+    codes: set[CodeType] = set()
+    for obj in vars(module).values():
+        if inspect.isclass(obj) and obj.__module__ == module.__name__:
+            for attribute in vars(obj).values():
+                codes.update(_get_function_codes(attribute))
+        else:
+            codes.update(_get_function_codes(obj))
+    return {code for code in codes if code.co_filename == filename}
+
+
+class LineProfiler:
+    """
+    Count hits and time of each line of the given code objects only, other code
+    runs without instrumentation. It uses sys.monitoring on Python 3.12 and newer
+    and sys.settrace on older versions. Time of a line lasts until the next line
+    of the same frame starts, so it includes functions called from it. Lines of
+    recursive calls count only hits, their time is a part of the outer call.
+    """
+
+    def __init__(self, codes: Iterable[CodeType]):
+        self.codes = set(codes)
+        self.timings: dict[CodeType, dict[int, LineTiming]] = defaultdict(
+            lambda: defaultdict(LineTiming)
+        )
+        # the running line and its start time of each instrumented frame
+        self._frames: list[tuple[CodeType, int | None, int]] = []
+        self._depths: dict[CodeType, int] = defaultdict(int)
+        self._tool_id: int | None = None
+        self._callbacks: dict[int, Callable[..., Any]] = {}
+        self._previous_trace: Any = None
+
+    def _finish_line(self, now: int):
+        code, line, start = self._frames.pop()
+        self._depths[code] -= 1
+        # with recursion the outermost frame counts, as in aoc.timing
+        if line is not None and not self._depths[code]:
+            self.timings[code][line].nanoseconds += now - start
+
+    def _on_line(self, code: CodeType, line: int):
+        now = time.perf_counter_ns()
+        self.timings[code][line].hits += 1
+        if self._frames and self._frames[-1][0] is code:
+            self._finish_line(now)
+        self._frames.append((code, line, now))
+        self._depths[code] += 1
+
+    def _on_start(self, code: CodeType, *args: Any):
+        self._frames.append((code, None, 0))
+        self._depths[code] += 1
+
+    def _on_exit(self, code: CodeType, *args: Any):
+        if self._frames and self._frames[-1][0] is code:
+            self._finish_line(time.perf_counter_ns())
+
+    def _trace_frame(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if event == "line":
+            self._on_line(frame.f_code, frame.f_lineno)
+        elif event == "return":
+            self._on_exit(frame.f_code)
+        return self._trace_frame
+
+    def _trace_call(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if event == "call" and frame.f_code in self.codes:
+            self._on_start(frame.f_code)
+            return self._trace_frame
+        return None
+
+    def start(self):
+        if sys.version_info >= (3, 12):
+            monitoring = sys.monitoring
+            for tool_id in (monitoring.PROFILER_ID, 3, 4):
+                if monitoring.get_tool(tool_id) is None:
+                    break
+            else:
+                raise RuntimeError("All sys.monitoring profiler slots are in use.")
+            monitoring.use_tool_id(tool_id, _TOOL_NAME)
+            self._tool_id = tool_id
+            events = monitoring.events
+            self._callbacks = {
+                events.LINE: self._on_line,
+                events.PY_START: self._on_start,
+                events.PY_RESUME: self._on_start,
+                events.PY_RETURN: self._on_exit,
+                events.PY_YIELD: self._on_exit,
+                events.PY_UNWIND: self._on_exit,
+            }
+            for event, callback in self._callbacks.items():
+                monitoring.register_callback(tool_id, event, callback)
+            local_events = (
+                events.LINE
+                | events.PY_START
+                | events.PY_RESUME
+                | events.PY_RETURN
+                | events.PY_YIELD
+            )
+            for code in self.codes:
+                monitoring.set_local_events(tool_id, code, local_events)
+            # unwinding can't be enabled per code object, _on_exit ignores others
+            monitoring.set_events(tool_id, events.PY_UNWIND)
+        else:
+            self._previous_trace = sys.gettrace()
+            sys.settrace(self._trace_call)
+
+    def stop(self):
+        if sys.version_info >= (3, 12):
+            if self._tool_id is not None:
+                monitoring = sys.monitoring
+                monitoring.set_events(self._tool_id, 0)
+                for code in self.codes:
+                    monitoring.set_local_events(self._tool_id, code, 0)
+                for event in self._callbacks:
+                    monitoring.register_callback(self._tool_id, event, None)
+                monitoring.free_tool_id(self._tool_id)
+                self._tool_id = None
+        else:
+            sys.settrace(self._previous_trace)
+        self._frames.clear()
+        self._depths.clear()
+
+    def __enter__(self) -> "LineProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def format(self, total_seconds: float) -> str:
+        """
+        Return the source of each function that ran, annotated with hits, time
+        and percentage of total_seconds of each line.
+        """
+        blocks = []
+        for code, lines in sorted(
+            self.timings.items(),
+            key=lambda item: (item[0].co_filename, item[0].co_firstlineno),
+        ):
+            if code.co_name.startswith("<"):
+                # comprehensions and lambdas are included in lines using them
+                continue
+            try:
+                source, first_line = inspect.getsourcelines(code)
+            except (OSError, TypeError):
+                continue
+            rows = [
+                f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})",
+                f"{'Line':>6} {'Hits':>10} {'Time':>10} {'% Time':>7}  Source",
+            ]
+            for line, text in enumerate(source, start=first_line):
+                timing = lines.get(line)
+                if timing is None:
+                    rows.append(f"{line:>6} {'':>10} {'':>10} {'':>7}  {text.rstrip()}")
+                    continue
+                seconds = timing.nanoseconds / 1e9
+                share = seconds / total_seconds if total_seconds else 0.0
+                rows.append(
+                    f"{line:>6} {timing.hits:>10} {format_duration(seconds):>10} "
+                    f"{share:>7.1%}  {text.rstrip()}"
+                )
+            blocks.append("\n".join(rows))
+        return "\n\n".join(blocks)
+
+
+@dataclass
+class PartLineProfile:
+    part: int
+    solution: Any
+    seconds: float
+    profiler: LineProfiler = field(repr=False)
+
+    def format(self) -> str:
+        return self.profiler.format(self.seconds)
+
+
+def profile_lines(
+    challenge: BaseChallenge, parts: Iterable[int] = (1, 2)
+) -> list[PartLineProfile]:
+    """
+    Solve the parts, profiling lines of code of the challenge module only.
+    Input is loaded and parsed before profiling. Result cache is not used.
+    """
+    codes = get_module_codes(sys.modules[type(challenge).__module__])
+    profiles = []
+    for part in parts:
+        func = challenge.part_1 if part == 1 else challenge.part_2
+        part_input = challenge.get_part_input(part)
+        with LineProfiler(codes) as profiler:
+            start = time.perf_counter()
+            solution = func(part_input)
+            seconds = time.perf_counter() - start
+        profiles.append(PartLineProfile(part, solution, seconds, profiler))
+    return profiles
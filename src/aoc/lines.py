@@ -0,0 +1,143 @@
+import mmap
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _strip_bounds(data: bytes | mmap.mmap) -> tuple[int, int]:
+    """Return bounds of data without leading and trailing ASCII whitespace."""
+    start, stop = 0, len(data)
+    while start < stop and data[start] in _WHITESPACE:
+        start += 1
+    while stop > start and data[stop - 1] in _WHITESPACE:
+        stop -= 1
+    return start, stop
+
+
+def _line_offsets(data: bytes | mmap.mmap, start: int, stop: int) -> array:
+    """
+    Return offsets of beginnings of lines between start and stop followed by
+    a sentinel, so that line i spans offsets[i]:offsets[i + 1] - 1.
+    """
+    offsets = array("q", [start])
+    find = data.find
+    position = find(b"\n", start, stop)
+    while position != -1:
+        offsets.append(position + 1)
+        position = find(b"\n", position + 1, stop)
+    offsets.append(stop + 1)
+    return offsets
+
+
+class MappedLines(Sequence[str]):
+    """
+    Read-only sequence of input lines backed by a memory mapped file.
+
+    Only offsets of lines are kept in memory, each line is decoded when accessed.
+    Like ``str.strip().split("\\n")`` it skips leading and trailing whitespace of
+    the whole input, so it can be used wherever a list of lines is expected.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap, encoding: str = "utf-8"):
+        self._data = data
+        self._view = memoryview(data)
+        self._encoding = encoding
+        self._offsets = _line_offsets(data, *_strip_bounds(data))
+
+    @classmethod
+    def from_path(cls, path: Path, encoding: str = "utf-8") -> "MappedLines":
+        with path.open("rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:  # empty files can't be mapped
+                return cls(b"", encoding)
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), encoding)
+
+    def raw(self, index: int) -> memoryview:
+        """Return the line as a memoryview of the file without decoding it."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self._view[self._offsets[index] : self._offsets[index + 1] - 1]
+
+    def close(self):
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> "MappedLines":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return str(self.raw(index), self._encoding)
+
+    def __iter__(self) -> Iterator[str]:
+        view, offsets, encoding = self._view, self._offsets, self._encoding
+        for i in range(len(offsets) - 1):
+            yield str(view[offsets[i] : offsets[i + 1] - 1], encoding)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str | bytes):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other, strict=True)
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} lines)"
+
+
+def strip_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield lines of a text like ``text.strip().split("\\n")`` would return them,
+    given an iterable of its lines. Only whitespace-only lines are held back.
+    """
+    iterator = iter(lines)
+    for line in iterator:
+        if line.strip():
+            previous = line.lstrip()
+            break
+    else:
+        yield ""
+        return
+    blank: list[str] = []
+    for line in iterator:
+        if not line.strip():
+            blank.append(line)
+            continue
+        yield previous
+        yield from blank
+        blank.clear()
+        previous = line
+    yield previous.rstrip()
+
+
+def stream_lines(
+    path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8"
+) -> Iterator[str]:
+    """
+    Yield stripped lines of a file reading it in chunks of chunk_size bytes,
+    so that only a single chunk is kept in memory.
+    """
+    with path.open(encoding=encoding, buffering=chunk_size) as file:
+        yield from strip_lines(
+            line[:-1] if line.endswith("\n") else line for line in file
+        )
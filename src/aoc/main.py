@@ -1,18 +1,32 @@
-import importlib
+import contextlib
+import functools
+import logging
+import os
+import random
 import shutil
+import time
+import traceback
 import typing
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Literal, TypeGuard
 
-import aocd
-import pytest
 import typer
-from aocd import AocdError
-from aocd.exceptions import PuzzleLockedError
-from aocd.models import Puzzle
 
-from aoc.input_providers import SingleFileInputProvider, SmartFileInputProvider
+from aoc import bench as benchmarking
+from aoc import lineprof, memo, profiling, scaling, watch
+from aoc.base import get_challenge_module_name, import_challenge
+from aoc.cache import DiskCache, get_cache_directory, get_result_cache
+from aoc.formatting import format_duration, format_size, parse_size
+from aoc.input_providers import (
+    InputProvider,
+    SingleFileInputProvider,
+    SmartFileInputProvider,
+)
+from aoc.timing import timings_logger
+
+if typing.TYPE_CHECKING:
+    from aocd.models import Puzzle
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -48,22 +62,15 @@ year_option = Annotated[
 ]
 
 
-def get_challenge_module_name(year: int, day: int) -> str:
-    return f"aoc_solutions.{year}.day_{day:02}"
-
-
 def import_challenge_module(year, day: int):
     try:
-        import sys
-
-        sys.path.insert(0, ".")
-        module = importlib.import_module(get_challenge_module_name(year, day))
+        module = import_challenge(year, day)
     except ModuleNotFoundError as e:
         echo(
             f'Could not import "{e.name}"',
             fg=typer.colors.RED,
         )
-        if e.name == get_challenge_module_name:
+        if e.name == get_challenge_module_name(year, day):
             echo(
                 f"You have not solved day {day} yet. Start it using 'new-day' command",
                 fg=typer.colors.RED,
@@ -74,28 +81,254 @@ def import_challenge_module(year, day: int):
     return module
 
 
+no_cache_option = Annotated[
+    bool,
+    typer.Option("--no-cache", help="Don't use cached results of unchanged solutions."),
+]
+memory_option = Annotated[
+    bool,
+    typer.Option(
+        "--memory",
+        help="Run each part in a child process and report its peak memory usage.",
+    ),
+]
+memory_limit_option = Annotated[
+    typing.Optional[str],  # noqa: UP007
+    typer.Option(
+        help="Abort a part using more memory than this, e.g. 512M or 2GiB. "
+        "Implies --memory."
+    ),
+]
+timeout_option = Annotated[
+    typing.Optional[float],  # noqa: UP007
+    typer.Option(
+        min=0,
+        help="Stop a part running longer than this many seconds and show its stack. "
+        "Runs each part in a child process.",
+    ),
+]
+cpu_limit_option = Annotated[
+    typing.Optional[float],  # noqa: UP007
+    typer.Option(
+        min=0,
+        help="Stop a part using more CPU time than this many seconds. "
+        "Runs each part in a child process.",
+    ),
+]
+
+
+def get_input_provider(
+    year: int,
+    day: int,
+    test_data: bool,
+    data_dir: Path | None,
+    input_path: Path | None = None,
+    use_mmap: bool = False,
+) -> InputProvider:
+    if input_path:
+        return SingleFileInputProvider(
+            year=year, day=day, input_path=input_path, use_mmap=use_mmap
+        )
+    return SmartFileInputProvider(
+        year=year,
+        day=day,
+        data_dir=data_dir,
+        use_test_data=test_data,
+        use_mmap=use_mmap,
+    )
+
+
 def run_challenge(
     year: int,
     day: int,
     test_data: bool,
     data_dir: Path | None,
     input_path: Path | None = None,
+    use_mmap: bool = False,
+    use_cache: bool = True,
+    show_timings: bool = False,
+    timings_log: Path | None = None,
+    verbose: bool = False,
 ):
     module = import_challenge_module(year, day)
-    input_provider = (
-        SingleFileInputProvider(year=year, day=day, input_path=input_path)
-        if input_path
-        else SmartFileInputProvider(
-            year=year, day=day, data_dir=data_dir, use_test_data=test_data
+    input_provider = get_input_provider(
+        year, day, test_data, data_dir, input_path, use_mmap
+    )
+    result_cache = get_result_cache() if use_cache else None
+    challenge = module.Challenge(
+        input_provider=input_provider, result_cache=result_cache
+    )
+    memo.reset_stats()
+    with log_timings_to(timings_log):
+        challenge.run()
+    if verbose:
+        show_memo_stats(result_cache.hits if result_cache is not None else 0)
+    if show_timings:
+        echo("Timings:", fg=typer.colors.BLUE)
+        typer.echo(challenge.timings.format())
+    if result_cache is not None and result_cache.hits:
+        echo(
+            f"Result cache: {result_cache.hits} hits, {result_cache.misses} misses. "
+            "Use --no-cache to recompute.",
+            fg=typer.colors.YELLOW,
+        )
+
+
+def show_memo_stats(cached_parts: int = 0):
+    echo("Memoized functions:", fg=typer.colors.BLUE)
+    if cached_parts:
+        echo(
+            f"  {cached_parts} part(s) came from the result cache and aren't "
+            "included. Use --no-cache to include them.",
+            fg=typer.colors.YELLOW,
         )
+    stats = memo.get_stats()
+    if not stats:
+        typer.echo("  none called")
+    for function_stats in sorted(stats, key=lambda stats: -stats.calls):
+        typer.echo(f"  {function_stats.name}: {function_stats.format()}")
+
+
+@contextlib.contextmanager
+def log_timings_to(path: Path | None):
+    """Write timings logged in the block as JSON lines to the given file."""
+    if path is None:
+        yield
+        return
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    level = timings_logger.level
+    timings_logger.addHandler(handler)
+    timings_logger.setLevel(logging.INFO)
+    try:
+        yield
+    finally:
+        timings_logger.removeHandler(handler)
+        timings_logger.setLevel(level)
+        handler.close()
+
+
+def run_challenge_isolated(
+    year: int,
+    day: int,
+    test_data: bool,
+    data_dir: Path | None,
+    input_path: Path | None,
+    use_mmap: bool,
+    memory_limit: int | None,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+    trace_memory: bool = True,
+):
+    module = import_challenge_module(year, day)
+    input_provider = get_input_provider(
+        year, day, test_data, data_dir, input_path, use_mmap
     )
-    if test_data:
-        module.Challenge(input_provider=input_provider).run()
-    else:
-        module.Challenge(input_provider=input_provider).run()
+    # child processes are needed only here, multiprocessing slows down startup
+    from aoc import sandbox
+
+    challenge = module.Challenge(input_provider=input_provider)
+    failed = False
+    for part in (1, 2):
+        outcome = sandbox.run_part_isolated(
+            challenge, part, memory_limit, timeout, cpu_limit, trace_memory=trace_memory
+        )
+        if outcome.ok:
+            print(
+                f"Day {day} - Part {part}: {outcome.solution} "
+                f"({outcome.format_usage()})"
+            )
+            continue
+        failed = True
+        echo(
+            f"Day {day} - Part {part}: {outcome.status} ({outcome.format_usage()})",
+            fg=typer.colors.RED,
+        )
+        typer.echo(outcome.error)
+        if outcome.stack:
+            echo("Stack when stopped:", fg=typer.colors.YELLOW)
+            typer.echo(outcome.stack)
+    if failed:
+        raise typer.Exit(1)
 
 
-def get_puzzle_object(year: int, day: int) -> Puzzle | None:
+def get_memory_limit(memory_limit: str | None) -> int | None:
+    if memory_limit is None:
+        return None
+    try:
+        return parse_size(memory_limit)
+    except ValueError as e:
+        echo(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1) from None
+
+
+def profile_challenge(
+    year: int,
+    day: int,
+    test_data: bool,
+    data_dir: Path | None,
+    input_path: Path | None,
+    use_mmap: bool,
+    directory: Path,
+    top: int,
+    verbose: bool = False,
+):
+    module = import_challenge_module(year, day)
+    input_provider = get_input_provider(
+        year, day, test_data, data_dir, input_path, use_mmap
+    )
+    memo.reset_stats()
+    solutions, profiles = profiling.profile_challenge(
+        module.Challenge(input_provider=input_provider), directory
+    )
+    for profile in profiles:
+        echo(f"=== Phase {profile.name} ===", fg=typer.colors.BLUE)
+        typer.echo(profile.format_top(top))
+    for part, solution in solutions.items():
+        print(f"Day {day} - Part {part}: {solution}")
+    if verbose:
+        show_memo_stats()
+    echo(
+        "Profiles saved to "
+        + ", ".join(str(profile.pstats_path) for profile in profiles)
+        + ". Collapsed stacks for flame graphs are stored next to them "
+        "in .collapsed files."
+    )
+
+
+def line_profile_challenge(
+    year: int,
+    day: int,
+    test_data: bool,
+    data_dir: Path | None,
+    input_path: Path | None,
+    use_mmap: bool,
+    verbose: bool = False,
+):
+    module = import_challenge_module(year, day)
+    input_provider = get_input_provider(
+        year, day, test_data, data_dir, input_path, use_mmap
+    )
+    memo.reset_stats()
+    for profile in lineprof.profile_lines(
+        module.Challenge(input_provider=input_provider)
+    ):
+        echo(
+            f"=== Part {profile.part} ({format_duration(profile.seconds)}) ===",
+            fg=typer.colors.BLUE,
+        )
+        typer.echo(profile.format())
+        print(f"Day {day} - Part {profile.part}: {profile.solution}")
+    if verbose:
+        show_memo_stats()
+
+
+def get_puzzle_object(year: int, day: int) -> "Puzzle | None":
+    # aocd is imported only by commands talking to the Advent of Code website,
+    # because importing its HTTP stack slows down the start of every command
+    from aocd import AocdError
+    from aocd.models import Puzzle
+
     try:
         puzzle = Puzzle(year=year, day=day)
         return puzzle
@@ -105,6 +338,8 @@ def get_puzzle_object(year: int, day: int) -> Puzzle | None:
 
 
 def write_example_data(puzzle, test_input_data):
+    from aocd.exceptions import PuzzleLockedError
+
     try:
         test_input_data.write_text(puzzle.examples[0].input_data)
     except PuzzleLockedError:
@@ -115,6 +350,8 @@ def write_example_data(puzzle, test_input_data):
 
 
 def write_input_data(puzzle, real_input_data):
+    from aocd.exceptions import PuzzleLockedError
+
     try:
         real_input_data.write_text(puzzle.input_data)
     except PuzzleLockedError:
@@ -126,8 +363,19 @@ def write_input_data(puzzle, real_input_data):
 
 @app.command()
 def run(
-    day: Annotated[int, typer.Argument(..., help="Day of the challenge to run.")],
-    year: year_option = current_aoc_year,
+    day: Annotated[
+        typing.Optional[int],  # noqa: UP007
+        typer.Argument(help="Day of the challenge to run."),
+    ] = None,
+    year: Annotated[
+        str,
+        typer.Option(
+            "-y",
+            "--year",
+            help="Year for which to run the challenge. "
+            "With --all you can also pass 'all' to run every year.",
+        ),
+    ] = str(current_aoc_year),
     data_directory: Annotated[
         Path,
         typer.Option(
@@ -141,9 +389,507 @@ def run(
     test_data: bool = typer.Option(
         False, "--test-data", "-t", help="Run challenge also for test data."
     ),
+    run_all: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            help="Run all solved days in parallel. Only --timeout and --cpu-limit "
+            "limit the days.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        typing.Optional[int],  # noqa: UP007
+        typer.Option(
+            "--jobs", "-j", min=1, help="Number of processes used with --all."
+        ),
+    ] = None,
+    report: Annotated[
+        typing.Optional[Path],  # noqa: UP007
+        typer.Option(help="Path to a JSON report written with --all."),
+    ] = None,
+    use_mmap: Annotated[
+        bool,
+        typer.Option(
+            "--mmap",
+            help="Memory map the input file and decode lines lazily. "
+            "Useful for huge inputs.",
+        ),
+    ] = False,
+    no_cache: no_cache_option = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Profile input loading and each part separately with cProfile.",
+        ),
+    ] = False,
+    line_profile: Annotated[
+        bool,
+        typer.Option(
+            "--line-profile",
+            help="Show hits and time of each line of the challenge module "
+            "for each part.",
+        ),
+    ] = False,
+    profile_top: Annotated[
+        int, typer.Option(help="Number of functions shown for each profiled phase.")
+    ] = 20,
+    profile_directory: Annotated[
+        Path, typer.Option(help="Directory to which profiles are saved.")
+    ] = profiling.DEFAULT_PROFILE_DIRECTORY,
+    timings: Annotated[
+        bool,
+        typer.Option(
+            "--timings",
+            help="Show time spent on reading input, parsing and each part.",
+        ),
+    ] = False,
+    timings_log: Annotated[
+        typing.Optional[Path],  # noqa: UP007
+        typer.Option(help="File to which timings are appended as JSON lines."),
+    ] = None,
+    memory: memory_option = False,
+    memory_limit: memory_limit_option = None,
+    timeout: timeout_option = None,
+    cpu_limit: cpu_limit_option = None,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Show hits, misses and sizes of caches of memoized functions. "
+            "Parts solved from the result cache aren't included, use --no-cache. "
+            "Not available with --all nor with limits running parts in child "
+            "processes.",
+        ),
+    ] = False,
 ):
     """Run the challenge."""
-    run_challenge(year, day, test_data, data_directory, file)
+    if year != "all" and not year.isdigit():
+        echo(f"Invalid year {year}. Must be a number or 'all'.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    isolated = (
+        memory
+        or memory_limit is not None
+        or timeout is not None
+        or cpu_limit is not None
+    )
+    if verbose and (run_all or isolated):
+        echo(
+            "--verbose can't be used with --all, --memory, --memory-limit, "
+            "--timeout nor --cpu-limit, as parts run in other processes.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+    if run_all:
+        reject_options_of_single_day(
+            file=file is not None,
+            mmap=use_mmap,
+            memory=memory,
+            memory_limit=memory_limit is not None,
+            profile=profile,
+            line_profile=line_profile,
+            timings=timings,
+            timings_log=timings_log is not None,
+        )
+        run_all_challenges(
+            None if year == "all" else int(year),
+            test_data,
+            data_directory,
+            jobs,
+            report,
+            not no_cache,
+            timeout,
+            cpu_limit,
+        )
+        return
+    if day is None or year == "all":
+        echo(
+            "Provide a day and a year of the challenge or use --all.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+    if isolated:
+        run_challenge_isolated(
+            int(year),
+            day,
+            test_data,
+            data_directory,
+            file,
+            use_mmap,
+            get_memory_limit(memory_limit),
+            timeout,
+            cpu_limit,
+            memory or memory_limit is not None,
+        )
+        return
+    if line_profile:
+        line_profile_challenge(
+            int(year), day, test_data, data_directory, file, use_mmap, verbose
+        )
+        return
+    if profile:
+        profile_challenge(
+            int(year),
+            day,
+            test_data,
+            data_directory,
+            file,
+            use_mmap,
+            profile_directory,
+            profile_top,
+            verbose,
+        )
+        return
+    run_challenge(
+        int(year),
+        day,
+        test_data,
+        data_directory,
+        file,
+        use_mmap,
+        not no_cache,
+        timings,
+        timings_log,
+        verbose,
+    )
+
+
+def reject_options_of_single_day(**used: bool):
+    """Exit if options which --all doesn't support are used."""
+    names = [f"--{name.replace('_', '-')}" for name, value in used.items() if value]
+    if names:
+        echo(
+            f"{', '.join(names)} can't be used with --all.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+
+def run_all_challenges(
+    year: int | None,
+    test_data: bool,
+    data_dir: Path,
+    jobs: int | None,
+    report: Path | None,
+    use_cache: bool = True,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+):
+    from aoc import batch
+
+    locations = batch.discover_challenges(year)
+    if not locations:
+        echo("No solved days found.", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = batch.run_challenges(
+        locations, data_dir.absolute(), test_data, jobs, use_cache, timeout, cpu_limit
+    )
+    wall_time = time.perf_counter() - start
+
+    header = f"{'Year':>4} {'Day':>3}  {'Part 1':<20} {'Part 2':<20}"
+    echo(f"{header} {'Wall':>10} {'CPU':>10}")
+    for result in results:
+        if result.answers is None:
+            answers = f"{result.status.upper()} {result.error}"
+            fg = typer.colors.RED
+        else:
+            answers = f"{result.answers[0]!s:<20} {result.answers[1]!s:<20}"
+            fg = typer.colors.GREEN
+        echo(
+            f"{result.year:>4} {result.day:>3}  {answers} "
+            f"{format_duration(result.wall_time):>10} "
+            f"{format_duration(result.cpu_time):>10}",
+            fg=fg,
+        )
+    echo(
+        f"Ran {len(results)} days in {format_duration(wall_time)} using {jobs} jobs "
+        f"(total CPU time {format_duration(sum(r.cpu_time for r in results))}, "
+        f"{sum(r.cached_parts for r in results)} parts taken from cache)."
+    )
+    if report is not None:
+        batch.write_report(report, results, wall_time, jobs)
+        echo(f"Report written to {report}.")
+    if any(result.error for result in results):
+        raise typer.Exit(1)
+
+
+@app.command()
+def bench(
+    day: Annotated[int, typer.Argument(..., help="Day of the challenge to benchmark.")],
+    year: year_option = current_aoc_year,
+    data_directory: Annotated[
+        Path,
+        typer.Option(
+            help="Path to a directory with data. Will be used if you won't provide"
+            " --file/-f option"
+        ),
+    ] = Path("data"),
+    file: Annotated[
+        typing.Optional[Path],  # noqa: UP007
+        typer.Option(..., "--file", "-f", help="File to benchmark on."),
+    ] = None,
+    test_data: bool = typer.Option(
+        False, "--test-data", "-t", help="Benchmark challenge on test data."
+    ),
+    runs: Annotated[
+        int, typer.Option("--runs", "-n", min=1, help="Number of timed runs.")
+    ] = 10,
+    warmup: Annotated[
+        int, typer.Option(min=0, help="Number of untimed runs before timing.")
+    ] = 1,
+    history_file: Annotated[
+        Path, typer.Option(help="File to which benchmark results are appended.")
+    ] = benchmarking.DEFAULT_HISTORY_FILE,
+    compare: Annotated[
+        typing.Optional[str],  # noqa: UP007
+        typer.Option(
+            help="Git reference to compare with. Its results must be in the history."
+        ),
+    ] = None,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            help="Relative slowdown of the median that is reported as a regression."
+        ),
+    ] = 0.1,
+):
+    """Benchmark both parts of the challenge."""
+    baseline_commit = None
+    if compare is not None:
+        baseline_commit = benchmarking.get_git_commit(compare)
+        if baseline_commit is None:
+            echo(f"Could not resolve git reference {compare}.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+    history = benchmarking.load_history(history_file)
+
+    module = import_challenge_module(year, day)
+    challenge = module.Challenge(
+        input_provider=get_input_provider(year, day, test_data, data_directory, file)
+    )
+    commit = benchmarking.get_git_commit() or benchmarking.UNKNOWN_COMMIT
+    results = benchmarking.benchmark_challenge(challenge, commit, runs, warmup)
+    benchmarking.append_history(history_file, results)
+
+    regressions = 0
+    for result in results:
+        echo(
+            f"Day {result.day} - Part {result.part}: "
+            f"min {format_duration(result.minimum)}, "
+            f"median {format_duration(result.median)}, "
+            f"p95 {format_duration(result.p95)}, "
+            f"stddev {format_duration(result.stddev)} ({result.runs} runs)"
+        )
+        if baseline_commit is None:
+            continue
+        baseline = benchmarking.find_baseline(
+            history, result.year, result.day, result.part, baseline_commit
+        )
+        if baseline is None:
+            echo(
+                f"  No results for {compare} in {history_file}.",
+                fg=typer.colors.YELLOW,
+            )
+        elif benchmarking.is_regression(result, baseline, threshold):
+            regressions += 1
+            echo(
+                f"  REGRESSION: median {format_duration(result.median)} vs "
+                f"{format_duration(baseline.median)} at {compare}",
+                fg=typer.colors.RED,
+            )
+        else:
+            echo(f"  OK: median {format_duration(baseline.median)} at {compare}")
+    if regressions:
+        raise typer.Exit(1)
+
+
+@app.command()
+def scale(
+    day: Annotated[int, typer.Argument(..., help="Day of the challenge to scale.")],
+    year: year_option = current_aoc_year,
+    data_directory: Annotated[
+        Path,
+        typer.Option(
+            help="Path to a directory with data. Will be used if you won't provide"
+            " --file/-f option"
+        ),
+    ] = Path("data"),
+    file: Annotated[
+        typing.Optional[Path],  # noqa: UP007
+        typer.Option(..., "--file", "-f", help="File with the real input."),
+    ] = None,
+    test_data: bool = typer.Option(
+        False, "--test-data", "-t", help="Generate inputs from test data."
+    ),
+    generator: Annotated[
+        typing.Optional[str],  # noqa: UP007
+        typer.Option(
+            help="Default generator used instead of the generate_input() of the "
+            f"challenge: {', '.join(scaling.GENERATORS)}. "
+            "Without both, the real input is repeated."
+        ),
+    ] = None,
+    sizes: Annotated[
+        str, typer.Option(help="Comma separated sizes of generated inputs.")
+    ] = ",".join(map(str, scaling.DEFAULT_SIZES)),
+    runs: Annotated[
+        int, typer.Option(min=1, help="Number of runs at each size, the best counts.")
+    ] = 3,
+    memory: Annotated[
+        bool, typer.Option(help="Measure peak memory of each part with tracemalloc.")
+    ] = True,
+    max_slope: Annotated[
+        typing.Optional[float],  # noqa: UP007
+        typer.Option(help="Fail if time grows faster than n to this power."),
+    ] = None,
+    seed: Annotated[int, typer.Option(help="Seed of random generators.")] = 0,
+):
+    """
+    Run the challenge on generated inputs of growing sizes and estimate how its
+    time and memory grow with the size of the input.
+    """
+    try:
+        size_values = sorted({int(size) for size in sizes.split(",")})
+    except ValueError as e:
+        echo(f"Invalid sizes {sizes}.", fg=typer.colors.RED)
+        raise typer.Exit(1) from e
+    challenge_class = import_challenge_module(year, day).Challenge
+    if generator is None and challenge_class.defines_generate_input():
+        generate = challenge_class.generate_input
+    else:
+        generate = get_default_generator(
+            generator or "repeat",
+            get_input_provider(year, day, test_data, data_directory, file),
+        )
+    points = scaling.scale_challenge(
+        challenge_class, generate, size_values, runs=runs, memory=memory, seed=seed
+    )
+    show_scale_points(points)
+    if not show_scale_slopes(points, max_slope):
+        raise typer.Exit(1)
+
+
+def get_default_generator(
+    name: str, input_provider: InputProvider
+) -> typing.Callable[[int, random.Random], str]:
+    if (generator := scaling.GENERATORS.get(name)) is None:
+        echo(f"Unknown generator {name}.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    try:
+        text = input_provider.provide_input(None)
+    except FileNotFoundError as e:
+        echo(
+            f"{e} The challenge has no generate_input(size, rng) class method, "
+            "so inputs are generated from the real input.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1) from None
+    return functools.partial(generator, text)
+
+
+def show_scale_points(points: list[scaling.ScalePoint]):
+    echo(
+        f"{'size':>8} {'input':>10} {'part':>4} {'time':>10} {'memory':>10}",
+        fg=typer.colors.BLUE,
+    )
+    for point in points:
+        if point.error:
+            echo(
+                f"{point.size:>8} {format_size(point.input_size):>10} "
+                f"{point.part:>4} {point.error}",
+                fg=typer.colors.RED,
+            )
+            continue
+        peak_memory = (
+            "" if point.peak_memory is None else format_size(point.peak_memory)
+        )
+        echo(
+            f"{point.size:>8} {format_size(point.input_size):>10} {point.part:>4} "
+            f"{format_duration(point.seconds or 0.0):>10} {peak_memory:>10}"
+        )
+
+
+def show_scale_slopes(
+    points: list[scaling.ScalePoint], max_slope: float | None
+) -> bool:
+    """Show how time and memory grow. Return False if time grows too fast."""
+    ok = True
+    for part in (1, 2):
+        time_slope, memory_slope = scaling.get_slopes(points, part)
+        if time_slope is None:
+            continue
+        message = f"Part {part}: time ~ n^{time_slope:.2f}"
+        if memory_slope is not None:
+            message += f", memory ~ n^{memory_slope:.2f}"
+        message += " (n is the length of the input)"
+        fg = typer.colors.GREEN
+        if time_slope > scaling.SUPERLINEAR_SLOPE:
+            fg = typer.colors.YELLOW
+            message += ", superlinear"
+        if max_slope is not None and time_slope > max_slope:
+            fg = typer.colors.RED
+            ok = False
+        echo(message, fg=fg)
+    return ok
+
+
+@app.command(name="watch")
+def watch_challenge(
+    day: Annotated[int, typer.Argument(..., help="Day of the challenge to watch.")],
+    year: year_option = current_aoc_year,
+    data_directory: Annotated[
+        Path,
+        typer.Option(
+            help="Path to a directory with data. Will be used if you won't provide"
+            " --file/-f option"
+        ),
+    ] = Path("data"),
+    file: Annotated[
+        typing.Optional[Path],  # noqa: UP007
+        typer.Option(..., "--file", "-f", help="File to run."),
+    ] = None,
+    test_data: bool = typer.Option(
+        False, "--test-data", "-t", help="Run challenge on test data."
+    ),
+    poll_interval: Annotated[
+        float, typer.Option(help="Seconds between checks of changed files.")
+    ] = watch.DEFAULT_POLL_INTERVAL,
+):
+    """
+    Run the challenge whenever its code or input changes, keeping the process
+    and the input loaded and solving again only parts affected by the change.
+    """
+    import_challenge_module(year, day)
+    watcher = watch.Watcher(
+        get_challenge_module_name(year, day),
+        get_input_provider(year, day, test_data, data_directory, file),
+        poll_interval,
+    )
+    echo(f"Watching day {day}. Press Ctrl+C to stop.", fg=typer.colors.BLUE)
+    try:
+        while True:
+            try:
+                for result in watcher.solve():
+                    status = format_duration(result.seconds)
+                    if not result.solved:
+                        status = f"unchanged, {status}"
+                    echo(
+                        f"Day {day} - Part {result.part}: {result.solution} ({status})"
+                    )
+            except Exception:
+                echo(traceback.format_exc(), fg=typer.colors.RED)
+            while True:
+                try:
+                    changed = watcher.wait_for_changes()
+                    break
+                except Exception:
+                    echo(traceback.format_exc(), fg=typer.colors.RED)
+            names = ", ".join(sorted(path.name for path in changed))
+            echo(f"Changed: {names}", fg=typer.colors.BLUE)
+    except KeyboardInterrupt:
+        pass
 
 
 @app.command()
@@ -164,14 +910,46 @@ def verify(
         "-t",
         help="Only run test on sample data. Usefull for debugging.",
     ),
+    jobs: Annotated[
+        typing.Optional[int],  # noqa: UP007
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Verify days in parallel using a given number of processes.",
+        ),
+    ] = None,
+    no_cache: no_cache_option = False,
+    memory: memory_option = False,
+    memory_limit: memory_limit_option = None,
+    timeout: timeout_option = None,
+    cpu_limit: cpu_limit_option = None,
+    perf_tolerance: Annotated[
+        typing.Optional[float],  # noqa: UP007
+        typer.Option(
+            min=0,
+            help="Multiply runtime and memory budgets of tests by this factor, "
+            "e.g. 2 on a machine two times slower than the one setting budgets.",
+        ),
+    ] = None,
 ):
     """Verify the challenge."""
+    if no_cache:
+        os.environ["AOC_NO_CACHE"] = "1"  # read by tests of challenges
     pytest_args = ["-W", "ignore:Module already imported"][:2]
     pytest_args = []
+    if memory or memory_limit is not None:
+        pytest_args.append("-rP")  # show peak memory printed by passed tests
+    configure_sandbox(memory, memory_limit, timeout, cpu_limit)
+    if perf_tolerance is not None:
+        os.environ["AOC_PERF_TOLERANCE"] = str(perf_tolerance)  # read by tests
     if sample_data_only:
         pytest_args.extend(["-k", "sample_data"])
     if sum([part_one_only, part_two_only]) == 1:
         pytest_args.extend(["-k", "part_1" if part_one_only else "part_2"])
+    if jobs is not None:
+        verify_in_parallel(year, day, pytest_args, jobs)
+        return
     if day is not None:
         module = import_challenge_module(year, day)
         print(module.__file__)
@@ -187,9 +965,68 @@ def verify(
         del locals()["module"]
         pytest_args.append(module.__path__[0])
         print(pytest_args)
+    import pytest
+
     pytest.main(pytest_args)
 
 
+def configure_sandbox(
+    memory: bool,
+    memory_limit: str | None,
+    timeout: float | None,
+    cpu_limit: float | None,
+):
+    """Make tests of challenges run parts in child processes with the limits."""
+    get_memory_limit(memory_limit)  # validate before running tests
+    if memory:
+        os.environ["AOC_SANDBOX"] = "1"
+    for name, limit in [
+        ("AOC_MEMORY_LIMIT", memory_limit),
+        ("AOC_TIMEOUT", timeout),
+        ("AOC_CPU_LIMIT", cpu_limit),
+    ]:
+        if limit is not None:
+            os.environ[name] = str(limit)
+
+
+def verify_in_parallel(year: int, day: int | None, pytest_args: list[str], jobs: int):
+    from aoc import batch
+
+    locations = batch.discover_challenges(None if day is None else year)
+    if day is not None:
+        locations = [location for location in locations if location.day == day]
+    if not locations:
+        echo("No solved days found.", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+    start = time.perf_counter()
+    results = batch.verify_challenges(locations, pytest_args, jobs)
+    wall_time = time.perf_counter() - start
+
+    for result in results:
+        for test in result.outcomes:
+            if test.outcome in ("failed", "error"):
+                echo(f"{test.outcome.upper()} {test.nodeid}", fg=typer.colors.RED)
+                typer.echo(test.message)
+    for result in results:
+        failed = result.count("failed") + result.count("error")
+        echo(
+            f"{result.year} day {result.day:>2}: {result.count('passed')} passed, "
+            f"{failed} failed, {result.count('skipped')} skipped "
+            f"in {format_duration(result.wall_time)}",
+            fg=typer.colors.RED if failed or result.exit_code else typer.colors.GREEN,
+        )
+    outcomes = [test.outcome for result in results for test in result.outcomes]
+    failed = outcomes.count("failed") + outcomes.count("error")
+    echo(
+        f"{outcomes.count('passed')} passed, {failed} failed, "
+        f"{outcomes.count('skipped')} skipped in {format_duration(wall_time)} "
+        f"({len(results)} days, {jobs} jobs)",
+        fg=typer.colors.RED if failed else typer.colors.GREEN,
+    )
+    if failed or any(result.exit_code not in (0, 5) for result in results):
+        raise typer.Exit(1)
+
+
 def _check_type_of_part(part: str) -> TypeGuard[Literal["a", "b"]]:
     if part in ("a", "b"):
         return True
@@ -229,16 +1066,138 @@ def submit(
         help="Which part of the solution to submit. "
         "You can use numbers 1/2 or letters a/b."
     ),
+    data_directory: Annotated[
+        Path,
+        typer.Option(help="Path to a directory with data."),
+    ] = Path("data"),
+    no_cache: no_cache_option = False,
 ):
     validated_part = _full_validate(part)
     module = import_challenge_module(year, day)
-    if validated_part == "a":
-        solution = module.Challenge(use_test_data=False).part_1()
-    else:
-        solution = module.Challenge(use_test_data=False).part_2()
+    challenge = module.Challenge(
+        SmartFileInputProvider(year=year, day=day, data_dir=data_directory),
+        result_cache=None if no_cache else get_result_cache(),
+    )
+    solution = challenge.solve_part(1 if validated_part == "a" else 2)
+    import aocd
+
     aocd.submit(solution, day=day, year=year, part=validated_part)
 
 
+@app.command()
+def startup_report(
+    top: Annotated[int, typer.Option(help="Number of slowest imports shown.")] = 15,
+):
+    """Show how long it takes to import the CLI and which imports are the slowest."""
+    from aoc import startup
+
+    timings = startup.measure_imports("aoc.main")
+    echo(
+        f"Importing aoc.main took {format_duration(timings[-1].cumulative)} "
+        f"({len(timings)} modules).",
+        fg=typer.colors.BLUE,
+    )
+    typer.echo(f"{'module':<40} {'self':>10} {'cumulative':>10}")
+    for timing in sorted(timings[:-1], key=lambda t: t.cumulative, reverse=True)[:top]:
+        typer.echo(
+            f"{timing.module:<40} {format_duration(timing.own):>10} "
+            f"{format_duration(timing.cumulative):>10}"
+        )
+
+
+cache_app = typer.Typer(
+    no_args_is_help=True, help="Manage caches of parsed inputs and results."
+)
+app.add_typer(cache_app, name="cache")
+CACHE_NAMES = ("parse", "results")
+
+
+@cache_app.command("stats")
+def cache_stats():
+    """Show the size of caches."""
+    for name in CACHE_NAMES:
+        stats = DiskCache(get_cache_directory() / name).stats()
+        echo(
+            f"{name}: {stats.entries} entries, {format_size(stats.size)} "
+            f"(limit {format_size(stats.max_size)})"
+        )
+
+
+@cache_app.command("clear")
+def cache_clear():
+    """Remove all cached parsed inputs and results."""
+    for name in CACHE_NAMES:
+        DiskCache(get_cache_directory() / name).clear()
+    echo("Caches cleared.")
+
+
+@app.command(name="fetch")
+def fetch_data(
+    year: year_option = current_aoc_year,
+    days: Annotated[
+        str, typer.Option(help="Days to download, e.g. 1-25 or 1,3,5-7.")
+    ] = "1-25",
+    data_directory: Annotated[
+        Path,
+        typer.Option(help="Path to a directory with data."),
+    ] = Path("data"),
+    jobs: Annotated[
+        typing.Optional[int],  # noqa: UP007
+        typer.Option(
+            "--jobs", "-j", min=1, help="Number of parallel downloads, 4 by default."
+        ),
+    ] = None,
+    rate: Annotated[
+        typing.Optional[float],  # noqa: UP007
+        typer.Option(help="Maximum number of requests per second, 5 by default."),
+    ] = None,
+    examples: Annotated[
+        bool, typer.Option(help="Download also examples to test input files.")
+    ] = True,
+    base_url: Annotated[
+        typing.Optional[str],  # noqa: UP007
+        typer.Option(help="URL of the Advent of Code website."),
+    ] = None,
+):
+    """Download inputs and examples of many days at once, skipping existing files."""
+    # urllib, http.client and ssl are imported only by this command
+    from aoc import fetch
+
+    try:
+        day_numbers = fetch.parse_days(days)
+    except ValueError as e:
+        echo(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1) from e
+    client = fetch.HttpPuzzleClient(
+        fetch.get_session_token(),
+        base_url or fetch.DEFAULT_BASE_URL,
+        fetch.DEFAULT_RATE if rate is None else rate,
+    )
+    kinds = (fetch.INPUT, fetch.EXAMPLE) if examples else (fetch.INPUT,)
+    start = time.perf_counter()
+    results = fetch.fetch_days(
+        client, year, day_numbers, data_directory, jobs or fetch.DEFAULT_JOBS, kinds
+    )
+    colors = {
+        fetch.DOWNLOADED: typer.colors.GREEN,
+        fetch.SKIPPED: typer.colors.BLUE,
+        fetch.UNAVAILABLE: typer.colors.YELLOW,
+        fetch.FAILED: typer.colors.RED,
+    }
+    for result in results:
+        message = f"Day {result.day:>2} {result.kind:<7} {result.status}"
+        if result.error:
+            message += f": {result.error}"
+        echo(message, fg=colors[result.status])
+    downloaded = sum(result.status == fetch.DOWNLOADED for result in results)
+    echo(
+        f"Downloaded {downloaded} files in "
+        f"{format_duration(time.perf_counter() - start)}."
+    )
+    if any(result.status == fetch.FAILED for result in results):
+        raise typer.Exit(1)
+
+
 @app.command()
 def new_day(
     day: Annotated[int, typer.Argument(help="Day for which to create a directory.")],
@@ -0,0 +1,272 @@
+import functools
+import inspect
+import types
+import weakref
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar, cast
+
+R = TypeVar("R")
+
+LRU = "lru"
+FIFO = "fifo"
+POLICIES = (LRU, FIFO)
+
+_KWARGS_MARK = object()
+
+
+@dataclass
+class MemoStats:
+    """Counters of a memoized function, summed over all its instances."""
+
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    peak_size: int = 0
+    max_size: int | None = None
+
+    @property
+    def calls(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.calls if self.calls else 0.0
+
+    def reset(self):
+        self.hits = self.misses = self.evictions = self.peak_size = 0
+
+    def format(self) -> str:
+        text = (
+            f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate), "
+            f"peak size {self.peak_size}"
+        )
+        if self.max_size is not None:
+            text += f" of {self.max_size}, {self.evictions} evictions"
+        return text
+
+
+# stats are kept by the qualified name, so functions defined inside parts, which
+# are created again on each call, add up to one entry which outlives them
+_stats: dict[str, MemoStats] = {}
+_instances: "weakref.WeakSet[Memoized]" = weakref.WeakSet()
+_cleared_between_parts: "weakref.WeakSet[Memoized]" = weakref.WeakSet()
+
+
+def _make_key(args: tuple, kwargs: dict[str, Any]) -> Hashable:
+    if kwargs:
+        return (*args, _KWARGS_MARK, *kwargs.items())
+    return args
+
+
+def _pack_key(args: tuple, kwargs: dict[str, Any]) -> Hashable:
+    """
+    Return integer arguments packed into bytes, which take less than half of the
+    memory of a tuple of ints. Other arguments are kept as a tuple.
+    """
+    if not kwargs:
+        try:
+            return array("q", args).tobytes()
+        except (TypeError, OverflowError):
+            pass
+    return _make_key(args, kwargs)
+
+
+class Memoized(Generic[R]):
+    """Function caching its results, see memoize()."""
+
+    def __init__(
+        self,
+        func: Callable[..., R],
+        max_size: int | None = None,
+        policy: str = LRU,
+        pack: bool = False,
+        clear_between_parts: bool = False,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, use one of {POLICIES}.")
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        functools.update_wrapper(self, func)
+        self.func: Callable[..., Any] = func
+        self.max_size = max_size
+        self._lru = policy == LRU and max_size is not None
+        self._cache: dict[Hashable, R] = OrderedDict() if self._lru else {}
+        self._make_key = _pack_key if pack else _make_key
+        name = f"{func.__module__}.{func.__qualname__}"
+        self.stats = _stats.setdefault(name, MemoStats(name))
+        self.stats.max_size = max_size
+        _instances.add(self)
+        if clear_between_parts:
+            _cleared_between_parts.add(self)
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        # decorated methods are cached together with the instance, as by functools
+        return self if instance is None else types.MethodType(self, instance)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, R | None]:
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self.stats.misses += 1
+            return False, None
+        self.stats.hits += 1
+        if self._lru:
+            self._cache.move_to_end(key)  # type: ignore[attr-defined]
+        return True, value
+
+    def _store(self, key: Hashable, value: R):
+        self._cache[key] = value
+        if self.max_size is not None and len(self._cache) > self.max_size:
+            # dicts keep insertion order, LRU moves used keys to the end
+            del self._cache[next(iter(self._cache))]
+            self.stats.evictions += 1
+        self.stats.peak_size = max(self.stats.peak_size, len(self._cache))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        key = self._make_key(args, kwargs)
+        found, value = self._lookup(key)
+        if not found:
+            value = self.func(*args, **kwargs)
+            self._store(key, value)
+        return value  # type: ignore[return-value]
+
+    def cache_clear(self):
+        self._cache.clear()
+
+    def cache_size(self) -> int:
+        return len(self._cache)
+
+
+class DynamicProgram(Memoized[R]):
+    """Memoized generator function evaluated with an explicit stack, see dp()."""
+
+    def __init__(self, func: Callable[..., Generator[Any, R, R]], **options: Any):
+        if not inspect.isgeneratorfunction(func):
+            raise TypeError("dp() needs a generator function yielding subproblems.")
+        super().__init__(cast(Callable[..., R], func), **options)
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is not None:
+            raise TypeError("dp() can't decorate methods, use a function instead.")
+        return self
+
+    def __call__(self, *args: Any) -> R:
+        key = self._make_key(args, {})
+        found, value = self._lookup(key)
+        if found:
+            return value  # type: ignore[return-value]
+        stack = [(key, self.func(*args))]
+        active = {key}
+        sent: Any = None
+        while stack:
+            key, subproblem = stack[-1]
+            try:
+                requested = subproblem.send(sent)
+            except StopIteration as result:
+                stack.pop()
+                active.discard(key)
+                sent = result.value
+                self._store(key, sent)
+                continue
+            if not isinstance(requested, tuple):
+                raise TypeError(
+                    f"{self.func.__qualname__} must yield tuples of arguments, "
+                    f"got {requested!r}."
+                )
+            requested_key = self._make_key(requested, {})
+            found, sent = self._lookup(requested_key)
+            if not found:
+                if requested_key in active:
+                    raise ValueError(
+                        f"{self.func.__qualname__}{requested} depends on itself."
+                    )
+                stack.append((requested_key, self.func(*requested)))
+                active.add(requested_key)
+        return cast(R, sent)
+
+
+def memoize(
+    func: Callable[..., R] | None = None,
+    *,
+    max_size: int | None = None,
+    policy: str = LRU,
+    pack: bool = False,
+    clear_between_parts: bool = False,
+) -> Any:
+    """
+    Cache results of the function, like functools.cache, but with statistics
+    shown by `aoc run --verbose`:
+
+        @memoize(max_size=100_000, pack=True)
+        def arrangements(position: int, group: int) -> int: ...
+
+    With max_size the cache keeps at most that many results, evicting the least
+    recently used one (policy="lru") or the oldest one (policy="fifo"). With
+    pack=True keys made only of ints are packed into bytes to save memory. With
+    clear_between_parts=True the cache is cleared after each part.
+    """
+    decorate = functools.partial(
+        Memoized,
+        max_size=max_size,
+        policy=policy,
+        pack=pack,
+        clear_between_parts=clear_between_parts,
+    )
+    return decorate if func is None else decorate(func)
+
+
+def dp(
+    func: Callable[..., Generator[Any, Any, R]] | None = None,
+    *,
+    max_size: int | None = None,
+    policy: str = LRU,
+    pack: bool = False,
+    clear_between_parts: bool = False,
+) -> Any:
+    """
+    Turn a recursive definition into a memoized function evaluated with an
+    explicit stack, so it isn't limited by the recursion limit. The function
+    yields tuples of arguments of subproblems and receives their values:
+
+        @dp
+        def paths(x: int, y: int):
+            if x == 0 or y == 0:
+                return 1
+            return (yield (x - 1, y)) + (yield (x, y - 1))
+
+    Options are the same as of memoize().
+    """
+    decorate = functools.partial(
+        DynamicProgram,
+        max_size=max_size,
+        policy=policy,
+        pack=pack,
+        clear_between_parts=clear_between_parts,
+    )
+    return decorate if func is None else decorate(func)
+
+
+def get_stats() -> list[MemoStats]:
+    """Return stats of memoized functions called since the last reset_stats()."""
+    return [stats for stats in _stats.values() if stats.calls]
+
+
+def reset_stats():
+    for stats in _stats.values():
+        stats.reset()
+
+
+def clear_caches():
+    """Clear caches of all memoized functions, e.g. between benchmark runs."""
+    for memoized in list(_instances):
+        memoized.cache_clear()
+
+
+def clear_part_caches():
+    """Clear caches of functions memoized with clear_between_parts=True."""
+    for memoized in list(_cleared_between_parts):
+        memoized.cache_clear()
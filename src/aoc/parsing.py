@@ -0,0 +1,114 @@
+import functools
+import re
+from array import array
+from typing import Any
+
+_SIGNED_INT = r"-?\d+"
+_UNSIGNED_INT = r"\d+"
+_DIGITS = frozenset(b"0123456789")
+# tables replacing all bytes that can't be a part of a number with spaces
+_SIGNED_TABLE = bytes(c if c in _DIGITS or c == ord("-") else 32 for c in range(256))
+_UNSIGNED_TABLE = bytes(c if c in _DIGITS else 32 for c in range(256))
+
+
+@functools.cache
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Return the compiled pattern, compiling each pattern only once."""
+    return re.compile(pattern, flags)
+
+
+def _parse_ints(data: bytes, signed: bool) -> array:
+    # bytes.translate and split run in C, which is several times faster than
+    # a regex, the regex is needed only for minus signs that aren't signs, e.g. 3-5
+    tokens = data.translate(_SIGNED_TABLE if signed else _UNSIGNED_TABLE).split()
+    try:
+        return array("q", map(int, tokens))
+    except ValueError:
+        pattern = compile_pattern(_SIGNED_INT)
+        return array("q", map(int, pattern.findall(data.decode("ascii", "replace"))))
+
+
+def _parse_ints_numpy(data: bytes, signed: bool) -> Any:
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("as_numpy=True requires NumPy to be installed.") from None
+    characters = np.frombuffer(data, dtype=np.uint8)
+    digits = characters - ord("0")
+    is_digit = np.concatenate(([False], digits < 10, [False]))
+    edges = np.flatnonzero(is_digit[1:] != is_digit[:-1])
+    starts, lengths = edges[::2], edges[1::2] - edges[::2]
+    # numbers are built digit by digit, all of them at once
+    values = np.zeros(len(starts), dtype=np.int64)
+    last = len(digits) - 1
+    for i in range(int(lengths.max(initial=0))):
+        digit = digits[np.minimum(starts + i, last)]
+        values = np.where(lengths > i, values * 10 + digit, values)
+    if signed:
+        negative = (characters[np.maximum(starts - 1, 0)] == ord("-")) & (starts > 0)
+        values[negative] *= -1
+    return values
+
+
+def ints(text: str, signed: bool = True, as_numpy: bool = False) -> Any:
+    """
+    Return all integers in the text as array('q') or as a NumPy array. With
+    signed=False a minus is never a part of a number, e.g. in 3-5.
+    """
+    if as_numpy:
+        return _parse_ints_numpy(text.encode(), signed)
+    return _parse_ints(text.encode(), signed)
+
+
+def ints_by_line(text: str, signed: bool = True) -> list[array]:
+    """Return integers of each line of the text."""
+    return [_parse_ints(line, signed) for line in text.encode().splitlines()]
+
+
+def int_matrix(text: str, signed: bool = True) -> Any:
+    """Return a 2D NumPy array of integers of lines with equal numbers of them."""
+    rows = len(text.strip().splitlines())
+    values = ints(text, signed, as_numpy=True)
+    if rows and len(values) % rows:
+        raise ValueError("All lines must have the same number of integers.")
+    return values.reshape(rows, -1)
+
+
+def sections(text: str) -> list[str]:
+    """Return paragraphs of the text, i.e. parts separated by blank lines."""
+    return compile_pattern(r"\n[ \t]*\n").split(text.strip("\n"))
+
+
+def fixed_width(text: str, width: int, step: int | None = None) -> list[list[str]]:
+    """
+    Return cells of each line, width characters long and starting every step
+    characters (by default every width characters), e.g. "[A] [B]" with width 3
+    and step 4. Missing cells of short lines are empty.
+    """
+    step = step or width
+    lines = text.splitlines()
+    columns = -(-max(map(len, lines), default=0) // step)
+    return [
+        [line[i * step : i * step + width] for i in range(columns)] for line in lines
+    ]
+
+
+def column_blocks(text: str) -> list[list[str]]:
+    """
+    Split lines into blocks of columns separated by columns of spaces only and
+    return lines of each block.
+    """
+    lines = text.splitlines()
+    width = max(map(len, lines), default=0)
+    lines = [line.ljust(width) for line in lines]
+    blank = [not column.strip() for column in map("".join, zip(*lines, strict=True))]
+    blocks = []
+    start = None
+    for x in range(width + 1):
+        if x < width and not blank[x]:
+            if start is None:
+                start = x
+        elif start is not None:
+            blocks.append([line[start:x] for line in lines])
+            start = None
+    return blocks
@@ -0,0 +1,136 @@
+import cProfile
+import io
+import pstats
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aoc.base import BaseChallenge
+
+DEFAULT_PROFILE_DIRECTORY = Path(".aoc/profiles")
+# paths of a call graph contributing less than that (in seconds) are skipped
+_MIN_STACK_TIME = 1e-6
+
+FunctionKey = tuple[str, int, str]
+
+
+@dataclass
+class PhaseProfile:
+    """Profile of a single phase of running a challenge, e.g. reading input."""
+
+    name: str
+    stats: pstats.Stats
+    pstats_path: Path
+    collapsed_path: Path
+
+    def format_top(self, limit: int) -> str:
+        stream = io.StringIO()
+        self.stats.stream = stream  # type: ignore[attr-defined]
+        self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return stream.getvalue()
+
+
+def _get_label(function: FunctionKey) -> str:
+    filename, line, name = function
+    if filename == "~":  # built-in function
+        return name.replace(";", ":")
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ":")
+
+
+def get_collapsed_stacks(stats: pstats.Stats, root: str) -> dict[str, float]:
+    """
+    Return own time (in seconds) of each call stack reconstructed from the call
+    graph of the profile. cProfile keeps only caller-callee pairs, so time of
+    functions called from multiple stacks is split proportionally.
+    """
+    entries: dict[FunctionKey, Any] = stats.stats  # type: ignore[attr-defined]
+    children: dict[FunctionKey, dict[FunctionKey, Any]] = defaultdict(dict)
+    for function, (*_, callers) in entries.items():
+        for caller, edge in callers.items():
+            children[caller][function] = edge
+    stacks: dict[str, float] = defaultdict(float)
+
+    def visit(function: FunctionKey, stack: tuple[str, ...], own_time: float, scale):
+        stack = (*stack, _get_label(function))
+        stacks[";".join(stack)] += own_time
+        for child, (_, _, edge_own_time, edge_total_time, *_) in children[
+            function
+        ].items():
+            child_total_time = entries[child][3]
+            if child_total_time <= 0 or edge_total_time * scale < _MIN_STACK_TIME:
+                continue
+            if _get_label(child) in stack:  # recursive calls are already counted
+                continue
+            visit(
+                child,
+                stack,
+                edge_own_time * scale,
+                scale * edge_total_time / child_total_time,
+            )
+
+    for function, (_, _, own_time, _, callers) in entries.items():
+        if function[2].startswith("<method 'disable' of '_lsprof.Profiler"):
+            continue
+        if not any(caller in entries for caller in callers):
+            visit(function, (root,), own_time, 1.0)
+    return {stack: time for stack, time in stacks.items() if time > 0}
+
+
+def write_collapsed_stacks(path: Path, stacks: dict[str, float]):
+    """Write stacks in the format consumed by flamegraph.pl and speedscope."""
+    with path.open("w") as file:
+        for stack, time in sorted(stacks.items()):
+            if (microseconds := round(time * 1e6)) > 0:
+                file.write(f"{stack} {microseconds}\n")
+
+
+def _call_profiled(profiler: cProfile.Profile, func: Callable[..., Any], *args) -> Any:
+    profiler.enable()
+    try:
+        return func(*args)
+    finally:
+        profiler.disable()
+
+
+def profile_challenge(
+    challenge: BaseChallenge, directory: Path, parts: Iterable[int] = (1, 2)
+) -> tuple[dict[int, Any], list[PhaseProfile]]:
+    """
+    Solve the given parts of a challenge under cProfile. Loading input, parsing it
+    and each of the parts are profiled separately. Result cache is not used.
+    """
+    profilers: dict[str, cProfile.Profile] = defaultdict(cProfile.Profile)
+    solutions = {}
+    for part in parts:
+        if not challenge.streaming:
+            _call_profiled(profilers["input"], challenge.get_input_lines, part)
+        part_input = _call_profiled(
+            profilers["parse" if challenge.defines_parse() else "input"],
+            challenge.get_part_input,
+            part,
+        )
+        solutions[part] = _call_profiled(
+            profilers[f"part_{part}"],
+            challenge.part_1 if part == 1 else challenge.part_2,
+            part_input,
+        )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    prefix = f"{challenge.year}_day_{challenge.day:02}"
+    profiles = []
+    for name, profiler in profilers.items():
+        stats = pstats.Stats(profiler)
+        profile = PhaseProfile(
+            name,
+            stats,
+            directory / f"{prefix}_{name}.pstats",
+            directory / f"{prefix}_{name}.collapsed",
+        )
+        stats.dump_stats(profile.pstats_path)
+        write_collapsed_stacks(
+            profile.collapsed_path, get_collapsed_stacks(stats, f"{prefix}_{name}")
+        )
+        profiles.append(profile)
+    return solutions, profiles
@@ -0,0 +1,194 @@
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+
+Interval = tuple[int, int]
+Piece = tuple[int, int, int]
+
+
+def _normalize(intervals: Iterable[Interval]) -> list[Interval]:
+    """Return sorted intervals with overlapping and adjacent ones merged."""
+    merged: list[Interval] = []
+    for start, stop in sorted(
+        interval for interval in intervals if interval[0] < interval[1]
+    ):
+        if merged and start <= merged[-1][1]:
+            if stop > merged[-1][1]:
+                merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+class IntervalSet:
+    """
+    Set of integers stored as sorted, disjoint half-open intervals [start, stop).
+    Operations take time depending on the number of intervals, not on their sizes.
+    """
+
+    __slots__ = ("intervals",)
+
+    def __init__(self, intervals: Iterable[Interval | range] = ()):
+        self.intervals = _normalize(
+            (interval.start, interval.stop) if isinstance(interval, range) else interval
+            for interval in intervals
+        )
+
+    @classmethod
+    def _from_normalized(cls, intervals: list[Interval]) -> "IntervalSet":
+        interval_set = cls()
+        interval_set.intervals = intervals
+        return interval_set
+
+    @property
+    def size(self) -> int:
+        """Return the number of integers in the set."""
+        return sum(stop - start for start, stop in self.intervals)
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int):
+            return False
+        i = bisect_right(self.intervals, (value, float("inf"))) - 1
+        return i >= 0 and value < self.intervals[i][1]
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet(self.intervals + other.intervals)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        result = []
+        i = j = 0
+        a, b = self.intervals, other.intervals
+        while i < len(a) and j < len(b):
+            start, stop = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+            if start < stop:
+                result.append((start, stop))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_normalized(result)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        result = []
+        removed = other.intervals
+        j = 0
+        for start, stop in self.intervals:
+            while j < len(removed) and removed[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(removed) and removed[k][0] < stop:
+                if removed[k][0] > start:
+                    result.append((start, removed[k][0]))
+                start = max(start, removed[k][1])
+                k += 1
+            if start < stop:
+                result.append((start, stop))
+        return IntervalSet._from_normalized(result)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.intervals})"
+
+
+class RangeMap:
+    """
+    Piecewise mapping of integers, shifting each of disjoint half-open ranges
+    [start, stop) by its offset. Values outside of all ranges map to themselves.
+    """
+
+    __slots__ = ("pieces", "_starts")
+
+    def __init__(self, pieces: Iterable[Piece] = ()):
+        self.pieces = sorted(piece for piece in pieces if piece[0] < piece[1])
+        for (_, stop, _), (start, _, _) in zip(
+            self.pieces, self.pieces[1:], strict=False
+        ):
+            if start < stop:
+                raise ValueError("Ranges of a RangeMap must not overlap.")
+        self._starts = [start for start, _, _ in self.pieces]
+
+    @classmethod
+    def from_triples(cls, triples: Iterable[tuple[int, int, int]]) -> "RangeMap":
+        """Create a map from (destination start, source start, length) triples."""
+        return cls(
+            (source, source + length, destination - source)
+            for destination, source, length in triples
+        )
+
+    def __call__(self, value: int) -> int:
+        i = bisect_right(self._starts, value) - 1
+        if i >= 0 and value < self.pieces[i][1]:
+            return value + self.pieces[i][2]
+        return value
+
+    def split(self, values: IntervalSet | Iterable[Interval]) -> list[Piece]:
+        """
+        Split intervals at boundaries of ranges of this map and return the parts
+        with offsets by which they are shifted (0 for unmapped parts).
+        """
+        result = []
+        pieces = self.pieces
+        for start, stop in values:
+            i = max(bisect_right(self._starts, start) - 1, 0)
+            while start < stop:
+                if i < len(pieces) and pieces[i][1] <= start:
+                    i += 1
+                    continue
+                if i == len(pieces) or start < pieces[i][0]:  # unmapped gap
+                    end = stop if i == len(pieces) else min(stop, pieces[i][0])
+                    result.append((start, end, 0))
+                else:
+                    end = min(stop, pieces[i][1])
+                    result.append((start, end, pieces[i][2]))
+                start = end
+        return result
+
+    def apply(self, values: IntervalSet) -> IntervalSet:
+        """Return the image of the set of values."""
+        return IntervalSet(
+            (start + offset, stop + offset)
+            for start, stop, offset in self.split(values)
+        )
+
+    def compose(self, then: "RangeMap") -> "RangeMap":
+        """Return the map applying this map first and then the other one."""
+        boundaries = sorted(
+            {value for start, stop, _ in self.pieces for value in (start, stop)}
+            | {value for start, stop, _ in then.pieces for value in (start, stop)}
+        )
+        elementary = zip(boundaries, boundaries[1:], strict=False)
+        pieces: list[Piece] = []
+        for start, stop, offset in self.split(elementary):
+            for image_start, image_stop, then_offset in then.split(
+                [(start + offset, stop + offset)]
+            ):
+                total = offset + then_offset
+                piece_start, piece_stop = image_start - offset, image_stop - offset
+                if not total:
+                    continue
+                if pieces and pieces[-1][1] == piece_start and pieces[-1][2] == total:
+                    pieces[-1] = (pieces[-1][0], piece_stop, total)
+                else:
+                    pieces.append((piece_start, piece_stop, total))
+        return RangeMap(pieces)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RangeMap):
+            return NotImplemented
+        return self.pieces == other.pieces
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.pieces})"
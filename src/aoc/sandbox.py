@@ -0,0 +1,301 @@
+import contextlib
+import faulthandler
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+import traceback
+import tracemalloc
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import IO, Any, cast
+
+from aoc.base import BaseChallenge
+from aoc.bench import get_input_factory
+from aoc.formatting import format_duration, format_size, parse_size
+
+OK = "ok"
+MEMORY_EXCEEDED = "memory limit exceeded"
+TIMEOUT = "timeout"
+ERROR = "error"
+# time the child gets to dump its stack before it's killed
+_STACK_DUMP_GRACE = 0.2
+
+
+class CpuTimeExceeded(BaseException):
+    """Raised in a child process when its part used up the CPU time limit."""
+
+
+@dataclass
+class PartOutcome:
+    """Result and resource usage of a part run in a child process."""
+
+    part: int
+    status: str = OK
+    solution: Any = None
+    wall_time: float = 0.0
+    # time spent in the part itself, without loading and parsing the input
+    part_time: float = 0.0
+    # memory allocated by the part at peak, None if it wasn't traced
+    peak_traced: int | None = None
+    peak_rss: int = 0
+    error: str | None = None
+    # stack of the child when it was stopped because of a limit
+    stack: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+    def format_usage(self) -> str:
+        usage = f"peak RSS {format_size(self.peak_rss)}"
+        if self.peak_traced is None:
+            return usage
+        return f"peak traced {format_size(self.peak_traced)}, {usage}"
+
+
+def is_enabled() -> bool:
+    """Return True if parts should be run in isolation, set with AOC_SANDBOX."""
+    return bool(os.environ.get("AOC_SANDBOX")) or any(
+        limit is not None
+        for limit in (get_memory_limit(), get_timeout(), get_cpu_limit())
+    )
+
+
+def is_memory_traced() -> bool:
+    """
+    Return True if memory allocated by parts should be traced, which is set with
+    AOC_SANDBOX or AOC_MEMORY_LIMIT.
+    """
+    return bool(os.environ.get("AOC_SANDBOX")) or get_memory_limit() is not None
+
+
+def get_memory_limit() -> int | None:
+    """Return the memory limit of a part set with AOC_MEMORY_LIMIT, e.g. 2GiB."""
+    if limit := os.environ.get("AOC_MEMORY_LIMIT"):
+        return parse_size(limit)
+    return None
+
+
+def get_timeout() -> float | None:
+    """Return the wall-clock timeout of a part in seconds set with AOC_TIMEOUT."""
+    if timeout := os.environ.get("AOC_TIMEOUT"):
+        return float(timeout)
+    return None
+
+
+def get_cpu_limit() -> float | None:
+    """Return the CPU time limit of a part in seconds set with AOC_CPU_LIMIT."""
+    if limit := os.environ.get("AOC_CPU_LIMIT"):
+        return float(limit)
+    return None
+
+
+def _get_address_space() -> int:
+    """Return the virtual memory size of this process or 0 if it's unknown."""
+    import resource
+
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[0])
+    except OSError:
+        return 0
+    return pages * resource.getpagesize()
+
+
+def _get_peak_rss() -> int:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # KiB on Linux
+
+
+def _raise_cpu_time_exceeded(signum, frame):
+    raise CpuTimeExceeded
+
+
+def _limit_cpu_time(cpu_limit: float):
+    """Make the kernel send SIGXCPU after cpu_limit more seconds and kill later."""
+    import resource
+
+    used = time.process_time()
+    soft = math.ceil(used + cpu_limit)  # the limit is in whole seconds
+    signal.signal(signal.SIGXCPU, _raise_cpu_time_exceeded)
+    # SIGKILL one second later stops also code which doesn't return to Python
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + 1))
+
+
+def _trace_part(challenge: BaseChallenge, part: int, sender: Connection):
+    """
+    Run the part on the input loaded and parsed beforehand and send memory it
+    allocated at peak. Errors were already reported by the timed run.
+    """
+    func = challenge.part_1 if part == 1 else challenge.part_2
+    part_input = get_input_factory(challenge, part)()
+    tracemalloc.start()
+    with contextlib.suppress(Exception):
+        func(part_input)
+    sender.send(tracemalloc.get_traced_memory()[1])
+
+
+def _run_part(
+    challenge: BaseChallenge,
+    part: int,
+    memory_limit: int | None,
+    cpu_limit: float | None,
+    use_cache: bool,
+    stack_file: IO[bytes],
+    sender: Connection,
+):
+    import resource
+
+    faulthandler.register(signal.SIGUSR1, file=stack_file, all_threads=True)
+    outcome = PartOutcome(part)
+    soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    if memory_limit is not None:
+        # the limit applies to memory allocated on top of the interpreter itself
+        resource.setrlimit(
+            resource.RLIMIT_AS, (_get_address_space() + memory_limit, hard_limit)
+        )
+    if cpu_limit is not None:
+        _limit_cpu_time(cpu_limit)
+    result_cache = challenge.result_cache if use_cache else None
+    hits = result_cache.hits if result_cache is not None else 0
+    part_time = challenge.timings.get_seconds(f"part_{part}")
+    start = time.perf_counter()
+    try:
+        if use_cache:
+            outcome.solution = challenge.solve_part(part)
+        else:
+            outcome.solution = challenge._solve_part(part)
+        outcome.wall_time = time.perf_counter() - start
+        outcome.part_time = challenge.timings.get_seconds(f"part_{part}") - part_time
+    except MemoryError:
+        outcome.status = MEMORY_EXCEEDED
+        outcome.error = (
+            f"Part {part} exceeded the memory limit of {format_size(memory_limit or 0)}"
+        )
+    except CpuTimeExceeded:
+        outcome.status = TIMEOUT
+        outcome.error = (
+            f"Part {part} exceeded the CPU time limit of "
+            f"{format_duration(cpu_limit or 0)}"
+        )
+        outcome.stack = traceback.format_exc()
+    except Exception:
+        outcome.status = ERROR
+        outcome.error = traceback.format_exc()
+    if not outcome.ok:
+        outcome.wall_time = time.perf_counter() - start
+    resource.setrlimit(resource.RLIMIT_AS, (soft_limit, hard_limit))
+    outcome.peak_rss = _get_peak_rss()
+    outcome.cached = result_cache is not None and result_cache.hits > hits
+    try:
+        sender.send(outcome)
+    except Exception:  # the solution can't be pickled
+        outcome.solution = repr(outcome.solution)
+        sender.send(outcome)
+
+
+def _stop(process: BaseProcess, stack_file: IO[bytes]) -> str:
+    """Kill the process and return its stack dumped right before."""
+    os.kill(cast(int, process.pid), signal.SIGUSR1)
+    process.join(_STACK_DUMP_GRACE)
+    process.kill()
+    stack_file.seek(0)
+    return stack_file.read().decode(errors="replace")
+
+
+def _get_traced_peak(challenge: BaseChallenge, part: int) -> int | None:
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_trace_part, args=(challenge, part, sender))
+    process.start()
+    sender.close()
+    try:
+        peak: int = receiver.recv()
+    except EOFError:  # the child was killed, e.g. by the OOM killer
+        return None
+    else:
+        return peak
+    finally:
+        process.join()
+        receiver.close()
+
+
+def run_part_isolated(
+    challenge: BaseChallenge,
+    part: int,
+    memory_limit: int | None = None,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+    use_cache: bool = False,
+    trace_memory: bool = False,
+) -> PartOutcome:
+    """
+    Solve the part in a forked child process and measure its peak resident set
+    size. With memory_limit (in bytes) the address space of the child is
+    limited, so exceeding it aborts only the part. A child running longer than
+    timeout seconds of wall time or cpu_limit seconds of CPU time is stopped
+    and its stack is returned. The result cache is used only with use_cache.
+    With trace_memory, memory allocated by Python (tracemalloc) in a solved
+    part is traced in another child afterwards, on the input loaded beforehand,
+    so neither tracing nor input loading counts against the limits or the time.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("Running parts in isolation isn't supported on this OS.")
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    with tempfile.TemporaryFile() as stack_file:
+        process = context.Process(
+            target=_run_part,
+            args=(
+                challenge,
+                part,
+                memory_limit,
+                cpu_limit,
+                use_cache,
+                stack_file,
+                sender,
+            ),
+        )
+        process.start()
+        sender.close()
+        outcome: PartOutcome | None = None
+        try:
+            if receiver.poll(timeout):
+                outcome = receiver.recv()
+            else:
+                outcome = PartOutcome(
+                    part,
+                    TIMEOUT,
+                    wall_time=timeout or 0.0,
+                    error=f"Part {part} exceeded the timeout of "
+                    f"{format_duration(timeout or 0)}",
+                    stack=_stop(process, stack_file),
+                )
+        except EOFError:  # the child was killed, e.g. by the OOM killer
+            pass
+        process.join()
+    receiver.close()
+    if outcome is not None:
+        if trace_memory and outcome.ok and not outcome.cached:
+            outcome.peak_traced = _get_traced_peak(challenge, part)
+        return outcome
+    if cpu_limit is not None and process.exitcode in (-signal.SIGKILL, -signal.SIGXCPU):
+        return PartOutcome(
+            part,
+            TIMEOUT,
+            error=f"Part {part} exceeded the CPU time limit of "
+            f"{format_duration(cpu_limit)}",
+        )
+    return PartOutcome(
+        part,
+        ERROR,
+        error=f"Process solving part {part} exited with code {process.exitcode}",
+    )
@@ -0,0 +1,157 @@
+import itertools
+import math
+import random
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from aoc.base import BaseChallenge
+from aoc.bench import get_input_factory
+from aoc.input_providers import TextInputProvider
+
+# generators get the real input, the size and a random generator
+Generator = Callable[[str, int, random.Random], str]
+
+DEFAULT_SIZES = (100, 200, 400, 800, 1600)
+# slope of time against the input size above which the growth is reported
+SUPERLINEAR_SLOPE = 1.2
+
+
+def repeat_lines(text: str, size: int, rng: random.Random) -> str:
+    """Return size lines, repeating lines of the text."""
+    lines = text.strip("\n").splitlines()
+    return "\n".join(itertools.islice(itertools.cycle(lines), size))
+
+
+def tile_grid(text: str, size: int, rng: random.Random) -> str:
+    """Return the grid from the text tiled to size rows and size columns."""
+    rows = text.strip("\n").splitlines()
+    width = max(map(len, rows))
+    repeats = -(-size // width)
+    tiled = [(row.ljust(width) * repeats)[:size] for row in rows]
+    return "\n".join(itertools.islice(itertools.cycle(tiled), size))
+
+
+def random_grid(text: str, size: int, rng: random.Random) -> str:
+    """Return a size x size grid of characters drawn as often as in the text."""
+    counts = Counter(text.replace("\n", ""))
+    characters, weights = list(counts), list(counts.values())
+    return "\n".join(
+        "".join(rng.choices(characters, weights, k=size)) for _ in range(size)
+    )
+
+
+GENERATORS: dict[str, Generator] = {
+    "repeat": repeat_lines,
+    "tile": tile_grid,
+    "random-grid": random_grid,
+}
+
+
+@dataclass
+class ScalePoint:
+    """Measurements of a part for one input size."""
+
+    size: int
+    input_size: int
+    part: int
+    seconds: float | None
+    peak_memory: int | None
+    error: str | None = None
+
+
+def fit_slope(xs: Sequence[float], ys: Sequence[float]) -> float | None:
+    """
+    Return the slope of the least squares line through points (log x, log y),
+    i.e. the exponent k of y ~ x^k. None if there are less than 2 valid points.
+    """
+    points = [
+        (math.log(x), math.log(y))
+        for x, y in zip(xs, ys, strict=True)
+        if x > 0 and y > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def _measure_part(
+    challenge: BaseChallenge, part: int, runs: int, memory: bool
+) -> tuple[float, int | None]:
+    """Return the best time of runs of the part and its peak traced memory."""
+    func = challenge.part_1 if part == 1 else challenge.part_2
+    make_input = get_input_factory(challenge, part)
+    best = math.inf
+    for _ in range(runs):
+        part_input = make_input()
+        start = time.perf_counter()
+        func(part_input)
+        best = min(best, time.perf_counter() - start)
+    if not memory:
+        return best, None
+    # tracing slows allocations down, so memory is measured in a separate run
+    part_input = make_input()
+    tracemalloc.start()
+    try:
+        func(part_input)
+        return best, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def scale_challenge(
+    challenge_class: type[BaseChallenge],
+    generate: Callable[[int, random.Random], str],
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    parts: Iterable[int] = (1, 2),
+    runs: int = 3,
+    memory: bool = True,
+    seed: int = 0,
+) -> list[ScalePoint]:
+    """
+    Run the parts on inputs of the given sizes returned by generate. Input
+    loading and parsing isn't included in the timings. A part failing at some
+    size is not run for larger sizes.
+    """
+    points = []
+    failed: set[int] = set()
+    for size in sizes:
+        text = generate(size, random.Random(seed))
+        for part in parts:
+            if part in failed:
+                continue
+            challenge = challenge_class(
+                TextInputProvider(challenge_class.year, challenge_class.day, text)
+            )
+            try:
+                seconds, peak_memory = _measure_part(challenge, part, runs, memory)
+            except Exception as e:
+                failed.add(part)
+                error = f"{type(e).__name__}: {e}"
+                points.append(ScalePoint(size, len(text), part, None, None, error))
+                continue
+            points.append(ScalePoint(size, len(text), part, seconds, peak_memory))
+    return points
+
+
+def get_slopes(
+    points: Iterable[ScalePoint], part: int
+) -> tuple[float | None, float | None]:
+    """Return slopes of time and of memory against the input size of the part."""
+    measured = [p for p in points if p.part == part and p.seconds is not None]
+    time_slope = fit_slope(
+        [p.input_size for p in measured], [p.seconds or 0.0 for p in measured]
+    )
+    with_memory = [p for p in measured if p.peak_memory is not None]
+    memory_slope = fit_slope(
+        [p.input_size for p in with_memory],
+        [p.peak_memory or 0 for p in with_memory],
+    )
+    return time_slope, memory_slope
@@ -0,0 +1,242 @@
+import heapq
+import itertools
+from array import array
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from math import prod
+from typing import Any, Generic, TypeVar, cast
+
+S = TypeVar("S", bound=Hashable)
+
+UNREACHED = 2**63 - 1
+_NO_PARENT = -1
+
+
+@dataclass
+class SearchStats:
+    """Counters of a search, useful e.g. to compare heuristics."""
+
+    expanded: int = 0
+    pushed: int = 0
+    queue_peak: int = 0
+
+
+@dataclass
+class SearchResult(Generic[S]):
+    """
+    Outcome of a search. If a goal was given, the search stopped at the first goal
+    state, otherwise all states reachable from the starts were visited.
+    """
+
+    goal: S | None
+    # mappings or, for searches with size, arrays indexed by states
+    distances: Any
+    parents: Any
+    stats: SearchStats = field(default_factory=SearchStats)
+
+    @property
+    def distance(self) -> int | None:
+        """Return the distance to the goal or None if it wasn't reached."""
+        return None if self.goal is None else self.distance_to(self.goal)
+
+    def distance_to(self, state: S) -> int | None:
+        if isinstance(self.distances, array):
+            distance = self.distances[cast(int, state)]
+        else:
+            distance = self.distances.get(state, UNREACHED)
+        return None if distance == UNREACHED else distance
+
+    def path(self, state: S | None = None) -> list[S]:
+        """Return states from a start to the given state (by default the goal)."""
+        if self.parents is None:
+            raise ValueError("Paths are available only for searches with track_paths.")
+        if state is None:
+            state = self.goal
+        if state is None or self.distance_to(state) is None:
+            return []
+        path = [state]
+        parents = self.parents
+        if isinstance(parents, array):
+            while (parent := parents[cast(int, state)]) != _NO_PARENT:
+                path.append(parent)
+                state = parent
+        else:
+            while state in parents:
+                state = parents[state]
+                path.append(state)
+        return path[::-1]
+
+
+def _unreached() -> int:
+    return UNREACHED
+
+
+def _make_storage(size: int | None, track_paths: bool) -> tuple[Any, Any]:
+    """
+    Return containers for distances and parents. Distances of unvisited states are
+    UNREACHED. With size, states must be ints from range(size) and arrays are used.
+    """
+    if size is not None:
+        distances = array("q", [UNREACHED]) * size
+        parents = array("q", [_NO_PARENT]) * size if track_paths else None
+        return distances, parents
+    return defaultdict(_unreached), {} if track_paths else None
+
+
+def bfs(
+    starts: Iterable[S],
+    neighbours: Callable[[S], Iterable[S]],
+    goal: Callable[[S], bool] | None = None,
+    size: int | None = None,
+    track_paths: bool = False,
+) -> SearchResult[S]:
+    """Breadth first search over a graph with edges of equal cost."""
+    distances, parents = _make_storage(size, track_paths)
+    stats = SearchStats()
+    queue: deque[S] = deque()
+    for start in starts:
+        if distances[start] == UNREACHED:
+            distances[start] = 0
+            queue.append(start)
+    stats.pushed = stats.queue_peak = len(queue)
+    while queue:
+        state = queue.popleft()
+        stats.expanded += 1
+        if goal is not None and goal(state):
+            return SearchResult(state, distances, parents, stats)
+        distance = distances[state] + 1
+        for neighbour in neighbours(state):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = distance
+                if parents is not None:
+                    parents[neighbour] = state
+                queue.append(neighbour)
+                stats.pushed += 1
+        if len(queue) > stats.queue_peak:
+            stats.queue_peak = len(queue)
+    return SearchResult(None, distances, parents, stats)
+
+
+def bfs_01(
+    starts: Iterable[S],
+    neighbours: Callable[[S], Iterable[tuple[S, int]]],
+    goal: Callable[[S], bool] | None = None,
+    size: int | None = None,
+    track_paths: bool = False,
+) -> SearchResult[S]:
+    """Search over a graph with edges costing 0 or 1 using a deque instead of a heap."""
+    distances, parents = _make_storage(size, track_paths)
+    stats = SearchStats()
+    queue: deque[tuple[int, S]] = deque()
+    for start in starts:
+        distances[start] = 0
+        queue.append((0, start))
+    stats.pushed = stats.queue_peak = len(queue)
+    while queue:
+        distance, state = queue.popleft()
+        if distance > distances[state]:  # already reached with a lower cost
+            continue
+        stats.expanded += 1
+        if goal is not None and goal(state):
+            return SearchResult(state, distances, parents, stats)
+        for neighbour, cost in neighbours(state):
+            if (new_distance := distance + cost) < distances[neighbour]:
+                distances[neighbour] = new_distance
+                if parents is not None:
+                    parents[neighbour] = state
+                if cost:
+                    queue.append((new_distance, neighbour))
+                else:
+                    queue.appendleft((new_distance, neighbour))
+                stats.pushed += 1
+        if len(queue) > stats.queue_peak:
+            stats.queue_peak = len(queue)
+    return SearchResult(None, distances, parents, stats)
+
+
+def astar(
+    starts: Iterable[S],
+    neighbours: Callable[[S], Iterable[tuple[S, int]]],
+    goal: Callable[[S], bool] | None = None,
+    heuristic: Callable[[S], int] | None = None,
+    size: int | None = None,
+    track_paths: bool = False,
+) -> SearchResult[S]:
+    """
+    A* search over a graph with non-negative edge costs. The heuristic must never
+    overestimate the remaining cost to a goal. Without it, it's Dijkstra.
+    """
+    distances, parents = _make_storage(size, track_paths)
+    stats = SearchStats()
+    # of states with equal estimates the deeper ones are expanded first, the counter
+    # breaks remaining ties, so that states don't have to be comparable
+    counter = itertools.count()
+    queue: list[tuple[int, int, int, S]] = []
+    for start in starts:
+        distances[start] = 0
+        estimate = heuristic(start) if heuristic else 0
+        queue.append((estimate, 0, next(counter), start))
+    heapq.heapify(queue)
+    stats.pushed = stats.queue_peak = len(queue)
+    while queue:
+        _, negated_distance, _, state = heapq.heappop(queue)
+        distance = -negated_distance
+        if distance > distances[state]:  # already reached with a lower cost
+            continue
+        stats.expanded += 1
+        if goal is not None and goal(state):
+            return SearchResult(state, distances, parents, stats)
+        for neighbour, cost in neighbours(state):
+            if (new_distance := distance + cost) < distances[neighbour]:
+                distances[neighbour] = new_distance
+                if parents is not None:
+                    parents[neighbour] = state
+                estimate = new_distance + (heuristic(neighbour) if heuristic else 0)
+                heapq.heappush(
+                    queue, (estimate, -new_distance, next(counter), neighbour)
+                )
+                stats.pushed += 1
+        if len(queue) > stats.queue_peak:
+            stats.queue_peak = len(queue)
+    return SearchResult(None, distances, parents, stats)
+
+
+def dijkstra(
+    starts: Iterable[S],
+    neighbours: Callable[[S], Iterable[tuple[S, int]]],
+    goal: Callable[[S], bool] | None = None,
+    size: int | None = None,
+    track_paths: bool = False,
+) -> SearchResult[S]:
+    """Shortest paths over a graph with non-negative edge costs."""
+    return astar(starts, neighbours, goal, None, size, track_paths)
+
+
+class StatePacker:
+    """
+    Pack tuples of bounded non-negative ints, e.g. (x, y, direction), into single
+    ints from range(size) and back. Packed states hash faster than tuples and can
+    be used with the size argument of searches to keep distances in arrays.
+    """
+
+    def __init__(self, *bounds: int):
+        if not bounds or any(bound <= 0 for bound in bounds):
+            raise ValueError("Bounds must be positive.")
+        self.bounds = bounds
+        self.size = prod(bounds)
+
+    def pack(self, *values: int) -> int:
+        state = 0
+        for value, bound in zip(values, self.bounds, strict=True):
+            if not 0 <= value < bound:
+                raise ValueError(f"Value {value} is outside of range({bound}).")
+            state = state * bound + value
+        return state
+
+    def unpack(self, state: int) -> tuple[int, ...]:
+        values = []
+        for bound in reversed(self.bounds):
+            state, value = divmod(state, bound)
+            values.append(value)
+        return tuple(reversed(values))
@@ -0,0 +1,49 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s*(\d+) \|\s*(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportTiming:
+    """Time of importing a module, in seconds, with and without its imports."""
+
+    module: str
+    own: float
+    cumulative: float
+    depth: int
+
+
+def parse_import_times(output: str) -> list[ImportTiming]:
+    """Return timings from the output of python -X importtime."""
+    timings = []
+    for match in _IMPORT_TIME_LINE.finditer(output):
+        own, cumulative, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module, int(own) / 1e6, int(cumulative) / 1e6, (len(indent) - 1) // 2
+            )
+        )
+    return timings
+
+
+def measure_imports(module: str = "aoc.main") -> list[ImportTiming]:
+    """
+    Import the module in a fresh interpreter and return timings of it and of all
+    modules it imported, skipping modules imported by the interpreter at startup.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = parse_import_times(process.stderr)
+    # imports are reported after modules importing them, the module comes last
+    end = max(i for i, timing in enumerate(timings) if timing.module == module)
+    start = end
+    while start > 0 and timings[start - 1].depth > 0:
+        start -= 1
+    return timings[start : end + 1]
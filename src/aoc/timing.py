@@ -0,0 +1,141 @@
+import json
+import logging
+from contextlib import ContextDecorator
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any
+
+from aoc.formatting import format_duration
+from aoc.logger import logger
+
+timings_logger = logger.getChild("timings")
+_current_timings: ContextVar["Timings | None"] = ContextVar(
+    "current_timings", default=None
+)
+
+
+@dataclass
+class SpanTiming:
+    """Total time of all calls of a span at the given path, e.g. part_1/flood_fill."""
+
+    path: str
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.path.rpartition("/")[2]
+
+    @property
+    def depth(self) -> int:
+        return self.path.count("/")
+
+
+class Timings:
+    """Durations of named phases of a challenge aggregated by their nesting."""
+
+    def __init__(self):
+        self.spans: dict[str, SpanTiming] = {}
+        self._stack: list[tuple[SpanTiming, int]] = []
+
+    def span(self, name: str) -> "Span":
+        """Return a span recorded in these timings, also by nested span() calls."""
+        return Span(name, self)
+
+    def _start(self, name: str) -> bool:
+        parent = self._stack[-1][0] if self._stack else None
+        if parent is not None and parent.name == name:  # recursion, the outer counts
+            return False
+        path = f"{parent.path}/{name}" if parent else name
+        if (timing := self.spans.get(path)) is None:
+            timing = self.spans[path] = SpanTiming(path)
+        self._stack.append((timing, perf_counter_ns()))
+        return True
+
+    def _stop(self):
+        end = perf_counter_ns()
+        timing, start = self._stack.pop()
+        timing.calls += 1
+        timing.seconds += (end - start) / 1e9
+
+    def get_seconds(self, path: str) -> float:
+        """Return the total time of the span or 0 if it wasn't recorded."""
+        timing = self.spans.get(path)
+        return timing.seconds if timing else 0.0
+
+    def to_records(self, **context: Any) -> list[dict[str, Any]]:
+        return [
+            {
+                **context,
+                "span": timing.path,
+                "calls": timing.calls,
+                "seconds": timing.seconds,
+            }
+            for timing in self.spans.values()
+        ]
+
+    def log(self, **context: Any):
+        """Write each span as a JSON line to the aoc.logger.timings logger."""
+        if not timings_logger.isEnabledFor(logging.INFO):
+            return
+        for record in self.to_records(**context):
+            timings_logger.info(json.dumps(record))
+
+    def format(self) -> str:
+        return "\n".join(
+            f"{'  ' * timing.depth}{timing.name:<{30 - 2 * timing.depth}} "
+            f"{format_duration(timing.seconds):>10}"
+            + (f" ({timing.calls} calls)" if timing.calls > 1 else "")
+            for timing in self.spans.values()
+        )
+
+    def clear(self):
+        self.spans.clear()
+
+
+class Span(ContextDecorator):
+    """
+    Context manager and decorator measuring a block as a named span. Without
+    explicit timings it's recorded in the timings of the running challenge,
+    outside of a challenge it does nothing.
+    """
+
+    def __init__(self, name: str, timings: Timings | None = None):
+        self.name = name
+        self._timings = timings
+        # entered spans, a decorated function may be called recursively
+        self._entered: list[tuple[Timings | None, Token | None, bool]] = []
+
+    def _recreate_cm(self) -> "Span":
+        # each call of a decorated function gets its own span
+        return Span(self.name, self._timings)
+
+    def __enter__(self) -> "Span":
+        timings = self._timings or _current_timings.get()
+        if timings is None:
+            self._entered.append((None, None, False))
+            return self
+        token = _current_timings.set(timings) if self._timings else None
+        self._entered.append((timings, token, timings._start(self.name)))
+        return self
+
+    def __exit__(self, *exc_info):
+        timings, token, started = self._entered.pop()
+        if started:
+            timings._stop()  # type: ignore[union-attr]
+        if token is not None:
+            _current_timings.reset(token)
+
+
+def span(name: str) -> Span:
+    """
+    Measure a block or a function as a named span of the running challenge:
+
+        with span("flood fill"):
+            ...
+
+        @span("dfs")
+        def dfs(node): ...
+    """
+    return Span(name)
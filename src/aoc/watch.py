@@ -0,0 +1,231 @@
+import ast
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.base import BaseChallenge
+from aoc.cache import get_local_modules, get_source_hash
+from aoc.input_providers import InputProvider
+
+DEFAULT_POLL_INTERVAL = 0.2
+PARTS = (1, 2)
+
+# modification time and size of a file or None if it doesn't exist
+Stamp = tuple[int, int] | None
+
+
+def _get_stamp(path: Path) -> Stamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _RemoveMethods(ast.NodeTransformer):
+    def __init__(self, names: set[str]):
+        self.names = names
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
+        node.body = [
+            statement
+            for statement in node.body
+            if not (
+                isinstance(statement, ast.FunctionDef | ast.AsyncFunctionDef)
+                and statement.name in self.names
+            )
+        ] or [ast.Pass()]
+        return node
+
+
+def _get_reachable_methods(tree: ast.Module, name: str) -> set[str]:
+    """
+    Return names of methods reachable from the method through self.<name> or
+    cls.<name> references, including the method itself.
+    """
+    methods: dict[str, ast.AST] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for statement in node.body:
+                if isinstance(statement, ast.FunctionDef | ast.AsyncFunctionDef):
+                    methods.setdefault(statement.name, statement)
+    reachable = set()
+    pending = [name]
+    while pending:
+        if (method_name := pending.pop()) in reachable or method_name not in methods:
+            continue
+        reachable.add(method_name)
+        pending.extend(
+            node.attr
+            for node in ast.walk(methods[method_name])
+            if isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in ("self", "cls")
+        )
+    return reachable
+
+
+def get_part_fingerprints(module_name: str, modules: dict[str, Path]) -> dict[int, str]:
+    """
+    Return hashes of code each part depends on: the challenge module without
+    methods of other parts it doesn't use (e.g. part_2 calling self.part_1 keeps
+    it) and all local modules it imports. Comments and formatting are ignored,
+    as only the syntax tree of the module is hashed.
+    """
+    source = modules[module_name].read_bytes()
+    imported = hashlib.blake2b(digest_size=16)
+    for name, path in sorted(modules.items()):
+        if name != module_name:
+            imported.update(f"{path}:{get_source_hash(path)}\n".encode())
+    fingerprints = {}
+    for part in PARTS:
+        tree = ast.parse(source)
+        used = _get_reachable_methods(tree, f"part_{part}")
+        tree = _RemoveMethods({f"part_{p}" for p in PARTS} - used).visit(tree)
+        fingerprint = hashlib.blake2b(ast.dump(tree).encode(), digest_size=16)
+        fingerprint.update(imported.digest())
+        fingerprints[part] = fingerprint.hexdigest()
+    return fingerprints
+
+
+@dataclass
+class PartResult:
+    part: int
+    solution: Any
+    seconds: float
+    # False if the solution was reused, because neither code nor input changed
+    solved: bool = True
+
+
+class Watcher:
+    """
+    Keep a challenge loaded between its runs. Changed modules are reloaded,
+    inputs are kept in memory until their files change and each part is solved
+    again only if its code or input changed.
+    """
+
+    def __init__(
+        self,
+        module_name: str,
+        input_provider: InputProvider,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.module_name = module_name
+        self.input_provider = input_provider
+        self.poll_interval = poll_interval
+        self.module: ModuleType = importlib.import_module(module_name)
+        self._update_modules()
+        self._stamps = self._get_stamps()
+        # inputs and solutions with stamps of input files and code they come from,
+        # inputs are kept by their files, so parts reading the same file share them
+        self._inputs: dict[tuple[Path | int, bool], tuple[Stamp, Any]] = {}
+        self._results: dict[int, tuple[tuple[str, Stamp], PartResult]] = {}
+
+    def _update_modules(self):
+        self.modules = get_local_modules(self.module_name)
+        self.fingerprints = get_part_fingerprints(self.module_name, self.modules)
+
+    def get_input_paths(self) -> dict[int, Path]:
+        paths = {}
+        for part in PARTS:
+            if (path := self.input_provider.get_input_path(part)) is not None:
+                paths[part] = path
+        return paths
+
+    def get_watched_paths(self) -> set[Path]:
+        return {*self.modules.values(), *self.get_input_paths().values()}
+
+    def _get_stamps(self) -> dict[Path, Stamp]:
+        return {path: _get_stamp(path) for path in self.get_watched_paths()}
+
+    def poll(self) -> set[Path]:
+        """Return files changed since the last poll."""
+        stamps = self._get_stamps()
+        changed = {
+            path
+            for path in stamps.keys() | self._stamps.keys()
+            if stamps.get(path) != self._stamps.get(path)
+        }
+        self._stamps = stamps
+        return changed
+
+    def reload(self, changed: set[Path]):
+        """
+        Reload changed modules, dependencies before modules importing them. The
+        challenge module is always reloaded to pick up names imported from them.
+        """
+        names = [name for name, path in self.modules.items() if path in changed]
+        if not names:
+            return
+        if self.module_name not in names:
+            names.insert(0, self.module_name)
+        for name in reversed(names):
+            # bytecode may be stale if a file changed twice within its mtime resolution
+            with contextlib.suppress(OSError):
+                os.remove(importlib.util.cache_from_source(str(self.modules[name])))
+            importlib.reload(sys.modules[name])
+        self.module = sys.modules[self.module_name]
+        self._update_modules()
+        for path in self.get_watched_paths() - self._stamps.keys():
+            self._stamps[path] = _get_stamp(path)
+
+    def wait_for_changes(self) -> set[Path]:
+        """Wait until watched files change, reload changed modules and return files."""
+        while not (changed := self.poll()):
+            time.sleep(self.poll_interval)
+        self.reload(changed)
+        return changed
+
+    def _load_input(
+        self, challenge: BaseChallenge, part: int, path: Path | None, stamp: Stamp
+    ):
+        """Give the challenge the input kept in memory or read it and keep it."""
+        if challenge.streaming:
+            return
+        key = (path or part, challenge.text_input)
+        if (kept := self._inputs.get(key)) and kept[0] == stamp:
+            if challenge.text_input:
+                challenge.set_input_text(kept[1], part)
+            elif isinstance(kept[1], tuple):
+                # parts may modify their lines, so each run gets a new list
+                challenge.set_input_lines(list(kept[1]), part)
+            else:  # memory mapped lines are read-only
+                challenge.set_input_lines(kept[1], part)
+        elif challenge.text_input:
+            self._inputs[key] = stamp, challenge.get_input_text(part)
+        else:
+            lines = challenge.get_input_lines(part)
+            self._inputs[key] = (
+                stamp,
+                tuple(lines) if isinstance(lines, list) else lines,
+            )
+
+    def solve(self) -> list[PartResult]:
+        """Solve parts whose code or input changed, reuse solutions of the others."""
+        challenge = self.module.Challenge(input_provider=self.input_provider)
+        input_paths = self.get_input_paths()
+        results = []
+        for part in PARTS:
+            path = input_paths.get(part)
+            stamp = _get_stamp(path) if path else None
+            key = self.fingerprints[part], stamp
+            if (previous := self._results.get(part)) and previous[0] == key:
+                results.append(
+                    PartResult(part, previous[1].solution, previous[1].seconds, False)
+                )
+                continue
+            self._load_input(challenge, part, path, stamp)
+            start = time.perf_counter()
+            solution = challenge.solve_part(part)
+            result = PartResult(part, solution, time.perf_counter() - start)
+            self._results[part] = key, result
+            results.append(result)
+        return results
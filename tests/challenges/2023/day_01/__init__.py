@@ -0,0 +1,126 @@
+"""Challenges used by tests of BaseChallenge features."""
+
+import random
+import time
+from collections.abc import Iterator
+
+from aoc.base import BaseChallenge
+from aoc.memo import memoize
+from aoc.parsing import ints, sections
+from aoc.timing import span
+
+
+class StreamingChallenge(BaseChallenge):
+    streaming = True
+
+    def part_1(self, input_lines: Iterator[str]) -> int:
+        assert isinstance(input_lines, Iterator)
+        return sum(map(int, input_lines))
+
+    def part_2(self, input_lines: Iterator[str]) -> int:
+        return max(map(int, input_lines))
+
+
+class ParsingChallenge(BaseChallenge):
+    cache_parsed_input = True
+    parse_calls = 0
+
+    def parse(self, input_lines: list[str]) -> list[int]:
+        type(self).parse_calls += 1
+        return [int(line) for line in input_lines]
+
+    def part_1(self, input_lines: list[int]) -> int:
+        return sum(input_lines)
+
+    def part_2(self, input_lines: list[int]) -> int:
+        return max(input_lines)
+
+
+@span("count_down")
+def count_down(n: int) -> int:
+    return 0 if n == 0 else 1 + count_down(n - 1)
+
+
+class TimedChallenge(BaseChallenge):
+    def part_1(self, input_lines: list[str]) -> int:
+        with span("convert"):
+            numbers = [int(line) for line in input_lines]
+        return sum(count_down(number) for number in numbers)
+
+    def part_2(self, input_lines: list[str]) -> int:
+        return len(input_lines)
+
+
+class HungryChallenge(BaseChallenge):
+    def part_1(self, input_lines: list[str]) -> int:
+        return len(bytearray(1024**2))
+
+    def part_2(self, input_lines: list[str]) -> int:
+        return len(bytearray(1024**3))
+
+
+class TextChallenge(BaseChallenge):
+    text_input = True
+
+    def part_1(self, text: str) -> int:
+        return sum(ints(text))
+
+    def part_2(self, text: str) -> int:
+        return len(sections(text))
+
+
+class GeneratingChallenge(BaseChallenge):
+    @classmethod
+    def generate_input(cls, size: int, rng: random.Random) -> str:
+        return "\n".join(str(rng.randint(1, 9)) for _ in range(size))
+
+    def part_1(self, input_lines: list[str]) -> int:
+        return sum(map(int, input_lines))
+
+    def part_2(self, input_lines: list[str]) -> int:
+        if len(input_lines) > 10:
+            raise ValueError("too big")
+        return len(input_lines)
+
+
+def wait_forever():
+    while True:
+        time.sleep(0.01)
+
+
+class LoopingChallenge(BaseChallenge):
+    def part_1(self, input_lines: list[str]) -> int:
+        wait_forever()
+        return 0
+
+    def part_2(self, input_lines: list[str]) -> int:
+        count = 0
+        while True:
+            count += 1
+
+
+class SleepingChallenge(BaseChallenge):
+    def part_1(self, input_lines: list[str]) -> int:
+        time.sleep(0.3)
+        return len(input_lines)
+
+    def part_2(self, input_lines: list[str]) -> int:
+        return 0
+
+
+@memoize(clear_between_parts=True)
+def double(x: int) -> int:
+    return 2 * x
+
+
+@memoize
+def triple(x: int) -> int:
+    return 3 * x
+
+
+class MemoizingChallenge(BaseChallenge):
+    def part_1(self, input_lines: list[str]) -> int:
+        return double(int(input_lines[0])) + triple(int(input_lines[0]))
+
+    def part_2(self, input_lines: list[str]) -> int:
+        return double.cache_size() + triple.cache_size()
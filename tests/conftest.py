@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.input_providers import SingleFileInputProvider
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path: Path, monkeypatch) -> Path:
+    """Keep caches written during tests away from the working directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("AOC_CACHE_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture
+def input_provider(tmp_path: Path) -> SingleFileInputProvider:
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n3\n")
+    return SingleFileInputProvider(2023, 1, input_path=path)
@@ -0,0 +1,204 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from aoc.base_tests import BaseTestChallenge
+from aoc.cache import ResultCache
+from aoc.input_providers import SingleFileInputProvider
+
+challenges = importlib.import_module("challenges.2023.day_01")
+
+
+class TestStreamingChallenge:
+    def test_parts_of_streaming_challenge_consume_iterators(
+        self, input_provider: SingleFileInputProvider
+    ):
+        challenge = challenges.StreamingChallenge(input_provider)
+
+        assert (challenge.year, challenge.day) == (2023, 1)
+        assert challenge.solve() == (6, 3)
+        assert not challenge._input_lines
+
+
+class TestTextInput:
+    def test_parts_of_text_challenge_receive_whole_input(self, tmp_path: Path):
+        path = tmp_path / "input.txt"
+        path.write_text("1 -2\n3\n\n4\n")
+        challenge = challenges.TextChallenge(
+            SingleFileInputProvider(2023, 1, input_path=path)
+        )
+
+        assert challenge.solve() == (6, 2)
+        assert challenge.get_input_text() == "1 -2\n3\n\n4"
+        assert not challenge._input_lines
+
+
+class TestParsingInput:
+    @pytest.fixture(autouse=True)
+    def reset_parse_calls(self, monkeypatch):
+        monkeypatch.setattr(challenges.ParsingChallenge, "parse_calls", 0)
+
+    def test_parsed_input_is_shared_between_parts_with_the_same_content(
+        self, input_provider: SingleFileInputProvider
+    ):
+        challenge = challenges.ParsingChallenge(input_provider)
+
+        assert challenge.solve() == (6, 3)
+        assert challenges.ParsingChallenge.parse_calls == 1
+
+    def test_parsed_input_is_loaded_from_disk_cache_by_next_instances(
+        self, input_provider: SingleFileInputProvider, cache_directory: Path
+    ):
+        challenges.ParsingChallenge(input_provider).solve()
+        assert challenges.ParsingChallenge(input_provider).solve() == (6, 3)
+
+        assert challenges.ParsingChallenge.parse_calls == 1
+        assert len(list(cache_directory.joinpath("parse").iterdir())) == 1
+
+    def test_input_is_parsed_again_when_helper_of_parse_changes(
+        self,
+        input_provider: SingleFileInputProvider,
+        tmp_path: Path,
+        monkeypatch,
+        request,
+    ):
+        day_directory = tmp_path / "parsed" / "2023" / "day_01"
+        day_directory.mkdir(parents=True)
+        day_directory.joinpath("__init__.py").write_text(
+            "from aoc.base import BaseChallenge\n"
+            "from .helpers import convert\n\n\n"
+            "class Challenge(BaseChallenge):\n"
+            "    cache_parsed_input = True\n\n"
+            "    def parse(self, input_lines):\n"
+            "        return [convert(line) for line in input_lines]\n\n"
+            "    def part_1(self, numbers):\n"
+            "        return sum(numbers)\n\n"
+            "    def part_2(self, numbers):\n"
+            "        return max(numbers)\n"
+        )
+        helpers = day_directory / "helpers.py"
+        helpers.write_text("def convert(line):\n    return int(line)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        @request.addfinalizer
+        def forget_modules():
+            for name in [name for name in sys.modules if name.startswith("parsed")]:
+                del sys.modules[name]
+
+        module = importlib.import_module("parsed.2023.day_01")
+        assert module.Challenge(input_provider).solve() == (6, 3)
+
+        helpers.write_text("def convert(line):\n    return 10 * int(line)\n")
+        importlib.reload(importlib.import_module("parsed.2023.day_01.helpers"))
+        module = importlib.reload(module)
+
+        assert module.Challenge(input_provider).solve() == (60, 30)
+
+    def test_changed_input_is_parsed_again(
+        self, input_provider: SingleFileInputProvider
+    ):
+        challenges.ParsingChallenge(input_provider).solve()
+        input_provider.input_path.write_text("4\n5\n")
+
+        assert challenges.ParsingChallenge(input_provider).solve() == (9, 5)
+        assert challenges.ParsingChallenge.parse_calls == 2
+
+
+class TestCachingResults:
+    @pytest.fixture(autouse=True)
+    def reset_parse_calls(self, monkeypatch):
+        monkeypatch.setattr(challenges.ParsingChallenge, "parse_calls", 0)
+        monkeypatch.setattr(challenges.ParsingChallenge, "cache_parsed_input", False)
+
+    def test_results_of_unchanged_challenge_and_input_are_not_recomputed(
+        self, input_provider: SingleFileInputProvider, tmp_path: Path
+    ):
+        challenges.ParsingChallenge(
+            input_provider, result_cache=ResultCache(tmp_path)
+        ).solve()
+        result_cache = ResultCache(tmp_path)
+
+        solutions = challenges.ParsingChallenge(
+            input_provider, result_cache=result_cache
+        ).solve()
+
+        assert solutions == (6, 3)
+        assert challenges.ParsingChallenge.parse_calls == 1
+        assert (result_cache.hits, result_cache.misses) == (2, 0)
+
+    def test_results_are_recomputed_for_changed_input(
+        self, input_provider: SingleFileInputProvider, tmp_path: Path
+    ):
+        challenges.ParsingChallenge(
+            input_provider, result_cache=ResultCache(tmp_path)
+        ).solve()
+        input_provider.input_path.write_text("4\n5\n")
+
+        assert challenges.ParsingChallenge(
+            input_provider, result_cache=ResultCache(tmp_path)
+        ).solve() == (9, 5)
+
+
+class TestBaseTestChallenge:
+    @pytest.fixture(autouse=True)
+    def real_data(self, tmp_path: Path, monkeypatch):
+        tmp_path.joinpath("data", "2023").mkdir(parents=True)
+        tmp_path.joinpath("data", "2023", "01_input.txt").write_text("1\n2\n3\n")
+        monkeypatch.chdir(tmp_path)
+
+    def test_tests_of_a_data_set_share_one_challenge(self, monkeypatch):
+        monkeypatch.setattr(challenges.ParsingChallenge, "parse_calls", 0)
+
+        class ParsingChallengeTests(BaseTestChallenge):
+            challenge_class = challenges.ParsingChallenge
+            expected_results_from_real_data = (6, 3)
+            share_challenges = True
+
+        ParsingChallengeTests().test_on_real_data_part_1()
+        ParsingChallengeTests().test_on_real_data_part_2()
+
+        assert challenges.ParsingChallenge.parse_calls == 1
+        assert ParsingChallengeTests().get_challenge(use_test_data=False) is (
+            ParsingChallengeTests().get_challenge(use_test_data=False)
+        )
+        ParsingChallengeTests.teardown_class()
+        assert not ParsingChallengeTests._challenges
+
+    def test_tests_get_a_challenge_each_by_default(self):
+        class ParsingChallengeTests(BaseTestChallenge):
+            challenge_class = challenges.ParsingChallenge
+
+        assert ParsingChallengeTests().get_challenge(use_test_data=False) is not (
+            ParsingChallengeTests().get_challenge(use_test_data=False)
+        )
+
+    def test_part_exceeding_runtime_budget_fails(self, monkeypatch):
+        class SlowChallengeTests(BaseTestChallenge):
+            challenge_class = challenges.TimedChallenge
+            max_runtime_on_real_data = (1e-9, None)
+
+        with pytest.raises(pytest.fail.Exception, match="^Part 1 on real data took "):
+            SlowChallengeTests().solve_part(1, use_test_data=False)
+        SlowChallengeTests().solve_part(2, use_test_data=False)
+        monkeypatch.setenv("AOC_PERF_TOLERANCE", "1e12")
+        SlowChallengeTests().solve_part(1, use_test_data=False)
+
+    def test_part_exceeding_memory_budget_fails(self):
+        class HungryChallengeTests(BaseTestChallenge):
+            challenge_class = challenges.HungryChallenge
+            max_peak_memory_on_real_data = ("512K", None)
+
+        with pytest.raises(
+            pytest.fail.Exception,
+            match=r"^Part 1 on real data used 1\.0 MiB at peak, budget 512\.0 KiB$",
+        ):
+            HungryChallengeTests().solve_part(1, use_test_data=False)
+
+    def test_budgets_must_be_given_for_both_parts(self):
+        with pytest.raises(ValueError, match="max_runtime_on_test_data must be"):
+
+            class InvalidTests(BaseTestChallenge):
+                challenge_class = challenges.HungryChallenge
+                max_runtime_on_test_data = (1.0,)  # type: ignore[assignment]
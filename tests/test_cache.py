@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+
+from aoc.cache import DiskCache, get_module_fingerprint
+
+
+def test_disk_cache_stores_values_and_counts_hits(tmp_path: Path):
+    cache = DiskCache(tmp_path)
+    cache.set("key", {"answer": 42})
+
+    assert cache.get("key") == {"answer": 42}
+    assert cache.get("missing", "default") == "default"
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (1, 1, 1)
+
+
+def test_disk_cache_evicts_least_recently_used_entries(tmp_path: Path):
+    cache = DiskCache(tmp_path, max_size=1000)
+    for i, key in enumerate(["first", "second", "third"]):
+        cache.set(key, b"x" * 300)
+        os.utime(tmp_path / f"{key}.pickle", (i, i))
+    cache.get("first")  # makes "second" the least recently used entry
+
+    cache.set("fourth", b"x" * 300)
+
+    assert cache.get("second") is None
+    assert all(cache.get(key) for key in ["first", "third", "fourth"])
+    assert cache.stats().size <= 1000
+
+
+def test_disk_cache_skips_values_which_cannot_be_pickled(tmp_path: Path):
+    cache = DiskCache(tmp_path)
+
+    assert not cache.set("key", lambda: None)
+    assert cache.stats().entries == 0
+
+
+def test_module_fingerprint_depends_on_transitively_imported_local_modules(
+    tmp_path: Path, monkeypatch
+):
+    package = tmp_path / "fingerprinted"
+    package.mkdir()
+    package.joinpath("__init__.py").write_text("from .helpers import solve\n")
+    package.joinpath("helpers.py").write_text("import json\nsolve = 1\n")
+    package.joinpath("unused.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    fingerprint = get_module_fingerprint("fingerprinted")
+    package.joinpath("unused.py").write_text("changed = True\n")
+    assert get_module_fingerprint("fingerprinted") == fingerprint
+
+    package.joinpath("helpers.py").write_text("import json\nsolve = 2\n")
+    assert get_module_fingerprint("fingerprinted") != fingerprint
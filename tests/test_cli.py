@@ -1,3 +1,7 @@
+import json
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 from unittest import mock
 
@@ -18,6 +22,16 @@ def m_aocd_puzzle(monkeypatch):
     return m_puzzle
 
 
+@pytest.fixture
+def data_directory(tmp_path: Path) -> Path:
+    """Data directory with inputs of day 0 laid out for the 2023 year."""
+    year_directory = tmp_path / "data" / "2023"
+    year_directory.mkdir(parents=True)
+    for input_file in (Path(__file__).parent.parent / "data").glob("*.txt"):
+        shutil.copy(input_file, year_directory)
+    return tmp_path / "data"
+
+
 class TestSettingUpNewDay:
     def test_setting_up_new_day_creates_directories_in_configured_places(
         self, tmp_path: Path
@@ -99,3 +113,377 @@ class TestRunningSolution:
         assert "Using data from custom_input.txt" in result.stdout
         assert "Day 0 - Part 1: 1" in result.stdout
         assert "Day 0 - Part 2: 33" in result.stdout
+
+    def test_run_uses_cached_results_of_unchanged_solution(self, data_directory: Path):
+        args = ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+        runner.invoke(app, args)
+
+        result = runner.invoke(app, args)
+        if result.exception:
+            raise result.exception
+        assert "Day 0 - Part 2: 55" in result.stdout
+        assert "Result cache: 2 hits, 0 misses" in result.stdout
+
+        result = runner.invoke(app, [*args, "--no-cache"])
+        assert "Day 0 - Part 2: 55" in result.stdout
+        assert "Result cache" not in result.stdout
+
+    def test_run_shows_and_logs_timings_of_phases(
+        self, tmp_path: Path, data_directory: Path
+    ):
+        timings_log = tmp_path / "timings.jsonl"
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--timings", "--timings-log", str(timings_log)],
+        )
+        if result.exception:
+            raise result.exception
+        assert "Timings:" in result.stdout
+        assert "  read" in result.stdout
+        spans = [
+            json.loads(line)["span"] for line in timings_log.read_text().splitlines()
+        ]
+        assert spans[:2] == ["input", "input/resolve"]
+        assert spans[-2:] == ["part_1", "part_2"]
+
+    def test_run_verbose_shows_stats_of_memoized_functions(self, data_directory: Path):
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--no-cache", "--verbose"],
+        )
+        if result.exception:
+            raise result.exception
+        assert "Day 0 - Part 2: 55" in result.stdout
+        assert "Memoized functions:\n  none called" in result.stdout
+
+    def test_run_verbose_notes_parts_from_the_result_cache(self, data_directory: Path):
+        args = ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+        runner.invoke(app, args)
+
+        result = runner.invoke(app, [*args, "--verbose"])
+        if result.exception:
+            raise result.exception
+        assert "2 part(s) came from the result cache" in result.stdout
+        assert "Use --no-cache to include them." in result.stdout
+
+    @pytest.mark.parametrize("option", [["--all"], ["--memory"], ["--timeout", "10"]])
+    def test_run_verbose_rejects_parts_run_in_other_processes(
+        self, data_directory: Path, option: list[str]
+    ):
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--verbose", *option],
+        )
+
+        assert result.exit_code == 1
+        assert "--verbose can't be used with --all" in result.stdout
+
+    def test_run_reports_peak_memory_of_parts(self, data_directory: Path):
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--memory-limit", "256M"],
+        )
+        if result.exception:
+            raise result.exception
+        assert "Day 0 - Part 1: 1 (peak traced" in result.stdout
+        assert "peak RSS" in result.stdout
+
+    def test_run_with_timeout_reports_solutions(self, data_directory: Path):
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--timeout", "10", "--cpu-limit", "10"],
+        )
+        if result.exception:
+            raise result.exception
+        assert "Day 0 - Part 2: 55 (peak RSS" in result.stdout
+
+    def test_run_with_zero_timeout_stops_parts(self, data_directory: Path):
+        args = ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+
+        result = runner.invoke(app, [*args, "--timeout", "0"])
+        assert result.exit_code == 1
+        assert "Part 1 exceeded the timeout of" in result.stdout
+
+        result = runner.invoke(app, [*args, "--cpu-limit", "-1"])
+        assert result.exit_code == 2
+
+    @pytest.mark.parametrize(
+        ("options", "message"),
+        [
+            (["--memory-limit", "1G"], "--memory-limit can't be used with --all."),
+            (["--mmap", "--profile"], "--mmap, --profile can't be used with --all."),
+            (["--timings"], "--timings can't be used with --all."),
+        ],
+    )
+    def test_run_all_rejects_options_of_a_single_day(
+        self, data_directory: Path, options: list[str], message: str
+    ):
+        result = runner.invoke(
+            app,
+            ["run", "--all", "--year", "2023", "--data-directory", str(data_directory)]
+            + options,
+        )
+
+        assert result.exit_code == 1
+        assert message in result.stdout
+
+    def test_run_all_solved_days_writes_summary_and_report(
+        self, tmp_path: Path, data_directory: Path
+    ):
+        report = tmp_path / "report.json"
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                "--all",
+                "--year",
+                "2023",
+                "--jobs",
+                "2",
+                "--data-directory",
+                str(data_directory),
+                "--report",
+                str(report),
+            ],
+        )
+        if result.exception:
+            raise result.exception
+        assert result.exit_code == 0, result.exc_info
+        assert "Ran 1 days" in result.stdout
+        [day_result] = json.loads(report.read_text())["results"]
+        assert (day_result["year"], day_result["day"]) == (2023, 0)
+        assert day_result["answers"] == [1, 55]
+        assert day_result["error"] is None
+
+
+class TestBenchmarkingSolution:
+    def test_bench_reports_statistics_and_appends_history(
+        self, tmp_path: Path, data_directory: Path
+    ):
+        history_file = tmp_path / "history.jsonl"
+        result = runner.invoke(
+            app,
+            [
+                "bench",
+                "0",
+                "--year",
+                "2023",
+                "--data-directory",
+                str(data_directory),
+                "--runs",
+                "3",
+                "--history-file",
+                str(history_file),
+            ],
+        )
+        if result.exception:
+            raise result.exception
+        assert result.exit_code == 0, result.exc_info
+        assert "Day 0 - Part 1: min" in result.stdout
+        assert "Day 0 - Part 2: min" in result.stdout
+
+        records = [json.loads(line) for line in history_file.read_text().splitlines()]
+        assert [(r["year"], r["day"], r["part"], r["runs"]) for r in records] == [
+            (2023, 0, 1, 3),
+            (2023, 0, 2, 3),
+        ]
+
+    def test_bench_compare_flags_regressions(
+        self, tmp_path: Path, data_directory: Path
+    ):
+        history_file = tmp_path / "history.jsonl"
+        baseline = {
+            "year": 2023,
+            "day": 0,
+            "commit": "a" * 40,
+            "runs": 1,
+            "minimum": 0.0,
+            "median": 0.0,
+            "p95": 0.0,
+            "stddev": 0.0,
+            "timestamp": "",
+        }
+        history_file.write_text(
+            "".join(json.dumps({**baseline, "part": part}) + "\n" for part in (1, 2))
+        )
+        with mock.patch("aoc.bench.get_git_commit", return_value="a" * 40):
+            result = runner.invoke(
+                app,
+                [
+                    "bench",
+                    "0",
+                    "--year",
+                    "2023",
+                    "--data-directory",
+                    str(data_directory),
+                    "--runs",
+                    "1",
+                    "--history-file",
+                    str(history_file),
+                    "--compare",
+                    "HEAD~1",
+                ],
+            )
+        assert result.exit_code == 1
+        assert result.stdout.count("REGRESSION") == 2
+
+
+class TestVerifyingSolution:
+    def test_verify_in_parallel_merges_results_of_all_days(
+        self, data_directory: Path, monkeypatch
+    ):
+        monkeypatch.chdir(data_directory.parent)
+        result = runner.invoke(app, ["verify", "--jobs", "2"])
+        if result.exception:
+            raise result.exception
+        assert result.exit_code == 0, result.stdout
+        assert "2023 day  0: 4 passed, 0 failed, 0 skipped" in result.stdout
+        assert "4 passed, 0 failed, 0 skipped" in result.stdout.splitlines()[-1]
+
+    def test_verify_in_parallel_reports_failures(
+        self, data_directory: Path, monkeypatch
+    ):
+        monkeypatch.chdir(data_directory.parent)
+        (data_directory / "2023" / "00_input.txt").write_text("1\n2")
+        result = runner.invoke(app, ["verify", "0", "--year", "2023", "--jobs", "1"])
+        assert result.exit_code == 1
+        assert "FAILED" in result.stdout
+        assert "test_on_real_data_part_2" in result.stdout
+
+
+class TestSubmittingSolution:
+    def test_submit_sends_solution_of_the_given_part(
+        self, data_directory: Path, monkeypatch
+    ):
+        m_submit = mock.Mock()
+        monkeypatch.setattr("aocd.submit", m_submit)
+
+        result = runner.invoke(
+            app,
+            ["submit", "0", "2", "--year", "2023"]
+            + ["--data-directory", str(data_directory)],
+        )
+        if result.exception:
+            raise result.exception
+        m_submit.assert_called_once_with(55, day=0, year=2023, part="b")
+
+
+class TestManagingCache:
+    def test_cache_stats_and_clear(self, data_directory: Path):
+        runner.invoke(
+            app, ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+        )
+
+        result = runner.invoke(app, ["cache", "stats"])
+        assert "results: 2 entries" in result.stdout
+
+        runner.invoke(app, ["cache", "clear"])
+        result = runner.invoke(app, ["cache", "stats"])
+        assert "results: 0 entries" in result.stdout
+
+
+class TestProfilingSolution:
+    def test_profile_saves_stats_of_each_phase(self, data_directory: Path, tmp_path):
+        profile_directory = tmp_path / "profiles"
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--profile", "--profile-directory", str(profile_directory)],
+        )
+        if result.exception:
+            raise result.exception
+        assert "=== Phase part_1 ===" in result.stdout
+        assert "Day 0 - Part 2: 55" in result.stdout
+        for phase in ("input", "part_1", "part_2"):
+            assert (profile_directory / f"2023_day_00_{phase}.pstats").exists()
+            assert (profile_directory / f"2023_day_00_{phase}.collapsed").exists()
+
+    def test_line_profile_shows_annotated_source_of_parts(self, data_directory: Path):
+        result = runner.invoke(
+            app,
+            ["run", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--line-profile", "--verbose"],
+        )
+        if result.exception:
+            raise result.exception
+        assert "=== Part 1 (" in result.stdout
+        assert "Challenge.part_2 (" in result.stdout
+        assert "return sum(map(int, input_lines))" in result.stdout
+        assert "Day 0 - Part 2: 55" in result.stdout
+        assert "Memoized functions:\n  none called" in result.stdout
+
+
+class TestStartup:
+    def test_run_does_not_import_modules_of_other_commands(self, data_directory: Path):
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from aoc.main import app\n"
+            "args = ['run', '0', '--year', '2023', '--data-directory', sys.argv[1]]\n"
+            "result = CliRunner().invoke(app, args)\n"
+            "assert 'Day 0 - Part 2: 55' in result.stdout, result.stdout\n"
+            "modules = {'aocd', 'pytest', 'aoc.batch', 'aoc.fetch', 'aoc.sandbox',\n"
+            "    'concurrent.futures', 'multiprocessing', 'http.client'}\n"
+            "print(sorted(modules & sys.modules.keys()))\n"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", code, str(data_directory)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert process.stdout.splitlines()[-1] == "[]"
+
+    def test_startup_report_shows_slowest_imports(self):
+        result = runner.invoke(app, ["startup-report", "--top", "3"])
+
+        assert "Importing aoc.main took" in result.stdout
+        assert len(result.stdout.splitlines()) == 5
+
+
+class TestFetchingData:
+    def test_fetch_rejects_invalid_days(self, tmp_path: Path):
+        result = runner.invoke(
+            app, ["fetch", "--days", "20-30", "--data-directory", str(tmp_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "Days must be between 1 and 25." in result.stdout
+
+
+class TestScalingSolution:
+    def test_scale_reports_growth_of_each_part(self, data_directory: Path):
+        result = runner.invoke(
+            app,
+            ["scale", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--sizes", "10,20,40", "--runs", "1"],
+        )
+        if result.exception:
+            raise result.exception
+
+        assert "Part 1: time ~ n^" in result.stdout
+        assert "Part 2: time ~ n^" in result.stdout
+
+    def test_scale_without_generate_input_nor_input(self, tmp_path: Path):
+        result = runner.invoke(
+            app,
+            ["scale", "0", "--year", "2023", "--data-directory", str(tmp_path)],
+        )
+
+        assert result.exit_code == 1
+        assert "has no generate_input(size, rng) class method" in result.stdout
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+
+    def test_scale_fails_when_time_grows_too_fast(self, data_directory: Path):
+        result = runner.invoke(
+            app,
+            ["scale", "0", "--year", "2023", "--data-directory", str(data_directory)]
+            + ["--sizes", "10,20,40", "--runs", "1", "--max-slope", "-10"],
+        )
+
+        assert result.exit_code == 1
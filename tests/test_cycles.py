@@ -0,0 +1,68 @@
+import pytest
+
+from aoc.cycles import fast_forward
+from aoc.grid import Grid
+
+
+def step(x: int) -> int:
+    return (x * x + 1) % 1009
+
+
+def brute_force(initial: int, n: int) -> int:
+    for _ in range(n):
+        initial = step(initial)
+    return initial
+
+
+@pytest.mark.parametrize("max_states", [None, 3])
+@pytest.mark.parametrize("n", [0, 1, 5, 30, 31, 100, 12_345])
+def test_fast_forward_agrees_with_iterating(n: int, max_states: int | None):
+    result = fast_forward(2, step, n, max_states=max_states)
+
+    assert result.state == brute_force(2, n)
+
+
+@pytest.mark.parametrize("max_states", [None, 3])
+def test_fast_forward_reports_cycle(max_states: int | None):
+    result = fast_forward(2, step, 10**18, max_states=max_states)
+    assert result.start is not None
+    assert result.length is not None
+
+    assert result.state == brute_force(
+        2, result.start + (10**18 - result.start) % result.length
+    )
+    assert brute_force(2, result.start) == brute_force(2, result.start + result.length)
+    assert brute_force(2, result.start - 1) != brute_force(
+        2, result.start + result.length - 1
+    )
+    assert result.steps < 200
+
+
+def test_fast_forward_without_cycle_before_n():
+    result = fast_forward(0, lambda x: x + 1, 50)
+
+    assert (result.state, result.start, result.length, result.steps) == (
+        50,
+        None,
+        None,
+        50,
+    )
+
+
+def test_fast_forward_grids_by_fingerprint():
+    def spin(grid: Grid) -> Grid:
+        grid = grid.copy()
+        for direction in ("north", "west", "south", "east"):
+            grid.tilt(direction)
+        return grid
+
+    grid = Grid.from_lines(["O....#....", "O.OO#....#", ".....##...", "OO.#O....O"])
+
+    result = fast_forward(grid, spin, 1_000_000_000, fingerprint=Grid.fingerprint)
+    assert result.start is not None
+    assert result.length is not None
+
+    state = grid
+    for _ in range(result.start + (1_000_000_000 - result.start) % result.length):
+        state = spin(state)
+    assert result.state == state
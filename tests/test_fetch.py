@@ -0,0 +1,166 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from aoc import fetch
+from aoc.fetch import HttpPuzzleClient, fetch_days, parse_days
+
+PAGE = "<article><pre><code>1\n2\n&lt;3\n<em>4</em>\n</code></pre></article>"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests: list[tuple[str, str | None]] = []
+    failures: dict[str, int] = {}
+    # responses of each path which are cut short, e.g. by a dropped connection
+    broken: dict[str, list[str]] = {}
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("Cookie")))
+        if self.broken.get(self.path):
+            if self.broken[self.path].pop(0) == "truncated":
+                self.send_response(200)
+                self.send_header("Content-Length", "100")
+                self.end_headers()
+                self.wfile.write(b"input")
+            self.close_connection = True
+            return
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        parts = self.path.strip("/").split("/")
+        if parts[:2] != ["2023", "day"] or int(parts[2]) > 2:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = f"input of day {parts[2]}\n" if parts[-1] == "input" else PAGE
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    StubHandler.requests = []
+    StubHandler.failures = {}
+    StubHandler.broken = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server_url: str) -> HttpPuzzleClient:
+    return HttpPuzzleClient("secret", server_url, rate=0, backoff_delay=0)
+
+
+def test_parse_days():
+    assert parse_days("1-3,7, 5") == [1, 2, 3, 5, 7]
+    with pytest.raises(ValueError):
+        parse_days("0-26")
+    with pytest.raises(ValueError):
+        parse_days("first")
+
+
+def test_fetch_days_downloads_inputs_and_examples(
+    client: HttpPuzzleClient, tmp_path: Path
+):
+    results = fetch_days(client, 2023, [1, 2, 3], tmp_path, jobs=4)
+
+    assert [(r.day, r.kind, r.status) for r in results] == [
+        (1, fetch.EXAMPLE, fetch.DOWNLOADED),
+        (1, fetch.INPUT, fetch.DOWNLOADED),
+        (2, fetch.EXAMPLE, fetch.DOWNLOADED),
+        (2, fetch.INPUT, fetch.DOWNLOADED),
+        (3, fetch.EXAMPLE, fetch.UNAVAILABLE),
+        (3, fetch.INPUT, fetch.UNAVAILABLE),
+    ]
+    assert (tmp_path / "2023" / "02_input.txt").read_text() == "input of day 2\n"
+    assert (tmp_path / "2023" / "01_test_input.txt").read_text() == "1\n2\n<3\n4\n"
+    assert not (tmp_path / "2023" / "03_input.txt").exists()
+    assert all(cookie == "session=secret" for _, cookie in StubHandler.requests)
+    assert not list(tmp_path.glob("2023/*.tmp"))
+
+
+def test_fetch_days_reports_files_which_cannot_be_written(
+    client: HttpPuzzleClient, tmp_path: Path, monkeypatch
+):
+    replace = fetch.os.replace
+
+    def fail_for_day_2(source, destination):
+        if Path(destination).name == "02_input.txt":
+            raise OSError(28, "No space left on device")
+        replace(source, destination)
+
+    monkeypatch.setattr(fetch.os, "replace", fail_for_day_2)
+
+    results = fetch_days(client, 2023, [1, 2], tmp_path, kinds=[fetch.INPUT])
+
+    assert [(r.day, r.status) for r in results] == [
+        (1, fetch.DOWNLOADED),
+        (2, fetch.FAILED),
+    ]
+    assert "No space left on device" in (results[1].error or "")
+    assert not list(tmp_path.glob("2023/*.tmp"))
+
+
+def test_fetch_days_skips_existing_files(client: HttpPuzzleClient, tmp_path: Path):
+    (tmp_path / "2023").mkdir()
+    (tmp_path / "2023" / "01_input.txt").write_text("already there")
+    (tmp_path / "2023" / "01_test_input.txt").touch()
+
+    results = fetch_days(client, 2023, [1], tmp_path)
+
+    assert [result.status for result in results] == [fetch.DOWNLOADED, fetch.SKIPPED]
+    assert (tmp_path / "2023" / "01_input.txt").read_text() == "already there"
+    assert [path for path, _ in StubHandler.requests] == ["/2023/day/1"]
+
+
+def test_client_retries_transient_errors(client: HttpPuzzleClient):
+    StubHandler.failures["/2023/day/1/input"] = 2
+
+    assert client.get_input(2023, 1) == "input of day 1\n"
+    assert len(StubHandler.requests) == 3
+
+
+def test_client_retries_dropped_connections_and_truncated_responses(
+    client: HttpPuzzleClient,
+):
+    StubHandler.broken["/2023/day/1/input"] = ["dropped", "truncated"]
+
+    assert client.get_input(2023, 1) == "input of day 1\n"
+    assert len(StubHandler.requests) == 3
+
+
+def test_client_gives_up_after_retries(server_url: str, tmp_path: Path):
+    StubHandler.failures["/2023/day/1/input"] = 10
+    client = HttpPuzzleClient("secret", server_url, rate=0, retries=1, backoff_delay=0)
+
+    [result] = fetch_days(client, 2023, [1], tmp_path, kinds=[fetch.INPUT])
+
+    assert result.status == fetch.FAILED
+    assert len(StubHandler.requests) == 2
+
+
+def test_rate_limiter_spaces_out_requests(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(fetch.time, "sleep", sleeps.append)
+    limiter = fetch.RateLimiter(rate=10)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert len(sleeps) == 2
+    assert all(0 < sleep <= 0.2 for sleep in sleeps)
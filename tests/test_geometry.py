@@ -0,0 +1,99 @@
+import itertools
+
+import pytest
+
+from aoc import geometry
+from aoc.geometry import (
+    boundary_points,
+    extrapolate,
+    interior_points,
+    lattice_points,
+    lcm_all,
+    manhattan_pair_sum,
+    polygon_area,
+    twice_area,
+    walk,
+)
+
+DIG_PLAN = [
+    ("R", 6),
+    ("D", 5),
+    ("L", 2),
+    ("D", 2),
+    ("R", 2),
+    ("D", 2),
+    ("L", 5),
+    ("U", 2),
+    ("L", 1),
+    ("U", 2),
+    ("R", 2),
+    ("U", 3),
+    ("L", 2),
+    ("U", 2),
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(geometry, "_get_numpy", lambda: None)
+    return request.param
+
+
+def test_lattice_points_of_a_dug_path(backend):
+    vertices = walk(DIG_PLAN)
+
+    assert vertices[0] == vertices[-1] == (0, 0)
+    assert boundary_points(vertices) == 38
+    assert twice_area(vertices) == 84
+    assert polygon_area(vertices) == 42.0
+    assert interior_points(vertices) == 24
+    assert lattice_points(vertices) == 62
+
+
+def test_area_of_huge_polygons_is_exact(backend):
+    size = 10**12
+    vertices = [(0, 0), (size, 0), (size, size), (0, size)]
+
+    assert twice_area(vertices) == 2 * size**2
+    assert lattice_points(vertices) == (size + 1) ** 2
+
+
+def test_manhattan_pair_sum_matches_all_pairs(backend):
+    points = [(4, 0), (9, 1), (0, 2), (1, 5), (8, 7), (12, 7), (9, 10), (0, 11)]
+
+    expected = sum(
+        abs(x1 - x2) + abs(y1 - y2)
+        for (x1, y1), (x2, y2) in itertools.combinations(points, 2)
+    )
+
+    assert manhattan_pair_sum(points) == expected
+    assert manhattan_pair_sum([(1, 2, 3), (4, 6, 8)]) == 12
+    assert manhattan_pair_sum([]) == 0
+
+
+@pytest.mark.parametrize(
+    ("backwards", "expected"), [(False, [18, 28, 68]), (True, [-3, 0, 5])]
+)
+def test_extrapolate_sequences(backend, backwards: bool, expected: list[int]):
+    sequences = [
+        [0, 3, 6, 9, 12, 15],
+        [1, 3, 6, 10, 15, 21],
+        [10, 13, 16, 21, 30, 45],
+    ]
+
+    assert extrapolate(sequences, backwards) == expected
+
+
+def test_extrapolate_sequences_of_different_lengths(backend):
+    assert extrapolate([[1, 2, 3], [1, 4, 9, 16]]) == [4, 25]
+    assert extrapolate([[2**70, 2**70]]) == [2**70]
+    assert extrapolate([[0] * 70]) == [0]
+    assert extrapolate([list(range(70))], backwards=True) == [-1]
+
+
+def test_lcm_all():
+    assert lcm_all([2, 3, 4]) == 12
+    assert lcm_all([20_777, 18_673, 13_939, 17_621, 19_199, 12_361]) > 2**43
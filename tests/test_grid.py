@@ -0,0 +1,101 @@
+import sys
+
+import pytest
+
+from aoc.grid import Grid
+
+LINES = ["#.O", "O.#", "..O"]
+
+
+def test_grid_is_built_from_lines_and_addressed_by_position_or_index():
+    grid = Grid.from_lines(LINES)
+
+    assert (grid.width, grid.height) == (3, 3)
+    assert grid[2, 0] == grid[2] == "O"
+    assert grid.position(grid.index(1, 2)) == (1, 2)
+    assert grid.get(3, 0) is None
+    assert str(grid) == "\n".join(LINES)
+    with pytest.raises(ValueError):
+        Grid.from_lines(["..", "."])
+
+
+def test_neighbours_dont_wrap_around_edges():
+    grid = Grid.filled(3, 3)
+
+    assert sorted(grid.neighbours(grid.index(0, 0))) == [1, 3]
+    assert sorted(grid.neighbours(grid.index(2, 1))) == [2, 4, 8]
+    assert sorted(grid.neighbours(grid.index(2, 1), diagonal=True)) == [1, 2, 4, 7, 8]
+    assert len(list(grid.neighbours(4, diagonal=True))) == 8
+
+
+def test_rows_and_columns_are_views_of_cells():
+    grid = Grid.from_lines(LINES)
+
+    assert bytes(grid.row(1)) == b"O.#"
+    assert bytes(grid.column(0)) == b"#O."
+    grid.column(1)[2] = ord("X")
+    assert grid[1, 2] == "X"
+
+
+def test_finding_cells():
+    grid = Grid.from_lines(LINES)
+
+    assert grid.find_all("O") == [2, 3, 8]
+    assert grid.find("#", 1) == 5
+    assert grid.count(".") == 4
+
+
+def test_bulk_transformations():
+    grid = Grid.from_lines(["ab", "cd", "ef"])
+
+    assert str(grid.transposed()) == "ace\nbdf"
+    assert str(grid.rotated()) == "eca\nfdb"
+    assert str(grid.rotated(clockwise=False)) == "bdf\nace"
+    assert grid.rotated().rotated().rotated().rotated() == grid
+    assert str(grid.flipped_horizontally()) == "ba\ndc\nfe"
+
+
+@pytest.mark.parametrize(
+    ("direction", "expected"),
+    [
+        ("north", ["OO.", ".O#", "..."]),
+        ("south", ["...", ".O#", "OO."]),
+        ("west", ["O..", "O.#", "O.."]),
+        ("east", ["..O", ".O#", "..O"]),
+    ],
+)
+def test_tilting_moves_rolling_cells_until_blocked(direction, expected):
+    grid = Grid.from_lines([".O.", "O.#", ".O."])
+
+    grid.tilt(direction)
+
+    assert grid == Grid.from_lines(expected)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+def test_comparing_grids(backend: str, monkeypatch):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    grid = Grid.from_lines(LINES)
+    other = grid.copy()
+    other[1, 1] = "O"
+    other[0, 2] = "O"
+
+    assert grid != other
+    assert grid.diff(other) == [4, 6]
+    assert grid.diff(grid.copy()) == []
+    assert grid.fingerprint() != other.fingerprint()
+
+
+def test_to_numpy_shares_memory():
+    np = pytest.importorskip("numpy")
+    grid = Grid.from_lines(LINES)
+
+    array = grid.to_numpy()
+    array[0, 1] = ord("X")
+
+    assert array.shape == (3, 3)
+    assert grid[1, 0] == "X"
+    assert np.count_nonzero(array == ord("O")) == 3
@@ -0,0 +1,143 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from aoc.input_providers import (
+    InputCache,
+    SingleFileInputProvider,
+    SmartFileInputProvider,
+)
+from aoc.lines import MappedLines, stream_lines
+
+CONTENTS = [
+    "1\n2\n3\n",
+    "  \n\nfirst line\n\n  \nlast line  \n\n",
+    "single",
+    "zażółć\ngęślą jaźń\n",
+    "",
+    "\n\n",
+]
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_mapped_lines_behave_like_stripped_and_split_text(tmp_path: Path, content: str):
+    path = tmp_path / "input.txt"
+    path.write_text(content)
+    expected = content.strip().split("\n")
+
+    with MappedLines.from_path(path) as lines:
+        assert len(lines) == len(expected)
+        assert list(lines) == expected
+        assert lines == expected
+        assert [lines[i] for i in range(-len(lines), len(lines))] == expected * 2
+        assert lines[1:] == expected[1:]
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_streamed_lines_behave_like_stripped_and_split_text(
+    tmp_path: Path, content: str
+):
+    path = tmp_path / "input.txt"
+    path.write_text(content)
+
+    assert list(stream_lines(path, chunk_size=4)) == content.strip().split("\n")
+
+
+def test_mapped_lines_give_access_to_raw_bytes(tmp_path: Path):
+    path = tmp_path / "input.txt"
+    path.write_text("abc\ndef\n")
+
+    with MappedLines.from_path(path) as lines:
+        assert bytes(lines.raw(-1)) == b"def"
+        with pytest.raises(IndexError):
+            lines.raw(2)
+
+
+class TestProvidingLines:
+    def test_smart_file_provider_maps_file_when_requested(self, tmp_path: Path):
+        tmp_path.joinpath("2023").mkdir()
+        tmp_path.joinpath("2023", "01_input.txt").write_text("1\n2\n")
+        provider = SmartFileInputProvider(2023, 1, data_dir=tmp_path, use_mmap=True)
+
+        lines = provider.provide_lines(part=1)
+
+        assert isinstance(lines, MappedLines)
+        assert lines == ["1", "2"]
+
+    def test_single_file_provider_maps_file_when_requested(self, tmp_path: Path):
+        path = tmp_path / "custom.txt"
+        path.write_text("1\n2\n")
+
+        assert isinstance(
+            SingleFileInputProvider(
+                2023, 1, input_path=path, use_mmap=True
+            ).provide_lines(part=1),
+            MappedLines,
+        )
+        assert SingleFileInputProvider(2023, 1, input_path=path).provide_lines(
+            part=1
+        ) == ["1", "2"]
+
+    def test_file_providers_stream_lines_lazily(self, tmp_path: Path):
+        tmp_path.joinpath("2023").mkdir()
+        tmp_path.joinpath("2023", "01_input.txt").write_text("1\n2\n")
+        provider = SmartFileInputProvider(2023, 1, data_dir=tmp_path)
+
+        lines = provider.stream_lines(part=1)
+
+        assert next(lines) == "1"
+        assert list(lines) == ["2"]
+
+
+class TestInputCache:
+    def test_file_is_read_once_until_it_changes(self, tmp_path: Path):
+        path = tmp_path / "input.txt"
+        path.write_text("1\n2\n")
+        cache = InputCache()
+
+        lines = cache.get_lines(path)
+        lines.append("modified by a part")
+
+        assert cache.get_lines(path) == ["1", "2"]
+        assert cache.get_text(tmp_path / ".." / tmp_path.name / "input.txt") == "1\n2\n"
+        assert (cache.hits, cache.misses) == (2, 1)
+        path.write_text("3\n")
+        os.utime(path, ns=(0, 0))
+        assert cache.get_lines(path) == ["3"]
+        assert cache.misses == 2
+
+    def test_hash_is_computed_without_caching_the_file(self, tmp_path: Path):
+        path = tmp_path / "input.txt"
+        path.write_text("1\n2\n")
+        cache = InputCache()
+
+        first_hash = cache.get_hash(path)
+
+        assert cache.get_hash(path) == first_hash
+        assert (cache.size, cache.misses) == (0, 0)
+        path.write_text("3\n")
+        os.utime(path, ns=(0, 0))
+        assert cache.get_hash(path) != first_hash
+
+    def test_least_recently_used_files_are_evicted(self, tmp_path: Path):
+        paths = [tmp_path / f"{i}.txt" for i in range(3)]
+        for path in paths:
+            path.write_text("x" * 1000)
+        cache = InputCache(max_size=2500)
+
+        for path in [paths[0], paths[1], paths[0], paths[2]]:
+            cache.get_text(path)
+        cache.get_text(paths[0])
+        cache.get_text(paths[1])
+
+        assert cache.misses == 4
+        assert cache.size <= 2500
+
+    def test_smart_file_provider_uses_part_files_created_later(self, tmp_path: Path):
+        tmp_path.joinpath("2023").mkdir()
+        provider = SmartFileInputProvider(2023, 1, data_dir=tmp_path)
+
+        assert provider.get_input_filename(part=2) == "01_input.txt"
+        tmp_path.joinpath("2023", "01_input_part_2.txt").touch()
+        assert provider.get_input_filename(part=2) == "01_input_part_2.txt"
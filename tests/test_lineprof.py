@@ -0,0 +1,63 @@
+import importlib
+import inspect
+
+from aoc.input_providers import TextInputProvider
+from aoc.lineprof import LineProfiler, get_module_codes, profile_lines
+
+challenges = importlib.import_module("challenges.2023.day_01")
+
+
+def helper(n: int) -> int:
+    return n * 2
+
+
+def loop(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += helper(i)
+    return total
+
+
+def get_line(func, text: str) -> int:
+    source, first_line = inspect.getsourcelines(func)
+    return first_line + next(i for i, line in enumerate(source) if text in line)
+
+
+def test_line_profiler_counts_lines_of_given_code_only():
+    with LineProfiler({loop.__code__}) as profiler:
+        loop(10)
+
+    lines = profiler.timings[loop.__code__]
+    assert lines[get_line(loop, "total += helper(i)")].hits == 10
+    assert lines[get_line(loop, "return total")].hits == 1
+    assert helper.__code__ not in profiler.timings
+    assert all(timing.nanoseconds >= 0 for timing in lines.values())
+
+
+def test_module_codes_include_methods_and_decorated_functions():
+    codes = get_module_codes(challenges)
+    names = {code.co_qualname for code in codes}
+
+    assert {"TimedChallenge.part_1", "count_down", "double"} <= names
+    assert all(code.co_filename == challenges.__file__ for code in codes)
+
+
+def test_profile_lines_annotates_source_of_parts():
+    challenge = challenges.TimedChallenge(TextInputProvider(2023, 1, "1\n2\n3"))
+
+    profiles = profile_lines(challenge)
+
+    assert [(profile.part, profile.solution) for profile in profiles] == [
+        (1, 6),
+        (2, 3),
+    ]
+    listing = profiles[0].format()
+    assert "TimedChallenge.part_1 (" in listing
+    assert "count_down (" in listing
+    assert "TimedChallenge.part_2" not in listing
+    count_down_line = next(
+        line for line in listing.splitlines() if "1 + count_down(n - 1)" in line
+    )
+    # recursive calls count hits, their time is a part of the outermost call
+    assert count_down_line.split()[1] == "9"
+    assert float(count_down_line.split()[4].rstrip("%")) <= 100
@@ -0,0 +1,153 @@
+import importlib
+import sys
+
+import pytest
+
+from aoc import memo
+from aoc.bench import get_input_factory
+from aoc.input_providers import TextInputProvider
+from aoc.memo import dp, memoize
+
+challenges = importlib.import_module("challenges.2023.day_01")
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    memo.reset_stats()
+
+
+def test_memoize_caches_results_and_counts_hits():
+    calls = []
+
+    @memoize
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert [square(3), square(3), square(4), square(x=4)] == [9, 9, 16, 16]
+
+    assert calls == [3, 4, 4]
+    assert (square.stats.hits, square.stats.misses) == (1, 3)
+    assert square.stats.hit_rate == 0.25
+    assert square.stats in memo.get_stats()
+
+
+@pytest.mark.parametrize(("policy", "cached"), [("lru", [1, 3]), ("fifo", [2, 3])])
+def test_memoize_evicts_beyond_max_size(policy: str, cached: list[int]):
+    calls = []
+
+    @memoize(max_size=2, policy=policy)
+    def identity(x: int) -> int:
+        calls.append(x)
+        return x
+
+    for x in (1, 2, 1, 3):
+        identity(x)
+    calls.clear()
+    for x in cached:
+        identity(x)
+
+    assert calls == []
+    assert identity.cache_size() == 2
+    assert (identity.stats.evictions, identity.stats.peak_size) == (1, 2)
+
+
+def test_memoize_packs_int_keys():
+    @memoize(pack=True)
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert add(2**70, 1) == 2**70 + 1
+    assert add("a", "b") == "ab"
+    assert add(1, 2) == 3
+    assert add.stats.hits == 1
+    assert isinstance(next(iter(add._cache)), bytes)
+
+
+def test_memoize_caches_methods_per_instance():
+    class Counter:
+        def __init__(self, step: int):
+            self.step = step
+
+        @memoize
+        def times(self, n: int) -> int:
+            return self.step * n
+
+    assert (Counter(2).times(3), Counter(5).times(3)) == (6, 15)
+
+
+def test_memoize_rejects_invalid_options():
+    with pytest.raises(ValueError, match="Unknown policy"):
+        memoize(policy="random")(abs)
+    with pytest.raises(ValueError, match="max_size"):
+        memoize(max_size=0)(abs)
+
+
+def test_dp_evaluates_deep_recursion_without_the_call_stack():
+    @dp
+    def steps(n: int):
+        if n == 0:
+            return 0
+        return (yield (n - 1,)) + 1
+
+    depth = sys.getrecursionlimit() * 10
+
+    assert steps(depth) == depth
+    assert steps.stats.misses == depth + 1
+
+
+def test_dp_reuses_shared_subproblems():
+    @dp(pack=True)
+    def paths(x: int, y: int):
+        if x == 0 or y == 0:
+            return 1
+        return (yield (x - 1, y)) + (yield (x, y - 1))
+
+    assert paths(16, 16) == 601080390
+    assert paths.stats.misses == 17 * 17 - 1
+
+
+def test_dp_reports_cyclic_definitions():
+    @dp
+    def loop(n: int):
+        return (yield ((n + 1) % 3,))
+
+    with pytest.raises(ValueError, match=r"loop\(0,\) depends on itself"):
+        loop(0)
+
+
+def test_dp_needs_a_generator_yielding_tuples():
+    with pytest.raises(TypeError, match="generator function"):
+        dp(abs)
+
+    @dp
+    def bad(n: int):
+        return (yield n - 1)
+
+    with pytest.raises(TypeError, match="must yield tuples"):
+        bad(1)
+
+
+def test_caches_are_cleared_between_parts_when_requested():
+    challenge = challenges.MemoizingChallenge(TextInputProvider(2023, 1, "5"))
+
+    assert challenge.solve() == (25, 1)
+
+
+def test_input_factory_clears_memoized_results_of_earlier_runs():
+    challenge = challenges.MemoizingChallenge(TextInputProvider(2023, 1, "5"))
+    make_input = get_input_factory(challenge, 1)
+    challenge.part_1(make_input())
+
+    challenge.part_1(make_input())
+
+    assert challenges.triple.stats.hits == 0
+
+
+def test_stats_format():
+    stats = memo.MemoStats("f", hits=3, misses=1, peak_size=1, max_size=10)
+
+    assert stats.format() == (
+        "3 hits, 1 misses (75.0% hit rate), peak size 1 of 10, 0 evictions"
+    )
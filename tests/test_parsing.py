@@ -0,0 +1,63 @@
+from array import array
+
+import pytest
+
+from aoc.parsing import (
+    column_blocks,
+    fixed_width,
+    int_matrix,
+    ints,
+    ints_by_line,
+    sections,
+)
+
+
+def test_ints_extracts_all_numbers():
+    assert ints("Game 12: x=-3, y=45\n7-9") == array("q", [12, -3, 45, 7, -9])
+    assert ints("7-9, -1", signed=False) == array("q", [7, 9, 1])
+    assert ints("no numbers") == array("q")
+
+
+def test_ints_by_line():
+    assert ints_by_line("1 2\n\n-3") == [
+        array("q", [1, 2]),
+        array("q"),
+        array("q", [-3]),
+    ]
+
+
+def test_ints_as_numpy():
+    np = pytest.importorskip("numpy")
+
+    assert ints("1, -2, 3", as_numpy=True).tolist() == [1, -2, 3]
+    for signed in (True, False):
+        text = "-7 a-5 3-9 --3 - 12-\n-0 x1234567890123"
+        assert ints(text, signed, as_numpy=True).tolist() == ints(text, signed).tolist()
+    assert ints("", as_numpy=True).dtype == np.int64
+    assert int_matrix("1 2 3\n4 5 6\n").tolist() == [[1, 2, 3], [4, 5, 6]]
+    with pytest.raises(ValueError):
+        int_matrix("1 2\n3")
+
+
+def test_sections_are_separated_by_blank_lines():
+    assert sections("\na\nb\n\nc\n  \nd\n") == ["a\nb", "c", "d"]
+
+
+def test_fixed_width_cells():
+    text = "    [D]\n[N] [C]\n[Z] [M] [P]"
+
+    assert fixed_width(text, 3, 4) == [
+        ["   ", "[D]", ""],
+        ["[N]", "[C]", ""],
+        ["[Z]", "[M]", "[P]"],
+    ]
+
+
+def test_column_blocks_are_separated_by_blank_columns():
+    text = "123 328  51\n 45 64  387\n  6 98  215\n*   +   *  "
+
+    assert column_blocks(text) == [
+        ["123", " 45", "  6", "*  "],
+        ["328", "64 ", "98 ", "+  "],
+        [" 51", "387", "215", "*  "],
+    ]
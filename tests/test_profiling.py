@@ -0,0 +1,27 @@
+import cProfile
+import pstats
+
+from aoc.profiling import get_collapsed_stacks
+
+
+def inner():
+    return sum(i * i for i in range(20_000))
+
+
+def outer():
+    return [inner() for _ in range(5)]
+
+
+def test_collapsed_stacks_follow_call_graph():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    outer()
+    profiler.disable()
+
+    stacks = get_collapsed_stacks(pstats.Stats(profiler), "root")
+
+    assert any(
+        stack.startswith("root;outer (") and ";inner (" in stack for stack in stacks
+    )
+    assert not any("disable" in stack for stack in stacks)
+    assert all(time > 0 for time in stacks.values())
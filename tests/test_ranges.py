@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from aoc.ranges import IntervalSet, RangeMap
+
+
+def to_set(intervals: IntervalSet) -> set[int]:
+    return {value for start, stop in intervals for value in range(start, stop)}
+
+
+def random_intervals(rng: random.Random, count: int) -> IntervalSet:
+    intervals = []
+    for _ in range(count):
+        start = rng.randrange(-20, 60)
+        intervals.append((start, start + rng.randrange(0, 15)))
+    return IntervalSet(intervals)
+
+
+def test_intervals_are_normalized():
+    intervals = IntervalSet([(5, 8), range(0, 3), (3, 4), (7, 10), (12, 12)])
+
+    assert intervals.intervals == [(0, 4), (5, 10)]
+    assert intervals.size == 9
+    assert 9 in intervals and 4 not in intervals and -1 not in intervals
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_set_operations_agree_with_sets_of_values(seed: int):
+    rng = random.Random(seed)
+    a, b = random_intervals(rng, 5), random_intervals(rng, 5)
+
+    assert to_set(a | b) == to_set(a) | to_set(b)
+    assert to_set(a & b) == to_set(a) & to_set(b)
+    assert to_set(a - b) == to_set(a) - to_set(b)
+    assert (a - b) == IntervalSet((a - b).intervals)  # results are normalized
+
+
+def random_map(rng: random.Random) -> RangeMap:
+    pieces, start = [], -20
+    for _ in range(4):
+        start += rng.randrange(0, 10)
+        stop = start + rng.randrange(1, 15)
+        pieces.append((start, stop, rng.randrange(-30, 30)))
+        start = stop
+    return RangeMap(pieces)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_range_maps_agree_with_mapping_values(seed: int):
+    rng = random.Random(seed)
+    first, second = random_map(rng), random_map(rng)
+    values = random_intervals(rng, 4)
+
+    assert to_set(first.apply(values)) == {first(value) for value in to_set(values)}
+    composed = first.compose(second)
+    assert all(composed(v) == second(first(v)) for v in range(-60, 120))
+
+
+def test_seed_maps_with_billions_wide_ranges():
+    seeds = IntervalSet([(79, 79 + 14), (55, 55 + 13)])
+    seed_to_soil = RangeMap.from_triples([(50, 98, 2), (52, 50, 48)])
+    soil_to_fertilizer = RangeMap.from_triples([(0, 15, 37), (37, 52, 2), (39, 0, 15)])
+
+    assert seed_to_soil(79) == 81 and seed_to_soil(14) == 14
+    fertilizer = seed_to_soil.compose(soil_to_fertilizer).apply(seeds)
+    assert fertilizer == soil_to_fertilizer.apply(seed_to_soil.apply(seeds))
+    assert fertilizer.intervals == [(57, 70), (81, 95)]
+
+    huge = IntervalSet([(0, 10**12)])
+    shifted = RangeMap([(10**9, 10**11, 5)]).apply(huge)
+    assert shifted.intervals == [(0, 10**9), (10**9 + 5, 10**12)]
+    assert RangeMap([(0, 10**12, -(10**12))]).apply(huge).intervals == [(-(10**12), 0)]
+
+
+def test_overlapping_ranges_are_rejected():
+    with pytest.raises(ValueError):
+        RangeMap([(0, 10, 1), (5, 15, 2)])
@@ -0,0 +1,99 @@
+import importlib
+from pathlib import Path
+
+from aoc import sandbox
+from aoc.input_providers import SingleFileInputProvider
+
+challenges = importlib.import_module("challenges.2023.day_01")
+
+
+def test_isolated_part_reports_solution_and_peak_memory(
+    input_provider: SingleFileInputProvider,
+):
+    challenge = challenges.HungryChallenge(input_provider)
+
+    outcome = sandbox.run_part_isolated(
+        challenge, 1, memory_limit=256 * 1024**2, trace_memory=True
+    )
+
+    assert outcome.ok
+    assert outcome.solution == 1024**2
+    assert outcome.peak_traced is not None
+    assert outcome.peak_traced >= 1024**2
+    assert outcome.peak_rss >= outcome.peak_traced
+
+
+def test_isolated_part_measures_memory_without_loading_and_parsing_input(
+    tmp_path: Path,
+):
+    path = tmp_path / "input.txt"
+    path.write_text("7\n" * 100_000)
+    challenge = challenges.ParsingChallenge(
+        SingleFileInputProvider(2023, 1, input_path=path)
+    )
+
+    outcome = sandbox.run_part_isolated(challenge, 2, trace_memory=True)
+
+    assert outcome.solution == 7
+    assert outcome.peak_traced is not None
+    assert outcome.peak_traced < 64 * 1024
+    assert outcome.part_time < outcome.wall_time
+
+
+def test_isolated_part_is_traced_outside_its_time_limits(
+    input_provider: SingleFileInputProvider,
+):
+    challenge = challenges.SleepingChallenge(input_provider)
+
+    outcome = sandbox.run_part_isolated(challenge, 1, timeout=0.5, trace_memory=True)
+    assert outcome.ok
+    assert outcome.peak_traced is not None
+
+    outcome = sandbox.run_part_isolated(challenge, 1, timeout=0.5)
+    assert outcome.ok
+    assert outcome.peak_traced is None
+    assert "peak traced" not in outcome.format_usage()
+
+
+def test_isolated_part_is_aborted_when_exceeding_memory_limit(
+    input_provider: SingleFileInputProvider,
+):
+    challenge = challenges.HungryChallenge(input_provider)
+
+    outcome = sandbox.run_part_isolated(challenge, 2, memory_limit=256 * 1024**2)
+
+    assert outcome.status == sandbox.MEMORY_EXCEEDED
+    assert outcome.error == "Part 2 exceeded the memory limit of 256.0 MiB"
+
+
+def test_isolated_part_reports_errors(tmp_path: Path):
+    provider = SingleFileInputProvider(2023, 1, input_path=tmp_path / "missing.txt")
+
+    outcome = sandbox.run_part_isolated(challenges.HungryChallenge(provider), 1)
+
+    assert outcome.status == sandbox.ERROR
+    assert "FileNotFoundError" in (outcome.error or "")
+
+
+def test_isolated_part_is_stopped_after_timeout_with_its_stack(
+    input_provider: SingleFileInputProvider,
+):
+    challenge = challenges.LoopingChallenge(input_provider)
+
+    outcome = sandbox.run_part_isolated(challenge, 1, timeout=0.2)
+
+    assert outcome.status == sandbox.TIMEOUT
+    assert outcome.error == "Part 1 exceeded the timeout of 200.00 ms"
+    assert "in wait_forever" in (outcome.stack or "")
+
+
+def test_isolated_part_is_stopped_after_cpu_time_limit(
+    input_provider: SingleFileInputProvider,
+):
+    challenge = challenges.LoopingChallenge(input_provider)
+
+    outcome = sandbox.run_part_isolated(challenge, 2, cpu_limit=0.1, timeout=10)
+
+    assert outcome.status == sandbox.TIMEOUT
+    assert outcome.error == "Part 2 exceeded the CPU time limit of 100.00 ms"
+    assert "in part_2" in (outcome.stack or "")
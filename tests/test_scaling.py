@@ -0,0 +1,62 @@
+import importlib
+import random
+
+import pytest
+
+from aoc.base import BaseChallenge
+from aoc.scaling import (
+    fit_slope,
+    get_slopes,
+    random_grid,
+    repeat_lines,
+    scale_challenge,
+    tile_grid,
+)
+
+challenges = importlib.import_module("challenges.2023.day_01")
+
+
+def test_fit_slope_returns_exponent_of_power_law():
+    sizes = [10, 100, 1000]
+
+    assert fit_slope(sizes, [size**2 for size in sizes]) == pytest.approx(2)
+    assert fit_slope(sizes, [5 * size for size in sizes]) == pytest.approx(1)
+    assert fit_slope([10], [1]) is None
+
+
+def test_default_generators():
+    rng = random.Random(0)
+
+    assert repeat_lines("a\nb\n", 5, rng) == "a\nb\na\nb\na"
+    assert tile_grid("#.\n..\n", 3, rng) == "#.#\n...\n#.#"
+    grid = random_grid("#...\n", 4, rng).splitlines()
+    assert len(grid) == 4
+    assert all(len(row) == 4 and set(row) <= {"#", "."} for row in grid)
+
+
+def test_scale_challenge_uses_generated_inputs_and_stops_failing_parts():
+    points = scale_challenge(
+        challenges.GeneratingChallenge,
+        challenges.GeneratingChallenge.generate_input,
+        sizes=[5, 10, 20, 40],
+        runs=1,
+    )
+
+    assert [(p.size, p.part) for p in points if p.error is None] == [
+        (5, 1),
+        (5, 2),
+        (10, 1),
+        (10, 2),
+        (20, 1),
+        (40, 1),
+    ]
+    [failure] = [p for p in points if p.error]
+    assert (failure.size, failure.part, failure.error) == (20, 2, "ValueError: too big")
+    assert all(p.peak_memory is not None for p in points if p.error is None)
+    assert get_slopes(points, 1)[0] is not None
+
+
+def test_challenges_define_generate_input_optionally():
+    assert challenges.GeneratingChallenge.defines_generate_input()
+    assert not challenges.ParsingChallenge.defines_generate_input()
+    assert not hasattr(BaseChallenge, "generate_input")
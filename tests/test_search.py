@@ -0,0 +1,85 @@
+import pytest
+
+from aoc.grid import Grid
+from aoc.search import StatePacker, astar, bfs, bfs_01, dijkstra
+
+MAZE = Grid.from_lines(
+    [
+        "S..#....",
+        ".#.#.##.",
+        ".#...#..",
+        ".####.#.",
+        "......#E",
+    ]
+)
+
+
+def open_neighbours(index: int):
+    return (n for n in MAZE.neighbours(index) if MAZE.cells[n] != ord("#"))
+
+
+@pytest.mark.parametrize("size", [None, len(MAZE)])
+def test_bfs_finds_shortest_path(size):
+    start, end = MAZE.find("S"), MAZE.find("E")
+
+    result = bfs([start], open_neighbours, lambda s: s == end, size, track_paths=True)
+
+    assert result.goal == end
+    assert result.distance == 15
+    path = result.path()
+    assert (path[0], path[-1], len(path)) == (start, end, 16)
+    assert all(b in MAZE.neighbours(a) for a, b in zip(path, path[1:], strict=False))
+    assert result.stats.expanded <= len(MAZE)
+
+
+def test_bfs_without_goal_visits_all_reachable_states():
+    result = bfs([MAZE.find("S")], open_neighbours)
+
+    assert result.goal is None and result.distance is None
+    assert result.distance_to(MAZE.find("E")) == 15
+    assert result.distance_to(MAZE.index(3, 0)) is None
+    with pytest.raises(ValueError):
+        result.path()
+
+
+def test_weighted_searches_agree():
+    graph = {"a": [("b", 1), ("c", 0)], "b": [("d", 1)], "c": [("b", 0), ("d", 1)]}
+
+    results = [
+        search(["a"], lambda s: graph.get(s, []), lambda s: s == "d", track_paths=True)
+        for search in (bfs_01, dijkstra)
+    ]
+
+    assert [result.distance for result in results] == [1, 1]
+    assert [result.path() for result in results] == [["a", "c", "d"]] * 2
+
+
+def test_astar_expands_fewer_states_than_dijkstra():
+    grid = Grid.filled(50, 50)
+    end = grid.index(49, 49)
+
+    def neighbours(index: int):
+        return ((n, 1) for n in grid.neighbours(index))
+
+    def distance_to_end(index: int) -> int:
+        x, y = grid.position(index)
+        return 49 - x + 49 - y
+
+    plain = dijkstra([0], neighbours, lambda s: s == end, size=len(grid))
+    guided = astar([0], neighbours, lambda s: s == end, distance_to_end, len(grid))
+
+    assert plain.distance == guided.distance == 98
+    assert guided.stats.expanded < plain.stats.expanded / 10
+
+
+def test_state_packer_round_trips():
+    packer = StatePacker(10, 20, 4)
+
+    states = {
+        packer.pack(x, y, d) for x in range(10) for y in range(20) for d in range(4)
+    }
+
+    assert states == set(range(packer.size))
+    assert packer.unpack(packer.pack(7, 13, 2)) == (7, 13, 2)
+    with pytest.raises(ValueError):
+        packer.pack(10, 0, 0)
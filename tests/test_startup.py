@@ -0,0 +1,27 @@
+from aoc.startup import ImportTiming, measure_imports, parse_import_times
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | site
+import time:        50 |         50 |     aoc.formatting
+import time:       200 |        250 |   aoc.base
+import time:      1000 |       1250 | aoc.main
+"""
+
+
+def test_parse_import_times():
+    assert parse_import_times(OUTPUT) == [
+        ImportTiming("_io", 120e-6, 120e-6, 1),
+        ImportTiming("site", 300e-6, 420e-6, 0),
+        ImportTiming("aoc.formatting", 50e-6, 50e-6, 2),
+        ImportTiming("aoc.base", 200e-6, 250e-6, 1),
+        ImportTiming("aoc.main", 1000e-6, 1250e-6, 0),
+    ]
+
+
+def test_measure_imports_skips_interpreter_startup():
+    timings = measure_imports("aoc.formatting")
+
+    assert timings[-1].module == "aoc.formatting"
+    assert "site" not in {timing.module for timing in timings}
@@ -0,0 +1,56 @@
+import importlib
+import json
+import logging
+
+import pytest
+
+from aoc.input_providers import SingleFileInputProvider
+from aoc.timing import Timings, span
+
+challenges = importlib.import_module("challenges.2023.day_01")
+
+
+def test_phases_and_custom_spans_of_challenge_are_timed(
+    input_provider: SingleFileInputProvider,
+):
+    challenge = challenges.TimedChallenge(input_provider)
+
+    assert challenge.solve() == (6, 3)
+
+    spans = challenge.timings.spans
+    assert list(spans) == [
+        "input",
+        "input/resolve",
+        "input/read",
+        "input/split",
+        "part_1",
+        "part_1/convert",
+        "part_1/count_down",
+        "part_2",
+    ]
+    # recursive calls are counted only once per outermost call
+    assert spans["part_1/count_down"].calls == 3
+    assert spans["input"].seconds >= spans["input/read"].seconds > 0
+
+
+def test_span_does_nothing_outside_of_timings():
+    with span("outside"):
+        pass
+
+    timings = Timings()
+    with timings.span("outer"), span("inner"):
+        pass
+    assert list(timings.spans) == ["outer", "outer/inner"]
+
+
+def test_timings_are_logged_as_json_lines(
+    input_provider: SingleFileInputProvider, caplog: pytest.LogCaptureFixture
+):
+    challenge = challenges.TimedChallenge(input_provider)
+
+    with caplog.at_level(logging.INFO, logger="aoc.logger.timings"):
+        challenge.run()
+
+    records = [json.loads(record.message) for record in caplog.records]
+    assert {record["span"] for record in records} >= {"input", "part_1", "part_2"}
+    assert all(record["year"] == 2023 and record["day"] == 1 for record in records)
@@ -0,0 +1,162 @@
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from aoc.input_providers import SingleFileInputProvider, SmartFileInputProvider
+from aoc.watch import Watcher
+
+CHALLENGE = """\
+from aoc.base import BaseChallenge
+
+from .helpers import total
+
+
+class Challenge(BaseChallenge):
+    def part_1(self, input_lines):
+        return total(input_lines)
+
+    def part_2(self, input_lines):
+        return len(input_lines)
+"""
+HELPERS = """\
+def total(lines):
+    return sum(map(int, lines))
+"""
+
+
+def write(path: Path, text: str):
+    """Write the file making sure its modification time changes."""
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+@pytest.fixture
+def day_directory(tmp_path: Path, monkeypatch) -> Iterator[Path]:
+    directory = tmp_path / "watched" / "2023" / "day_05"
+    directory.mkdir(parents=True)
+    write(directory / "__init__.py", CHALLENGE)
+    write(directory / "helpers.py", HELPERS)
+    write(tmp_path / "input.txt", "1\n2\n3\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield directory
+    for name in [name for name in sys.modules if name.startswith("watched")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def watcher(day_directory: Path) -> Watcher:
+    input_path = day_directory.parent.parent.parent / "input.txt"
+    input_provider = SingleFileInputProvider(year=2023, day=5, input_path=input_path)
+    return Watcher("watched.2023.day_05", input_provider, poll_interval=0)
+
+
+def solve(watcher: Watcher) -> list[tuple[int, bool]]:
+    return [(result.solution, result.solved) for result in watcher.solve()]
+
+
+def test_watcher_reuses_solutions_when_nothing_changed(watcher: Watcher):
+    assert solve(watcher) == [(6, True), (3, True)]
+
+    assert not watcher.poll()
+    assert solve(watcher) == [(6, False), (3, False)]
+
+
+def test_watcher_solves_again_only_the_changed_part(
+    watcher: Watcher, day_directory: Path, capsys
+):
+    solve(watcher)
+    write(
+        day_directory / "__init__.py",
+        CHALLENGE.replace("len(input_lines)", "max(map(int, input_lines))"),
+    )
+
+    assert watcher.wait_for_changes() == {day_directory / "__init__.py"}
+    assert solve(watcher) == [(6, False), (3, True)]
+    # the input is read only once and kept in memory
+    assert capsys.readouterr().out.count("Using data from") == 1
+
+
+def test_watcher_solves_again_parts_using_the_changed_part(
+    watcher: Watcher, day_directory: Path
+):
+    delegating = CHALLENGE.replace(
+        "return len(input_lines)", "return self.part_1(input_lines) * 2"
+    )
+    write(day_directory / "__init__.py", delegating)
+    watcher.wait_for_changes()
+    assert solve(watcher) == [(6, True), (12, True)]
+
+    write(
+        day_directory / "__init__.py",
+        delegating.replace(
+            "return total(input_lines)", "return total(input_lines) + 1"
+        ),
+    )
+
+    watcher.wait_for_changes()
+    assert solve(watcher) == [(7, True), (14, True)]
+
+
+def test_parts_modifying_their_input_do_not_change_input_of_others(
+    watcher: Watcher, day_directory: Path
+):
+    modifying = CHALLENGE.replace(
+        "return total(input_lines)",
+        "input_lines.sort(reverse=True)\n        return int(input_lines.pop())",
+    )
+    write(day_directory / "__init__.py", modifying)
+    watcher.wait_for_changes()
+    assert solve(watcher) == [(1, True), (3, True)]
+
+    write(day_directory / "__init__.py", modifying + "\n\nX = 1\n")
+    watcher.wait_for_changes()
+
+    assert solve(watcher) == [(1, True), (3, True)]
+
+
+def test_watcher_ignores_changes_of_comments(watcher: Watcher, day_directory: Path):
+    solve(watcher)
+    write(day_directory / "__init__.py", "# a comment\n" + CHALLENGE)
+
+    watcher.wait_for_changes()
+
+    assert solve(watcher) == [(6, False), (3, False)]
+
+
+def test_watcher_reloads_changed_imported_modules(
+    watcher: Watcher, day_directory: Path
+):
+    solve(watcher)
+    write(day_directory / "helpers.py", HELPERS.replace("sum", "max"))
+
+    watcher.wait_for_changes()
+
+    assert solve(watcher) == [(3, True), (3, True)]
+
+
+def test_watcher_reads_changed_input(watcher: Watcher, day_directory: Path):
+    solve(watcher)
+    write(day_directory.parent.parent.parent / "input.txt", "10\n20\n")
+
+    watcher.wait_for_changes()
+
+    assert solve(watcher) == [(30, True), (2, True)]
+
+
+def test_watcher_uses_input_of_a_part_created_later(day_directory: Path):
+    data_directory = day_directory.parent.parent.parent / "data"
+    data_directory.joinpath("2023").mkdir(parents=True)
+    write(data_directory / "2023" / "05_input.txt", "1\n2\n3\n")
+    input_provider = SmartFileInputProvider(2023, 5, data_dir=data_directory)
+    watcher = Watcher("watched.2023.day_05", input_provider, poll_interval=0)
+    solve(watcher)
+    write(data_directory / "2023" / "05_input_part_2.txt", "1\n2\n3\n4\n")
+
+    assert watcher.wait_for_changes() == {
+        data_directory / "2023" / "05_input_part_2.txt"
+    }
+    assert solve(watcher) == [(6, False), (4, True)]